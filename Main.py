@@ -1,4 +1,10 @@
+import os
+import sys
 import time
+import argparse
+import queue
+import threading
+from collections import Counter
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -6,18 +12,231 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, InvalidSessionIdException, WebDriverException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoAlertPresentException,
+    InvalidSessionIdException,
+    WebDriverException,
+    TimeoutException
+)
 import configparser
+from urllib.parse import urlsplit
+from job_store import JobStore, job_key, behind_watermark
+from persistence import load_json, atomic_write_json
+from tracing import Tracer, Timing, traced, WAIT
+from selector_cache import SelectorCache, RACE_SELECTORS_SCRIPT
+from http_discovery import HttpDiscovery
+from listing_extraction import JOB_LISTING_SELECTORS, RESULT_COUNT_LOCATORS, extract_job_cards, listing_page_url, result_count
+from search_strategy import SearchStrategyCache, SEARCH_URL_TEMPLATES, MANUAL, query_shape
+from search_filters import SearchFilters, DATE, EXPERIENCE, SALARY, JOB_AGE_DAYS, JOB_AGE_LABELS
+from cdp_engine import AsyncEngine
+from lean_profile import blocked_url_patterns, apply_blocking, TrafficMeter
+from scoring import JobScorer, parse_posted_days
+from daemon import ApplyDaemon
+from supervisor import ProfileSupervisor
+from memory_supervisor import MemorySupervisor, MB
+from checkpoint import Checkpoint, query_key
+from retry import RetryPolicy, RateLimitedError, BLOCKED_PAGE_MARKERS, PAGE_TEXT_SCRIPT
+from browser_pool import BrowserPool, resolve_driver, forget_driver
+from replay import ReplayDriver, Recording, record_driver
+from page_cache import DetailPageCache, card_hash
+from details_page import (
+    classify_details,
+    APPLY,
+    ALREADY_APPLIED,
+    QUESTIONNAIRE,
+    NO_APPLY,
+    NOT_ACTIONABLE,
+    SKIP_REASONS
+)
+
+class SearchScheduler:
+    """Hands keyword x location pairs out to search workers and enforces the global application cap"""
+
+    def __init__(self, queries, max_applications, collect=False):
+        self.pending = queue.Queue()
+        for query in queries:
+            self.pending.put(query)
+        self.query_count = len(queries)
+        self.max_applications = max_applications
+        self.applied_count = 0
+        self.results = []
+        # In collect mode listings are gathered from every search and applied to after ranking
+        self.collect = collect
+        self.candidates = []
+        # Watermarks of completed collect walks, applied once their listings are settled
+        self.watermarks = {}
+        self.lock = threading.Lock()
+
+    def budget_exhausted(self):
+        """Check whether the application cap has been reached"""
+        with self.lock:
+            return self.applied_count >= self.max_applications
+
+    def next_query(self):
+        """Return the next (keyword, location) pair, or None when the work or budget is used up"""
+        if self.budget_exhausted():
+            return None
+        try:
+            return self.pending.get_nowait()
+        except queue.Empty:
+            return None
+
+    def reserve_application(self):
+        """Claim one application slot before clicking Apply"""
+        with self.lock:
+            if self.applied_count >= self.max_applications:
+                return False
+            self.applied_count += 1
+            return True
+
+    def release_application(self):
+        """Give back a slot whose application did not go through"""
+        with self.lock:
+            self.applied_count -= 1
+
+    def record_application(self, result):
+        """Merge one worker's application result into the shared list"""
+        with self.lock:
+            self.results.append(result)
+
+    def add_candidate(self, key, card, keyword, location):
+        """Keep a listing found by any worker for the ranking stage"""
+        with self.lock:
+            self.candidates.append((key, card, keyword, location))
+
+    def add_watermark(self, query, newest_posted_at):
+        """Hold a collect walk's watermark until its listings have been applied to or ruled out"""
+        if newest_posted_at is None:
+            return
+        with self.lock:
+            self.watermarks[query] = max(newest_posted_at, self.watermarks.get(query, 0))
+
 
 class NaukriAutoApply:
-    def __init__(self):
+    def __init__(self, config_file='config.ini', job_store=None, selector_cache=None, worker_id=0, tracer=None,
+                 search_strategies=None, page_cache=None):
         # Initialize configuration
+        self.config_file = config_file
         self.config = configparser.ConfigParser()
-        self.config.read('config.ini')
+        self.config.read(config_file)
         
         self.driver = None
         self.wait = None
+        self.tracer = tracer or Tracer.from_config(self.config)
+        self.retry = RetryPolicy.from_config(self.config, self.tracer)
+        # Jobs skipped without applying, by details_page apply type
+        self.skip_reasons = Counter()
+
+        # Site root; point this at a local fixture server for offline runs and benchmarks
+        self.base_url = self.config['DEFAULT'].get('base_url', 'https://www.naukri.com').strip().rstrip('/')
+        self.site_host = urlsplit(self.base_url).netloc.replace('www.', '')
+
+        # Execution settings
+        self.workers = self.config.getint('EXECUTION', 'workers', fallback=1)
+        self.max_applications = self.config.getint('EXECUTION', 'max_applications', fallback=5)
+        self.max_pages = self.config.getint('EXECUTION', 'max_pages', fallback=3)
+        # Stop paginating a query once a page only holds postings from earlier runs
+        self.incremental = self.config.getboolean('EXECUTION', 'incremental', fallback=False)
+        self.worker_id = worker_id
+        self.scheduler = None
+        # Extra search browsers; kept open between searches in daemon mode
+        self.worker_pool = []
+        self.keep_workers = False
+
+        # Position in the keyword x location x page grid, saved after every job so a crashed run can resume
+        self.resume_enabled = self.config.getboolean('EXECUTION', 'resume', fallback=True)
+        self.checkpoint_file = self.config.get('STORAGE', 'checkpoint_file', fallback='checkpoint.json')
+        self.checkpoint = None
+
+        # 'browser' renders search results in Chrome, 'http' fetches and parses them without rendering
+        self.discovery_mode = self.config.get('EXECUTION', 'discovery', fallback='browser').strip().lower()
+        self.http_pool_size = self.config.getint('EXECUTION', 'http_pool_size', fallback=4)
+        self.http_discovery = None
+
+        # 'sync' drives everything through WebDriver, 'async' also runs background tabs over CDP
+        # that prefetch the next results pages while the main tab handles job details
+        self.engine_mode = self.config.get('EXECUTION', 'engine', fallback='sync').strip().lower()
+        self.prefetch_pages = self.config.getint('EXECUTION', 'prefetch_pages', fallback=1)
+        self.cdp_tabs = self.config.getint('EXECUTION', 'cdp_tabs', fallback=2)
+        self.engine = None
+
+        # Rank every listing from all searches and spend the budget on the best ones
+        self.scoring_enabled = self.config.getboolean('SCORING', 'enabled', fallback=False)
+        self.min_score = self.config.getfloat('SCORING', 'min_score', fallback=0.0)
+
+        # Seen/applied jobs from earlier runs, shared with any search workers
+        self.job_store = job_store or JobStore(
+            self.config.get('STORAGE', 'jobs_db', fallback='applied_jobs.db'),
+            revisit_seen=self.config.getboolean('STORAGE', 'revisit_seen', fallback=False)
+        )
+        self.selector_cache = selector_cache or SelectorCache(
+            self.config.get('STORAGE', 'selector_stats', fallback='selector_stats.json')
+        )
+        self.search_strategies = search_strategies or SearchStrategyCache(
+            self.config.get('STORAGE', 'search_strategies', fallback='search_strategies.json'),
+            ttl=self.config.getfloat('STORAGE', 'search_strategy_ttl_hours', fallback=72) * 3600
+        )
+        # Compressed details-page snapshots, so jobs that could not be applied to are not opened again
+        page_cache_path = self.config.get('STORAGE', 'page_cache', fallback='page_cache.db').strip()
+        self.page_cache = page_cache or (DetailPageCache(
+            page_cache_path, max_mb=self.config.getfloat('STORAGE', 'page_cache_mb', fallback=50)
+        ) if page_cache_path else None)
+        
+        # Upper bounds for condition-driven waits (seconds)
+        self.page_load_timeout = self.config.getfloat('WAITS', 'page_load_timeout', fallback=15)
+        self.element_timeout = self.config.getfloat('WAITS', 'element_timeout', fallback=10)
+        self.action_timeout = self.config.getfloat('WAITS', 'action_timeout', fallback=3)
+        self.network_idle_timeout = self.config.getfloat('WAITS', 'network_idle_timeout', fallback=5)
+        self.network_idle_time = self.config.getfloat('WAITS', 'network_idle_time', fallback=0.5)
+        self.poll_interval = self.config.getfloat('WAITS', 'poll_interval', fallback=0.2)
+        self.wait_times = {}
+
+        # Saved login state, reused on later runs to skip the Google OAuth flow
+        self.session_file = self.config.get('SESSION', 'session_file', fallback='session.json')
+        self.user_data_dir = self.config.get('SESSION', 'user_data_dir', fallback='').strip()
+        self.session_max_age = self.config.getfloat('SESSION', 'max_age_days', fallback=7) * 86400
+
+        # 'lean' uses the eager page load strategy and blocks images, media, fonts and trackers
+        self.browser_profile = self.config.get('BROWSER', 'profile', fallback='full').strip().lower()
+        self.blocked_urls = []
+        self.traffic_meter = None
+        self.ready_states = ('complete',)
+        if self.browser_profile == 'lean':
+            self.blocked_urls = blocked_url_patterns(
+                images=self.config.getboolean('BROWSER', 'block_images', fallback=True),
+                media=self.config.getboolean('BROWSER', 'block_media', fallback=True),
+                fonts=self.config.getboolean('BROWSER', 'block_fonts', fallback=True),
+                trackers=self.config.getboolean('BROWSER', 'block_trackers', fallback=True),
+                extra=self.config.get('BROWSER', 'extra_blocked', fallback='').split(',')
+            )
+            if self.config.getboolean('BROWSER', 'report_traffic', fallback=True):
+                self.traffic_meter = TrafficMeter()
+            # With the eager strategy the DOM is usable before subresources finish
+            self.ready_states = ('interactive', 'complete')
+
+        # Recycle the browser before it grows too large during long runs
+        self.memory_supervisor = MemorySupervisor.from_config(self.config)
+        self.browser_restarts = 0
+
+        # Where chromedriver was found last time, so startup skips the Selenium Manager lookup
+        self.driver_cache = self.config.get('STORAGE', 'driver_cache', fallback='driver_cache.json')
+        self.driver_cache_ttl = self.config.getfloat('STORAGE', 'driver_cache_ttl_hours', fallback=168) * 3600
+        # Pre-launched browsers that a restart swaps in; a persistent profile can only be open once
+        self.browser_pool = None
+        # Record the session's pages and commands, or serve a recording instead of starting Chrome
+        self.record_to = self.config.get('REPLAY', 'record_to', fallback='').strip()
+        self.replay_from = self.config.get('REPLAY', 'replay_from', fallback='').strip()
+        standby_browsers = self.config.getint('BROWSER', 'standby_browsers', fallback=0)
+        if standby_browsers > 0 and worker_id == 0:
+            if self.user_data_dir:
+                print("Standby browsers are disabled while user_data_dir is set")
+            else:
+                self.browser_pool = BrowserPool(self.launch_browser, standby_browsers)
+
         self.setup_driver()
+        if self.browser_pool:
+            self.browser_pool.fill()
         
         # Login credentials
         self.email = self.config['NAUKRI']['email']
@@ -27,9 +246,24 @@ class NaukriAutoApply:
         self.locations = self.config['JOB_SEARCH']['locations'].split(',')
         self.experience = self.config['JOB_SEARCH']['experience']
         self.salary = self.config['JOB_SEARCH']['salary']
+        self.job_age_days = self.config.getint('JOB_SEARCH', 'job_age_days', fallback=1)
+        # Filters are encoded into the search URL once; only unsupported ones go through the dropdowns
+        self.search_filters = SearchFilters(self.experience, self.salary, self.job_age_days)
+        self.scorer = JobScorer.from_config(self.config, self.keywords, self.experience, self.salary)
     
+    @traced()
     def setup_driver(self):
-        """Initialize WebDriver with improved stability"""
+        """Initialize WebDriver with improved stability, taking a standby browser when one is ready"""
+        driver = self.browser_pool.take() if self.browser_pool else None
+        if driver:
+            print("Using a standby browser")
+            self.tracer.count("standby_browser_used")
+        self.driver = driver or self.launch_browser()
+        self.tracer.instrument_driver(self.driver)
+        self.wait = WebDriverWait(self.driver, 20)
+
+    def chrome_options(self):
+        """Chrome options shared by the main browser and the standby ones"""
         chrome_options = Options()
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -43,24 +277,90 @@ class NaukriAutoApply:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # A persistent Chrome profile keeps the login across runs; only one browser can use it at a time
+        if self.user_data_dir and self.worker_id == 0:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(self.user_data_dir)}")
+
         # Check for headless mode
         headless = self.config['DEFAULT'].getboolean('headless', fallback=False)
         if headless:
             chrome_options.add_argument("--headless")
-        
+
+        if self.browser_profile == 'lean':
+            # driver.get returns at DOMContentLoaded instead of the full load event
+            chrome_options.page_load_strategy = 'eager'
+        if self.traffic_meter:
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        return chrome_options
+
+    def launch_browser(self):
+        """Start a configured Chrome with resource blocking and the navigator.webdriver patch applied"""
+        if self.replay_from:
+            return ReplayDriver(Recording(self.replay_from))
+        chrome_options = self.chrome_options()
+
         # Check if chrome driver path is specified
         chrome_driver_path = self.config['DEFAULT'].get('chrome_driver_path', '').strip()
-        
-        if chrome_driver_path:
-            service = Service(chrome_driver_path)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            # Use system PATH or ChromeDriverManager
-            self.driver = webdriver.Chrome(options=chrome_options)
-        
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.wait = WebDriverWait(self.driver, 20)
+
+        with self.tracer.span("launch_browser"):
+            if chrome_driver_path:
+                service = Service(chrome_driver_path)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            else:
+                # Reuse the last resolved driver and browser, falling back to Selenium's own lookup
+                paths = resolve_driver(self.driver_cache, self.driver_cache_ttl)
+                if paths['browser_path']:
+                    chrome_options.binary_location = paths['browser_path']
+                try:
+                    if paths['driver_path']:
+                        driver = webdriver.Chrome(service=Service(paths['driver_path']), options=chrome_options)
+                    else:
+                        driver = webdriver.Chrome(options=chrome_options)
+                except WebDriverException:
+                    if not paths['driver_path']:
+                        raise
+                    print("Cached chromedriver failed to start, resolving it again")
+                    forget_driver(self.driver_cache)
+                    driver = webdriver.Chrome(options=self.chrome_options())
+
+        if self.record_to:
+            record_driver(driver, self.record_to)
+        apply_blocking(driver, self.blocked_urls)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
     
+    def restart_driver(self):
+        """Replace a dead browser with a fresh one; the caller logs in again"""
+        if self.engine:
+            self.engine.close()
+            self.engine = None
+        if self.http_discovery:
+            self.http_discovery.close()
+            self.http_discovery = None
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+        self.setup_driver()
+        self.memory_supervisor.reset()
+
+    def check_browser_memory(self):
+        """Count a processed job and recycle the browser if the supervisor says it has grown too large"""
+        reason = self.memory_supervisor.job_done(self.driver)
+        if reason:
+            self.recycle_browser(reason)
+
+    def recycle_browser(self, reason):
+        """Restart the browser with the logged-in cookies; the caller's work cursor carries on unchanged"""
+        print(f"Recycling browser: {reason}")
+        with self.tracer.span("recycle_browser", reason=reason):
+            self.record_page_traffic()
+            cookies = self.driver.get_cookies()
+            self.restart_driver()
+            self.import_session_cookies(cookies)
+        self.browser_restarts += 1
+        self.tracer.count("browser_restarts")
+
     def is_session_active(self):
         """Check if the browser session is still active"""
         try:
@@ -70,101 +370,311 @@ class NaukriAutoApply:
             return False
     
     def ensure_session_active(self):
-        """Ensure browser session is active, restart if needed"""
-        if not self.is_session_active():
-            print("Browser session lost, restarting...")
-            try:
-                self.driver.quit()
-            except:
-                pass
-            self.setup_driver()
+        """Ensure browser session is active, restart and log in again if needed"""
+        if self.is_session_active():
+            return True
+        try:
+            self.restart_session()
+            return True
+        except WebDriverException as e:
+            print(f"Could not restart the browser session: {str(e)}")
             return False
-        return True
-    
-    def find_element_by_multiple_selectors(self, selectors, timeout=10):
-        """Try multiple selectors to find an element"""
-        for selector_type, selector_value in selectors:
-            try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((selector_type, selector_value))
-                )
-                return element
-            except TimeoutException:
-                try:
-                    # Fallback to just presence if clickable fails
-                    element = WebDriverWait(self.driver, 2).until(
-                        EC.presence_of_element_located((selector_type, selector_value))
-                    )
-                    return element
-                except TimeoutException:
-                    continue
-        return None
-    
-    def safe_click(self, element):
-        """Safely click an element using multiple methods"""
+
+    def restart_session(self):
+        """Replace a dead browser and log in again, from the saved session when possible"""
+        print("Browser session lost, restarting...")
+        self.tracer.count("session_restarts")
+        self.restart_driver()
+        if not self.login():
+            raise InvalidSessionIdException("Could not log in again after restarting the browser")
+
+    def page_blocked(self):
+        """Check the current page for throttling or block messages in one script call"""
         try:
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(1)
-            
+            text = self.driver.execute_script(PAGE_TEXT_SCRIPT) or ''
+        except WebDriverException:
+            return False
+        return any(marker in text for marker in BLOCKED_PAGE_MARKERS)
+
+    def wait_for(self, condition, timeout=None, label="wait", poll=None):
+        """Wait until condition(driver) is truthy, recording how long the wait took.
+
+        Returns the condition's value, or None if the timeout was reached.
+        """
+        if timeout is None:
+            timeout = self.element_timeout
+        start_time = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=poll or self.poll_interval).until(condition)
+        except TimeoutException:
+            return None
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.wait_times.setdefault(label, Timing()).add(elapsed)
+            self.tracer.add_span(f"wait:{label}", WAIT, start_time, elapsed)
+
+    def wait_for_page_ready(self, timeout=None, label="page_ready"):
+        """Wait for document.readyState to reach 'complete' ('interactive' with the lean profile)"""
+        return self.wait_for(
+            lambda d: d.execute_script("return document.readyState") in self.ready_states,
+            timeout=self.page_load_timeout if timeout is None else timeout,
+            label=label
+        )
+
+    def wait_for_element(self, locator, timeout=None, clickable=False, label="element"):
+        """Wait for an element to be present (or clickable) and return it"""
+        condition = EC.element_to_be_clickable(locator) if clickable else EC.presence_of_element_located(locator)
+        return self.wait_for(condition, timeout=timeout, label=label)
+
+    def wait_for_any_element(self, locators, timeout=None, label="any_element"):
+        """Wait until at least one of the locators matches and return the matches"""
+        def any_present(driver):
+            for selector_type, selector_value in locators:
+                elements = driver.find_elements(selector_type, selector_value)
+                if elements:
+                    return elements
+            return False
+        return self.wait_for(any_present, timeout=timeout, label=label)
+
+    def wait_for_staleness(self, element, timeout=None, label="staleness"):
+        """Wait for an element to be detached from the DOM (e.g. after navigation)"""
+        return self.wait_for(EC.staleness_of(element), timeout=timeout, label=label)
+
+    def wait_for_window_count(self, count, timeout=None, label="window_count"):
+        """Wait until at least `count` window handles are open"""
+        return self.wait_for(lambda d: len(d.window_handles) >= count, timeout=timeout, label=label)
+
+    def wait_for_url_change(self, old_url, timeout=None, label="url_change"):
+        """Wait until the current URL differs from old_url"""
+        return self.wait_for(
+            lambda d: d.current_url != old_url,
+            timeout=self.page_load_timeout if timeout is None else timeout,
+            label=label
+        )
+
+    def wait_for_network_idle(self, timeout=None, label="network_idle"):
+        """Wait until no new resources have been fetched for network_idle_time seconds"""
+        state = {"count": -1, "since": time.time()}
+
+        def network_idle(driver):
+            count = driver.execute_script("return window.performance.getEntriesByType('resource').length")
+            now = time.time()
+            if count != state["count"]:
+                state["count"] = count
+                state["since"] = now
+                return False
+            return now - state["since"] >= self.network_idle_time
+
+        return self.wait_for(
+            network_idle,
+            timeout=self.network_idle_timeout if timeout is None else timeout,
+            label=label
+        )
+
+    def record_page_traffic(self):
+        """Attribute the network events logged so far to their pages (lean profile only)"""
+        if self.traffic_meter:
+            self.traffic_meter.collect(self.driver)
+
+    def print_wait_summary(self):
+        """Print how much time was spent in each kind of wait"""
+        if not self.wait_times:
+            return
+        print("\nWait summary:")
+        print(f"{'wait':<20}{'count':>8}{'total(s)':>12}{'avg(s)':>10}{'max(s)':>10}")
+        for label, timing in sorted(self.wait_times.items(), key=lambda item: -item[1].total):
+            print(f"{label:<20}{timing.count:>8}{timing.total:>12.2f}{timing.total / timing.count:>10.2f}{timing.max:>10.2f}")
+
+    def find_element_by_multiple_selectors(self, selectors, timeout=10, target=None, require_clickable=False):
+        """Find an element using whichever of several selectors matches first.
+
+        All candidates are raced in a single script call per poll. When a
+        target name is given, the selector that matched last time for that
+        target is preferred and the hit statistics are kept in the selector cache.
+        """
+        ordered = self.selector_cache.order(target, selectors)
+        compiled = self.selector_cache.compile(ordered)
+        fallback = {}
+
+        def race(driver):
+            match = driver.execute_script(RACE_SELECTORS_SCRIPT, compiled)
+            if match and match[2]:
+                return match
+            if match:
+                # Present but not clickable yet; used if nothing becomes clickable in time
+                fallback['match'] = match
+            return False
+
+        match = self.wait_for(race, timeout=timeout, label="selector")
+        if not match and not require_clickable:
+            match = fallback.get('match')
+        if not match:
+            self.selector_cache.record_miss(target)
+            self.tracer.count(f"selector.{target or 'unnamed'}.miss")
+            return None
+        index, element, _ = match
+        self.selector_cache.record_hit(target, ordered[index])
+        self.tracer.count(f"selector.{target or 'unnamed'}.hit")
+        if index:
+            # The preferred selector missed and a later candidate matched instead
+            self.tracer.count(f"selector.{target or 'unnamed'}.fallback")
+        return element
+
+    def safe_click(self, element, relocate=None):
+        """Safely click an element using multiple methods.
+
+        A stale element is looked up again with relocate() when given; an
+        element that cannot take the click is scrolled clear of sticky headers.
+        """
+        state = {'element': element}
+
+        def click():
+            # Scroll element into view and wait until it can receive the click
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", state['element'])
+            self.wait_for(EC.element_to_be_clickable(state['element']), timeout=self.action_timeout, label="clickable")
+
             # Try regular click first
-            element.click()
+            state['element'].click()
             return True
-        except Exception:
+
+        def requery():
+            state['element'] = relocate()
+            if state['element'] is None:
+                raise NoSuchElementException("Element disappeared after going stale")
+
+        def scroll():
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); window.scrollBy(0, -120);",
+                                       state['element'])
+
+        try:
+            return self.retry.run("click", click, requery=requery if relocate else None, scroll=scroll)
+        except WebDriverException:
             try:
                 # Try JavaScript click as fallback
-                self.driver.execute_script("arguments[0].click();", element)
+                self.driver.execute_script("arguments[0].click();", state['element'])
                 return True
-            except Exception:
+            except WebDriverException:
                 return False
     
     def safe_send_keys(self, element, text):
         """Safely send keys to an element"""
-        try:
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(1)
-            
+        def type_text():
+            # Scroll element into view and wait until it accepts input
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            self.wait_for(EC.element_to_be_clickable(element), timeout=self.action_timeout, label="clickable")
+
             # Clear and send keys
             element.clear()
-            time.sleep(0.5)
             element.send_keys(text)
             return True
-        except Exception:
+
+        def scroll():
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); window.scrollBy(0, -120);", element)
+
+        try:
+            return self.retry.run("send_keys", type_text, scroll=scroll)
+        except WebDriverException:
             try:
                 # Try JavaScript method
                 self.driver.execute_script("arguments[0].value = '';", element)
                 self.driver.execute_script("arguments[0].value = arguments[1];", element, text)
                 return True
-            except Exception:
+            except WebDriverException:
                 return False
 
+    def is_logged_in(self, current_url, page_title):
+        """Check the current page for signs of a logged-in session"""
+        return (self.site_host in current_url and
+                "login" not in current_url and
+                "nlogin" not in current_url and
+                ("home" in current_url or "jobs" in current_url or "mynaukri" in page_title.lower()))
+
+    def save_session(self):
+        """Save cookies and local storage after a successful login"""
+        try:
+            session = {
+                'base_url': self.base_url,
+                'saved_at': time.time(),
+                'cookies': self.driver.get_cookies(),
+                'local_storage': self.driver.execute_script(
+                    "const items = {};"
+                    "for (let i = 0; i < localStorage.length; i++) {"
+                    "  const key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+                    "}"
+                    "return items;"
+                )
+            }
+            atomic_write_json(self.session_file, session)
+            print(f"Session saved to {self.session_file}")
+        except Exception as e:
+            print(f"Could not save session: {str(e)}")
+
+    def restore_session(self):
+        """Restore a saved session and check that it is still logged in.
+
+        Returns False when there is nothing to restore or the session has
+        expired, in which case the full login flow is needed.
+        """
+        session = load_json(self.session_file)
+        if session and session.get('base_url') == self.base_url and time.time() - session.get('saved_at', 0) < self.session_max_age:
+            now = time.time()
+            cookies = [cookie for cookie in session.get('cookies', []) if cookie.get('expiry', now + 1) > now]
+            if cookies:
+                print("Restoring saved session...")
+                self.driver.get(f"{self.base_url}/")
+                self.wait_for_page_ready()
+                for cookie in cookies:
+                    if 'expiry' in cookie:
+                        cookie['expiry'] = int(cookie['expiry'])
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except WebDriverException:
+                        continue
+                self.driver.execute_script(
+                    "for (const [key, value] of Object.entries(arguments[0])) localStorage.setItem(key, value);",
+                    session.get('local_storage') or {}
+                )
+            elif not self.user_data_dir:
+                return False
+        elif not self.user_data_dir:
+            return False
+
+        # Cheap validity check: an expired session redirects the home page to the login page
+        self.driver.get(f"{self.base_url}/mnjuser/homepage")
+        self.wait_for_page_ready()
+        if self.is_logged_in(self.driver.current_url, self.driver.title):
+            print("Saved session is still valid, skipping Google login")
+            return True
+
+        print("Saved session has expired, logging in again...")
+        self.driver.delete_all_cookies()
+        return False
+
+    @traced()
     def login(self):
         """Login to Naukri account using Google OAuth"""
+        try:
+            if self.restore_session():
+                return True
+        except Exception as e:
+            print(f"Could not restore saved session: {str(e)}")
+
         print("Opening Naukri login page...")
-        self.driver.get("https://www.naukri.com/nlogin/login")
+        self.driver.get(f"{self.base_url}/nlogin/login")
         
-        try:
-            # Look for and click the "Continue with Google" button
-            google_login_button = self.wait.until(EC.element_to_be_clickable(
-                (By.XPATH, "//button[contains(text(),'Google') or contains(@class,'google') or contains(@id,'google')]|//a[contains(text(),'Google') or contains(@class,'google')]")
-            ))
+        # Look for the "Continue with Google" button; both layouts are tried in one pass
+        google_login_selectors = [
+            (By.XPATH, "//button[contains(text(),'Google') or contains(@class,'google') or contains(@id,'google')]|//a[contains(text(),'Google') or contains(@class,'google')]"),
+            (By.XPATH, "//*[contains(text(), 'Continue with Google') or contains(text(), 'Sign in with Google')]")
+        ]
+        google_login_button = self.find_element_by_multiple_selectors(google_login_selectors, timeout=20, target="google_login")
+        if google_login_button and self.safe_click(google_login_button):
             print("Clicking 'Continue with Google' button...")
-            google_login_button.click()
-            
-        except Exception:
-            # Alternative: Look for Google login by different selectors
-            try:
-                google_login_button = self.wait.until(EC.element_to_be_clickable(
-                    (By.XPATH, "//*[contains(text(), 'Continue with Google') or contains(text(), 'Sign in with Google')]")
-                ))
-                print("Found Google login button, clicking...")
-                google_login_button.click()
-            except Exception:
-                print("Could not find Google login button. Please check if the page layout has changed.")
-                print("You may need to manually click the 'Continue with Google' button.")
-                input("Press Enter after you've clicked the Google login button...")
-        
+        else:
+            print("Could not find Google login button. Please check if the page layout has changed.")
+            print("You may need to manually click the 'Continue with Google' button.")
+            input("Press Enter after you've clicked the Google login button...")
+
         # Wait for Google login page to load
         print("Waiting for Google login page...")
         try:
@@ -195,34 +705,34 @@ class NaukriAutoApply:
         
         while not login_completed and (time.time() - start_time) < max_wait_time:
             try:
-                if not self.ensure_session_active():
+                # Restarting is left to the caller; restart_session() itself calls login()
+                if not self.is_session_active():
                     print("Session lost during login, please restart the script.")
                     return False
                 
                 current_url = self.driver.current_url
-                page_title = self.driver.title.lower()
-                
+
                 # Check multiple indicators of successful login
-                if ("naukri.com" in current_url and 
-                    "login" not in current_url and 
-                    "nlogin" not in current_url and
-                    ("home" in current_url or "jobs" in current_url or "mynaukri" in page_title)):
+                if self.is_logged_in(current_url, self.driver.title):
                     print("Login successful! Proceeding with job search...")
                     login_completed = True
                     break
-                    
-                time.sleep(2)
-                
+
+                # React to the next redirect instead of polling on a fixed interval
+                self.wait_for_url_change(current_url, timeout=2, label="login_poll")
+
             except Exception as e:
                 print(f"Error checking login status: {str(e)}")
                 time.sleep(2)
-        
+
         if not login_completed:
             print("Login timeout. Please ensure you complete the login process.")
             return False
-            
-        # Give extra time for page to stabilize after login
-        time.sleep(5)
+
+        # Let the post-login page settle before searching
+        self.wait_for_page_ready(label="login_settle")
+        self.wait_for_network_idle(label="login_settle")
+        self.save_session()
         return True
     
     def search_jobs(self):
@@ -232,70 +742,317 @@ class NaukriAutoApply:
             return
             
         print("Starting job search...")
+
+        self.run_searches(collect=self.scoring_enabled)
+
+        if self.scoring_enabled:
+            self.apply_ranked_jobs()
+
+        # Keep the checkpoint if a search was cut short (e.g. the session died) so the next run resumes it
+        if self.checkpoint and (self.scheduler.budget_exhausted() or not self.checkpoint.unfinished()):
+            self.checkpoint.clear()
+
+        print(f"Total applications submitted: {self.scheduler.applied_count}")
+        for result in self.scheduler.results:
+            print(f"  {result['title']} at {result['company']} ({result['keyword'].strip()} / {result['location'].strip()})")
+
+    def run_searches(self, collect=False, max_applications=None):
+        """Run every keyword x location search; returns the collected candidates in collect mode"""
+        queries = [(keyword, location) for keyword in self.keywords for location in self.locations]
+
+        # Collected listings are not checkpointed, so only direct runs resume
+        self.checkpoint = None
+        if self.resume_enabled and not collect:
+            self.checkpoint = Checkpoint(self.checkpoint_file, queries)
+            if self.checkpoint.resumed:
+                queries = self.checkpoint.pending_queries(queries)
+                print(f"Resuming interrupted run: {len(queries)} searches left, "
+                      f"{self.checkpoint.applied_count} applications already submitted")
+
+        self.scheduler = SearchScheduler(
+            queries, self.max_applications if max_applications is None else max_applications, collect=collect
+        )
+        if self.checkpoint:
+            self.scheduler.applied_count = self.checkpoint.applied_count
+
+        if self.workers > 1 and len(queries) > 1:
+            self.run_worker_pool()
+        else:
+            self.run_search_worker()
+        return self.scheduler.candidates
+
+    @traced()
+    def apply_ranked_jobs(self):
+        """Score every collected listing in one batch and apply to the best ones first"""
+        candidates = self.scheduler.candidates
+        if not candidates:
+            print("No listings collected to rank")
+            self.advance_watermarks()
+            return
+
+        start_time = time.perf_counter()
+        details = self.page_cache.fields_for(key for key, _, _, _ in candidates) if self.page_cache else None
+        ranked = self.scorer.rank(candidates, details)
+        print(f"Ranked {len(ranked)} listings in {(time.perf_counter() - start_time) * 1000:.1f}ms")
+        for score, (_, card, _, _) in ranked[:10]:
+            print(f"  {score:.3f}  {card.title or 'Unknown'} at {card.company or 'Unknown'}")
+
+        try:
+            for score, (key, card, keyword, location) in ranked:
+                if self.scheduler.budget_exhausted():
+                    print(f"Applied to {self.scheduler.applied_count} jobs. Stopping for now.")
+                    return
+                if score < self.min_score:
+                    print(f"Remaining listings score below {self.min_score}")
+                    return
+                if not self.ensure_session_active():
+                    print("Session lost during job processing.")
+                    return
+                try:
+                    with self.tracer.span("job", job_id=key, title=card.title, score=round(score, 3)):
+                        self.retry.run("job", lambda: self.apply_to_job(card, key, keyword, location),
+                                       restart=self.restart_session)
+                except Exception as e:
+                    print(f"Error processing job details for {card.title or 'Unknown'}: {str(e)}")
+                self.check_browser_memory()
+        finally:
+            # Searches with listings still to visit keep their old watermark so the next run finds them
+            self.advance_watermarks(query_key(keyword, location) for score, (key, _, keyword, location) in ranked
+                                    if score >= self.min_score and not self.job_store.is_known(key))
+
+    def advance_watermarks(self, unfinished=()):
+        """Store the watermarks held back by collect walks, except for searches with unvisited listings"""
+        unfinished = set(unfinished)
+        with self.scheduler.lock:
+            watermarks, self.scheduler.watermarks = self.scheduler.watermarks, {}
+        for query, newest_posted_at in watermarks.items():
+            if query not in unfinished:
+                self.job_store.update_watermark(query, newest_posted_at)
+
+    def run_search_worker(self):
+        """Take keyword x location pairs from the scheduler until none are left"""
+        while True:
+            query = self.scheduler.next_query()
+            if query is None:
+                return
+            keyword, location = query
+            try:
+                if not self.ensure_session_active():
+                    print("Session lost during job search.")
+                    return
+                self.search_query(keyword, location)
+            except Exception as e:
+                print(f"Error searching for {keyword} in {location}: {str(e)}")
+                continue
+
+    def run_worker_pool(self):
+        """Shard the search across several browsers that share the logged-in session"""
+        worker_count = min(self.workers, self.scheduler.query_count)
+        print(f"Starting {worker_count} search workers...")
+        cookies = self.driver.get_cookies()
+
+        # Reuse browsers kept warm from an earlier search
+        live_workers = {}
+        for worker in self.worker_pool:
+            if worker.is_session_active():
+                worker.scheduler = self.scheduler
+                worker.checkpoint = self.checkpoint
+                live_workers[worker.worker_id] = worker
+            else:
+                self.release_worker(worker)
+        self.worker_pool = []
+
+        workers = [self]
+        for worker_id in range(1, worker_count):
+            if worker_id in live_workers:
+                workers.append(live_workers.pop(worker_id))
+                continue
+            try:
+                worker = NaukriAutoApply(self.config_file, job_store=self.job_store, selector_cache=self.selector_cache,
+                                         worker_id=worker_id, tracer=self.tracer, search_strategies=self.search_strategies,
+                                         page_cache=self.page_cache)
+                worker.scheduler = self.scheduler
+                worker.checkpoint = self.checkpoint
+                worker.import_session_cookies(cookies)
+                workers.append(worker)
+            except Exception as e:
+                print(f"Could not start worker {worker_id}: {str(e)}")
+
+        threads = [threading.Thread(target=worker.run_search_worker, name=f"search-worker-{worker.worker_id}")
+                   for worker in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Merge per-worker wait timings and release the extra browsers unless they are kept warm
+        for worker in workers[1:] + list(live_workers.values()):
+            for label, timing in worker.wait_times.items():
+                self.wait_times.setdefault(label, Timing()).merge(timing)
+            worker.wait_times = {}
+            self.retry.retries.update(worker.retry.retries)
+            self.retry.failures.update(worker.retry.failures)
+            worker.retry.retries.clear()
+            worker.retry.failures.clear()
+            self.skip_reasons.update(worker.skip_reasons)
+            worker.skip_reasons.clear()
+            if worker.traffic_meter:
+                worker.record_page_traffic()
+                self.traffic_meter.merge(worker.traffic_meter)
+                worker.traffic_meter = TrafficMeter()
+            if self.keep_workers and worker.is_session_active():
+                self.worker_pool.append(worker)
+            else:
+                self.release_worker(worker)
+
+    def release_worker(self, worker):
+        """Close a search worker's browser and clients"""
+        if worker.engine:
+            worker.engine.close()
+        try:
+            worker.driver.quit()
+        except WebDriverException:
+            pass
+        if worker.http_discovery:
+            worker.http_discovery.close()
+
+    def import_session_cookies(self, cookies):
+        """Reuse cookies from an already logged-in browser"""
+        self.driver.get(f"{self.base_url}/")
+        self.wait_for_page_ready()
+        for cookie in cookies:
+            cookie = dict(cookie)
+            # Chrome rejects fractional expiry values
+            if 'expiry' in cookie:
+                cookie['expiry'] = int(cookie['expiry'])
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                continue
+
+    @traced()
+    def search_query(self, keyword, location):
+        """Search for one keyword/location pair and apply to its results"""
+        print(f"Searching for: {keyword.strip()} in {location.strip()}")
+        
+        # Use direct URL approach as primary method
+        keyword_encoded = keyword.strip().replace(' ', '%20').replace(',', '')
+        location_encoded = location.strip().replace(' ', '%20').replace(',', '')
         
-        for keyword in self.keywords:
-            for location in self.locations:
+        # Known-good strategy for this kind of query goes first; stale entries are revalidated in default order
+        shape = query_shape(keyword, location)
+        strategy, fresh = self.search_strategies.lookup(shape)
+        search_urls = {
+            name: template.format(
+                base_url=self.base_url,
+                keyword=keyword_encoded,
+                location=location_encoded,
+                filters=self.search_filters.query_string
+            )
+            for name, template in SEARCH_URL_TEMPLATES
+        }
+        names = self.search_strategies.order(shape, list(search_urls)) if fresh else list(search_urls)
+
+        if self.discovery_mode == 'http' and self.discover_over_http(keyword, location, [search_urls[name] for name in names]):
+            return
+
+        success = False
+        if fresh and strategy == MANUAL:
+            print("Using manual search (cached strategy)")
+            success = self.manual_search(keyword.strip(), location.strip())
+            if success:
+                self.search_strategies.record(shape, MANUAL)
+            else:
+                self.search_strategies.forget(shape, MANUAL)
+
+        if not success:
+            for name in names:
+                search_url = search_urls[name]
                 try:
-                    if not self.ensure_session_active():
-                        print("Session lost during job search.")
-                        return
-                    
-                    print(f"Searching for: {keyword.strip()} in {location.strip()}")
-                    
-                    # Use direct URL approach as primary method
-                    keyword_encoded = keyword.strip().replace(' ', '%20').replace(',', '')
-                    location_encoded = location.strip().replace(' ', '%20').replace(',', '')
-                    
-                    # Try multiple URL formats with date filter
-                    search_urls = [
-                        f"https://www.naukri.com/{keyword_encoded}-jobs-in-{location_encoded}?experience={self.experience.replace(' ', '%20')}&jobAge=1",
-                        f"https://www.naukri.com/jobs?k={keyword_encoded}&l={location_encoded}&jobAge=1",
-                        f"https://www.naukri.com/{keyword_encoded}-jobs?l={location_encoded}&jobAge=1"
-                    ]
-                    
-                    success = False
-                    for search_url in search_urls:
-                        try:
-                            print(f"Trying URL: {search_url}")
-                            self.driver.get(search_url)
-                            time.sleep(5)
-                            
-                            # Check if we got results
-                            current_url = self.driver.current_url
-                            page_source = self.driver.page_source.lower()
-                            
-                            if ("job" in current_url and 
-                                ("results" in page_source or "apply" in page_source or "position" in page_source)):
-                                print("Search successful via direct URL!")
-                                success = True
-                                break
-                                
-                        except Exception as e:
-                            print(f"Error with URL {search_url}: {str(e)}")
-                            continue
-                    
-                    if not success:
-                        # Fallback to manual search
-                        print("Direct URL failed, trying manual search...")
-                        success = self.manual_search(keyword.strip(), location.strip())
-                    
+                    print(f"Trying URL: {search_url}")
+                    with self.tracer.span("search_url", url=search_url):
+                        success = self.open_search_url(search_url)
                     if success:
-                        # Apply filters and process results
-                        self.apply_filters()
-                        self.process_job_listings()
-                    else:
-                        print(f"Could not search for {keyword} in {location}")
-                    
+                        print("Search successful via direct URL!")
+                        self.search_strategies.record(shape, name)
+                        break
+                    self.search_strategies.forget(shape, name)
+
                 except Exception as e:
-                    print(f"Error searching for {keyword} in {location}: {str(e)}")
+                    print(f"Error with URL {search_url}: {str(e)}")
                     continue
-    
+
+        if not success and not (fresh and strategy == MANUAL):
+            # Fallback to manual search
+            print("Direct URL failed, trying manual search...")
+            success = self.manual_search(keyword.strip(), location.strip())
+            if success:
+                self.search_strategies.record(shape, MANUAL)
+
+        if success:
+            # Drive the filter dropdowns only for filters the results URL does not carry
+            ui_filters = self.search_filters.ui_filters_for(self.driver.current_url)
+            if ui_filters and result_count(self.driver) != 0:
+                self.apply_filters(ui_filters)
+            self.process_job_listings(keyword, location)
+        else:
+            print(f"Could not search for {keyword} in {location}")
+
+    def open_search_url(self, search_url):
+        """Load a search URL in the browser and check whether it produced results"""
+        self.driver.get(search_url)
+        self.wait_for_page_ready()
+        self.record_page_traffic()
+        # Results are rendered client-side; wait for the first job card or the result count
+        if not self.wait_for_any_element(JOB_LISTING_SELECTORS + RESULT_COUNT_LOCATORS,
+                                         timeout=self.page_load_timeout, label="search_results"):
+            return False
+
+        # The count element answers "any results?" without pulling the whole page source
+        if result_count(self.driver) == 0:
+            # A search with no matches still means this URL template works for the query
+            print("Search returned no results")
+            return True
+        return bool(self.wait_for_any_element(JOB_LISTING_SELECTORS, timeout=self.page_load_timeout, label="search_results"))
+
+    def discover_over_http(self, keyword, location, search_urls):
+        """List jobs over plain HTTP and only use the browser for the details pages.
+
+        Returns False when no URL produced listings, so the caller can fall
+        back to the browser search.
+        """
+        if self.http_discovery is None:
+            self.http_discovery = HttpDiscovery.from_driver(self.driver, pool_size=self.http_pool_size)
+
+        for search_url in search_urls:
+            try:
+                print(f"Fetching listings: {search_url}")
+                final_url, listing = self.http_discovery.fetch_listing(search_url)
+            except Exception as e:
+                print(f"Error fetching {search_url}: {str(e)}")
+                continue
+            if listing.cards:
+                print("Listings found over HTTP")
+                pages = self.http_discovery.iter_listing_pages(final_url, listing, self.max_pages)
+                self.process_job_listings(keyword, location, pages)
+                return True
+
+        print("HTTP discovery found no listings, falling back to the browser search...")
+        return False
+
+    def wait_for_search_navigation(self, previous_url):
+        """Wait for a submitted search to land on a rendered results page"""
+        self.wait_for_url_change(previous_url)
+        self.wait_for_page_ready()
+        self.wait_for_any_element(JOB_LISTING_SELECTORS, timeout=self.page_load_timeout, label="search_results")
+
+    @traced()
     def manual_search(self, keyword, location):
         """Manual search using search form"""
         try:
             # Go to main jobs page
-            self.driver.get("https://www.naukri.com/")
-            time.sleep(3)
+            self.driver.get(f"{self.base_url}/")
+            self.wait_for_page_ready()
             
             # Multiple selectors for search field
             search_selectors = [
@@ -310,7 +1067,7 @@ class NaukriAutoApply:
                 (By.XPATH, "//input[contains(@placeholder, 'keyword')]")
             ]
             
-            search_field = self.find_element_by_multiple_selectors(search_selectors, timeout=10)
+            search_field = self.find_element_by_multiple_selectors(search_selectors, timeout=10, target="search_field")
             if not search_field:
                 print("Could not find search field")
                 return False
@@ -319,9 +1076,8 @@ class NaukriAutoApply:
             if not self.safe_send_keys(search_field, keyword):
                 print("Could not enter keyword")
                 return False
-            
-            time.sleep(2)
-            
+
+
             # Multiple selectors for location field
             location_selectors = [
                 (By.ID, "qsb-location-sugg"),
@@ -334,11 +1090,10 @@ class NaukriAutoApply:
                 (By.XPATH, "//input[contains(@placeholder, 'location')]")
             ]
             
-            location_field = self.find_element_by_multiple_selectors(location_selectors, timeout=5)
+            location_field = self.find_element_by_multiple_selectors(location_selectors, timeout=5, target="location_field")
             if location_field:
                 print("Found location field, entering location...")
                 self.safe_send_keys(location_field, location)
-                time.sleep(2)
             else:
                 print("Could not find location field, continuing without location filter")
             
@@ -354,11 +1109,12 @@ class NaukriAutoApply:
                 (By.CSS_SELECTOR, ".search-btn")
             ]
             
-            search_button = self.find_element_by_multiple_selectors(search_button_selectors, timeout=5)
+            search_button = self.find_element_by_multiple_selectors(search_button_selectors, timeout=5, target="search_button")
+            home_url = self.driver.current_url
             if search_button:
                 print("Found search button, clicking...")
                 if self.safe_click(search_button):
-                    time.sleep(5)
+                    self.wait_for_search_navigation(home_url)
                     return True
                 else:
                     print("Could not click search button")
@@ -367,9 +1123,9 @@ class NaukriAutoApply:
                 print("Search button not found, trying Enter key...")
                 try:
                     search_field.send_keys(Keys.RETURN)
-                    time.sleep(5)
+                    self.wait_for_search_navigation(home_url)
                     return True
-                except:
+                except WebDriverException:
                     print("Enter key also failed")
             
             return False
@@ -378,109 +1134,118 @@ class NaukriAutoApply:
             print(f"Error in manual search: {str(e)}")
             return False
 
-    def apply_filters(self):
-        """Apply experience and salary filters"""
+    @traced()
+    def apply_filters(self, filters=(DATE, EXPERIENCE, SALARY)):
+        """Apply the given date, experience and salary filters through the UI"""
         try:
             if not self.ensure_session_active():
                 return
             
             print("Attempting to apply filters...")
-            time.sleep(3)
+            self.wait_for_page_ready()
             
-            # First try to apply date filter for last 24 hours
-            try:
-                # Multiple selectors for date posted filter
-                date_selectors = [
-                    (By.XPATH, "//span[contains(text(),'Date Posted')]"),
-                    (By.XPATH, "//div[contains(text(),'Date Posted')]"),
-                    (By.CSS_SELECTOR, "[data-cy='date-filter']"),
-                    (By.XPATH, "//button[contains(@class, 'filter') and contains(text(), 'Date')]"),
-                    (By.XPATH, "//div[contains(@class, 'filter') and contains(text(), 'Date')]"),
-                    (By.XPATH, "//h3[contains(text(), 'Date')]"),
-                    (By.XPATH, "//span[text()='Date']")
-                ]
+            if DATE in filters:
+                # First try to apply date filter for last 24 hours
+                try:
+                    # Multiple selectors for date posted filter
+                    date_selectors = [
+                        (By.XPATH, "//span[contains(text(),'Date Posted')]"),
+                        (By.XPATH, "//div[contains(text(),'Date Posted')]"),
+                        (By.CSS_SELECTOR, "[data-cy='date-filter']"),
+                        (By.XPATH, "//button[contains(@class, 'filter') and contains(text(), 'Date')]"),
+                        (By.XPATH, "//div[contains(@class, 'filter') and contains(text(), 'Date')]"),
+                        (By.XPATH, "//h3[contains(text(), 'Date')]"),
+                        (By.XPATH, "//span[text()='Date']")
+                    ]
                 
-                date_dropdown = self.find_element_by_multiple_selectors(date_selectors, timeout=3)
-                if date_dropdown:
-                    if self.safe_click(date_dropdown):
-                        time.sleep(2)
-                        # Try to select 24 hours filter
-                        date_option_selectors = [
-                            "//li[contains(text(),'24 hours') or contains(text(),'Last 24 hours') or contains(text(),'Today')]",
-                            "//div[contains(text(),'24 hours') or contains(text(),'Last 24 hours') or contains(text(),'Today')]",
-                            "//label[contains(text(),'24 hours') or contains(text(),'Last 24 hours') or contains(text(),'Today')]"
-                        ]
-                        
-                        date_option_found = False
-                        for selector in date_option_selectors:
-                            try:
-                                date_options = self.driver.find_elements(By.XPATH, selector)
-                                if date_options:
-                                    for option in date_options:
-                                        if self.safe_click(option):
-                                            print("Applied 24 hours date filter")
-                                            time.sleep(2)
-                                            date_option_found = True
-                                            break
-                                if date_option_found:
-                                    break
-                            except:
-                                continue
+                    date_dropdown = self.find_element_by_multiple_selectors(date_selectors, timeout=3, target="date_filter")
+                    if date_dropdown:
+                        if self.safe_click(date_dropdown):
+                            # Select the option matching job_age_days, rounded the same way as the URL filter
+                            job_age = self.search_filters.job_age or JOB_AGE_DAYS[0]
+                            label_match = " or ".join(f"contains(text(),'{label}')" for label in JOB_AGE_LABELS[job_age])
+                            date_option_selectors = [f"//{tag}[{label_match}]" for tag in ("li", "div", "label")]
+                            self.wait_for_any_element(
+                                [(By.XPATH, selector) for selector in date_option_selectors],
+                                timeout=self.action_timeout, label="filter_options"
+                            )
+
+                            date_option_found = False
+                            for selector in date_option_selectors:
+                                try:
+                                    date_options = self.driver.find_elements(By.XPATH, selector)
+                                    if date_options:
+                                        for option in date_options:
+                                            if self.safe_click(option):
+                                                print(f"Applied {JOB_AGE_LABELS[job_age][0]} date filter")
+                                                self.wait_for_results_refresh()
+                                                date_option_found = True
+                                                break
+                                    if date_option_found:
+                                        break
+                                except WebDriverException:
+                                    continue
                         
-                        if not date_option_found:
-                            print("Could not find 24 hours filter option")
-                else:
-                    print("Date filter not found - skipping")
-            except Exception as date_error:
-                print(f"Error applying date filter: {str(date_error)}")
+                            if not date_option_found:
+                                print(f"Could not find the {JOB_AGE_LABELS[job_age][0]} filter option")
+                    else:
+                        print("Date filter not found - skipping")
+                except Exception as date_error:
+                    print(f"Error applying date filter: {str(date_error)}")
             
             # Skip other filters if they cause issues
             try:
-                # Multiple selectors for experience filter
-                exp_selectors = [
-                    (By.XPATH, "//span[contains(text(),'Experience')]"),
-                    (By.XPATH, "//div[contains(text(),'Experience')]"),
-                    (By.CSS_SELECTOR, "[data-cy='experience-filter']"),
-                    (By.XPATH, "//button[contains(@class, 'filter') and contains(text(), 'Experience')]"),
-                    (By.XPATH, "//div[contains(@class, 'filter') and contains(text(), 'Experience')]")
-                ]
+                if EXPERIENCE in filters:
+                    # Multiple selectors for experience filter
+                    exp_selectors = [
+                        (By.XPATH, "//span[contains(text(),'Experience')]"),
+                        (By.XPATH, "//div[contains(text(),'Experience')]"),
+                        (By.CSS_SELECTOR, "[data-cy='experience-filter']"),
+                        (By.XPATH, "//button[contains(@class, 'filter') and contains(text(), 'Experience')]"),
+                        (By.XPATH, "//div[contains(@class, 'filter') and contains(text(), 'Experience')]")
+                    ]
                 
-                exp_dropdown = self.find_element_by_multiple_selectors(exp_selectors, timeout=3)
-                if exp_dropdown:
-                    if self.safe_click(exp_dropdown):
-                        time.sleep(2)
-                        try:
-                            exp_option = self.driver.find_element(By.XPATH, f"//li[contains(text(),'{self.experience}')]")
-                            if self.safe_click(exp_option):
-                                print("Applied experience filter")
-                                time.sleep(2)
-                        except:
-                            print("Experience filter option not found")
-                else:
-                    print("Experience filter not found - skipping")
+                    exp_dropdown = self.find_element_by_multiple_selectors(exp_selectors, timeout=3, target="experience_filter")
+                    if exp_dropdown:
+                        if self.safe_click(exp_dropdown):
+                            try:
+                                exp_option = self.wait_for_element(
+                                    (By.XPATH, f"//li[contains(text(),'{self.experience}')]"),
+                                    timeout=self.action_timeout, label="filter_options"
+                                )
+                                if self.safe_click(exp_option):
+                                    print("Applied experience filter")
+                                    self.wait_for_results_refresh()
+                            except WebDriverException:
+                                print("Experience filter option not found")
+                    else:
+                        print("Experience filter not found - skipping")
                 
-                # Multiple selectors for salary filter
-                salary_selectors = [
-                    (By.XPATH, "//span[contains(text(),'Salary')]"),
-                    (By.XPATH, "//div[contains(text(),'Salary')]"),
-                    (By.CSS_SELECTOR, "[data-cy='salary-filter']"),
-                    (By.XPATH, "//button[contains(@class, 'filter') and contains(text(), 'Salary')]"),
-                    (By.XPATH, "//div[contains(@class, 'filter') and contains(text(), 'Salary')]")
-                ]
+                if SALARY in filters:
+                    # Multiple selectors for salary filter
+                    salary_selectors = [
+                        (By.XPATH, "//span[contains(text(),'Salary')]"),
+                        (By.XPATH, "//div[contains(text(),'Salary')]"),
+                        (By.CSS_SELECTOR, "[data-cy='salary-filter']"),
+                        (By.XPATH, "//button[contains(@class, 'filter') and contains(text(), 'Salary')]"),
+                        (By.XPATH, "//div[contains(@class, 'filter') and contains(text(), 'Salary')]")
+                    ]
                 
-                salary_dropdown = self.find_element_by_multiple_selectors(salary_selectors, timeout=3)
-                if salary_dropdown:
-                    if self.safe_click(salary_dropdown):
-                        time.sleep(2)
-                        try:
-                            salary_option = self.driver.find_element(By.XPATH, f"//li[contains(text(),'{self.salary}')]")
-                            if self.safe_click(salary_option):
-                                print("Applied salary filter")
-                                time.sleep(2)
-                        except:
-                            print("Salary filter option not found")
-                else:
-                    print("Salary filter not found - skipping")
+                    salary_dropdown = self.find_element_by_multiple_selectors(salary_selectors, timeout=3, target="salary_filter")
+                    if salary_dropdown:
+                        if self.safe_click(salary_dropdown):
+                            try:
+                                salary_option = self.wait_for_element(
+                                    (By.XPATH, f"//li[contains(text(),'{self.salary}')]"),
+                                    timeout=self.action_timeout, label="filter_options"
+                                )
+                                if self.safe_click(salary_option):
+                                    print("Applied salary filter")
+                                    self.wait_for_results_refresh()
+                            except WebDriverException:
+                                print("Salary filter option not found")
+                    else:
+                        print("Salary filter not found - skipping")
                     
             except Exception as filter_error:
                 print(f"Filter error (continuing anyway): {str(filter_error)}")
@@ -488,243 +1253,299 @@ class NaukriAutoApply:
         except Exception as e:
             print(f"Error applying filters (continuing): {str(e)}")
     
-    def process_job_listings(self):
-        """Process job listings and apply to relevant ones"""
+    def wait_for_results_refresh(self):
+        """Wait for the results list to re-render after a filter or page change"""
+        self.wait_for_network_idle(label="results_refresh")
+        self.wait_for_any_element(JOB_LISTING_SELECTORS, timeout=self.page_load_timeout, label="search_results")
+
+    def process_job_listings(self, keyword="", location="", pages=None):
+        """Process job listings and apply to relevant ones.
+
+        `pages` yields (page number, ListingPage); by default the results
+        currently open in the browser are walked page by page.
+        """
         if not self.ensure_session_active():
             return
-            
-        page = 1
-        max_pages = 3  # Reduced to prevent long execution
+        if self.scheduler is None:
+            self.scheduler = SearchScheduler([], self.max_applications)
+        resume_page, resume_index = self.checkpoint.position(keyword, location) if self.checkpoint else (1, 0)
+        if resume_page > 1 or resume_index:
+            print(f"Resuming at page {resume_page}, job {resume_index + 1}")
+        if pages is None:
+            pages = self.browser_listing_pages(start_page=resume_page)
+
+        query = query_key(keyword, location)
+        watermark = self.job_store.get_watermark(query) if self.incremental else None
+        newest_posted_at = None
+
         applied_count = 0
-        
-        while page <= max_pages:
-            try:
-                if not self.ensure_session_active():
-                    print("Session lost during job processing.")
-                    return
-                
+        page = 1
+        try:
+            for page, listing in pages:
+                if page < resume_page:
+                    continue
                 print(f"Processing page {page}...")
-                
-                # Multiple selectors for job listings
-                job_selectors = [
-                    (By.XPATH, "//article[contains(@class,'jobTuple')]"),
-                    (By.CSS_SELECTOR, ".jobTuple"),
-                    (By.XPATH, "//div[contains(@class, 'srp-jobtuple-wrapper')]"),
-                    (By.CSS_SELECTOR, ".srp-jobtuple-wrapper"),
-                    (By.XPATH, "//div[contains(@class, 'result')]"),
-                    (By.CSS_SELECTOR, "[data-job-id]"),
-                    (By.XPATH, "//div[contains(@class, 'job-tile')]"),
-                    (By.XPATH, "//div[@class='row'][.//a[contains(@class,'title')]]")
-                ]
-                
-                job_listings = []
-                for selector_type, selector_value in job_selectors:
-                    try:
-                        job_listings = self.driver.find_elements(selector_type, selector_value)
-                        if job_listings:
-                            print(f"Found jobs using selector: {selector_value}")
-                            break
-                    except:
-                        continue
-                
-                if not job_listings:
+                if not listing.cards:
                     print("No job listings found on this page")
                     break
-                
-                print(f"Found {len(job_listings)} job listings")
-                
-                for i, job in enumerate(job_listings[:10]):  # Limit to first 10 jobs per page
+
+                print(f"Found {len(listing.cards)} job listings using selector: {listing.selector[1]}")
+
+                if self.incremental:
+                    markers = [self.posting_marker(card) for card in listing.cards]
+                    posted = [posted_at for _, posted_at in markers if posted_at is not None]
+                    if posted:
+                        newest_posted_at = max(posted + [newest_posted_at or 0])
+                    if watermark and all(self.job_store.is_known(key) or behind_watermark(watermark, posted_at)
+                                         for key, posted_at in markers):
+                        print(f"Page {page} only holds postings from earlier runs, stopping pagination")
+                        break
+
+                # Collect the details URLs up front; the results page is left behind after the first visit
+                jobs = []
+                # Ranking looks at every card; otherwise limit to first 10 jobs per page
+                cards = listing.cards if self.scheduler.collect else listing.cards[:10]
+                for index, card in enumerate(cards):
+                    if page == resume_page and index < resume_index:
+                        continue
+                    job_title = card.title or "Unknown"
+                    company = card.company or "Unknown"
+                    if not card.href:
+                        print(f"No clickable link found for: {job_title} at {company}")
+                        continue
+
+                    # Skip jobs applied to in earlier runs or already handled under another search
+                    key = job_key(card.job_id, card.href)
+                    if not self.job_store.claim(key):
+                        print(f"Skipping already processed job: {job_title} at {company}")
+                        continue
+                    jobs.append((index, key, card))
+
+                if self.scheduler.collect:
+                    for _, key, card in jobs:
+                        self.scheduler.add_candidate(key, card, keyword, location)
+                    print(f"Collected {len(jobs)} listings for ranking")
+                    continue
+
+                for index, key, card in jobs:
+                    if self.scheduler.budget_exhausted():  # Limit applications per session
+                        print(f"Applied to {self.scheduler.applied_count} jobs. Stopping for now.")
+                        return
+                    if not self.ensure_session_active():
+                        print("Session lost during job processing.")
+                        return
                     try:
-                        # Scroll job into view
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", job)
-                        time.sleep(1)
-                        
-                        job_title = "Unknown"
-                        company = "Unknown"
-                        
-                        # Get job title and find clickable link to job details
-                        job_link = None
-                        
-                        # Multiple selectors for job title links
-                        title_link_selectors = [
-                            "a.title",
-                            ".title a", 
-                            "[data-cy='job-title']",
-                            "a[title]",
-                            ".jobTupleHeader a",
-                            ".row1 a",
-                            "h3 a",
-                            ".jobtitle a"
-                        ]
-                        
-                        for selector in title_link_selectors:
-                            try:
-                                job_links = job.find_elements(By.CSS_SELECTOR, selector)
-                                if job_links:
-                                    job_link = job_links[0]
-                                    job_title = job_link.text or job_link.get_attribute('title')
-                                    if job_title and job_title != "Unknown":
-                                        break
-                            except:
-                                continue
-                        
-                        # Get company name if available
-                        company_selectors = [
-                            ".compName",
-                            ".company-name", 
-                            "[data-cy='company-name']",
-                            ".subTitle a",
-                            ".row2 .ellipsis",
-                            ".org a",
-                            ".comp-name",
-                            "a.comp-name"
-                        ]
-                        for selector in company_selectors:
-                            try:
-                                company_element = job.find_element(By.CSS_SELECTOR, selector)
-                                company = company_element.text
-                                if company and company != "Unknown":
-                                    break
-                            except:
-                                continue
-                        
-                        if not job_link:
-                            print(f"No clickable link found for: {job_title} at {company}")
-                            continue
-                            
-                        # Open job in a new tab
-                        print(f"Opening job details for: {job_title} at {company}")
-                        
-                        # Save the current window handle
-                        main_window = self.driver.current_window_handle
-                        
-                        # Open in new tab using JavaScript
-                        try:
-                            self.driver.execute_script("arguments[0].setAttribute('target', '_blank');", job_link)
-                            if not self.safe_click(job_link):
-                                # Try to get the URL and open manually if click fails
-                                job_url = job_link.get_attribute('href')
-                                if job_url:
-                                    self.driver.execute_script(f"window.open('{job_url}', '_blank');")
-                                else:
-                                    print(f"Could not open job details for: {job_title}")
-                                    continue
-                            
-                            # Wait for new tab and switch to it
-                            time.sleep(2)
-                            self.wait.until(lambda d: len(d.window_handles) > 1)
-                            
-                            # Switch to the new tab
-                            self.driver.switch_to.window(self.driver.window_handles[-1])
-                            time.sleep(3)
-                            
-                            # Look for apply button on the job details page
-                            apply_selectors = [
-                                "//button[contains(text(),'Apply')]",
-                                "//button[contains(text(),'Easy Apply')]",
-                                "//a[contains(text(),'Apply')]",
-                                "//span[contains(text(),'Apply')]",
-                                "//div[contains(@class,'apply')]//button",
-                                "//button[contains(@class,'apply')]",
-                                "//*[@id='apply-button']",
-                                "//button[@data-cy='apply-button']",
-                                "//button[@id='apply-button']",
-                                "//a[contains(@class,'apply')]",
-                                "//div[contains(@class,'apply')]//a"
-                            ]
-                            
-                            apply_button_found = False
-                            for selector in apply_selectors:
-                                try:
-                                    apply_buttons = self.driver.find_elements(By.XPATH, selector)
-                                    if apply_buttons:
-                                        for apply_btn in apply_buttons:
-                                            if apply_btn.is_displayed() and apply_btn.is_enabled():
-                                                print(f"Found apply button for: {job_title}")
-                                                if self.safe_click(apply_btn):
-                                                    applied_count += 1
-                                                    apply_button_found = True
-                                                    
-                                                    # Handle any follow-up confirmation
-                                                    try:
-                                                        time.sleep(2)
-                                                        confirm_buttons = self.driver.find_elements(
-                                                            By.XPATH, 
-                                                            "//button[contains(text(),'Confirm') or contains(text(),'Submit') or contains(text(),'Apply')]"
-                                                        )
-                                                        if confirm_buttons:
-                                                            for btn in confirm_buttons:
-                                                                if btn.is_displayed():
-                                                                    self.safe_click(btn)
-                                                                    time.sleep(1)
-                                                    except:
-                                                        pass
-                                                        
-                                                    print(f"Successfully applied to: {job_title} at {company}")
-                                                    time.sleep(3)
-                                                    break
-                                                else:
-                                                    print(f"Could not click apply button for: {job_title}")
-                                        if apply_button_found:
-                                            break
-                                except Exception:
-                                    continue
-                                    
-                            if not apply_button_found:
-                                print(f"No apply button found on the job details page for: {job_title} at {company}")
-                            
-                            # Close the job details tab and switch back to main window
-                            self.driver.close()
-                            self.driver.switch_to.window(main_window)
-                            time.sleep(1)
-                            
-                            if applied_count >= 5:  # Limit applications per session
-                                print(f"Applied to {applied_count} jobs. Stopping for now.")
-                                return
-                                
-                        except Exception as e:
-                            print(f"Error processing job details for {job_title}: {str(e)}")
-                            # Make sure to return to main window
-                            if len(self.driver.window_handles) > 1:
-                                self.driver.close()
-                                self.driver.switch_to.window(main_window)
-                    
+                        with self.tracer.span("job", job_id=key, title=card.title):
+                            if self.retry.run("job", lambda: self.apply_to_job(card, key, keyword, location),
+                                              restart=self.restart_session):
+                                applied_count += 1
                     except Exception as e:
-                        print(f"Error processing job {i+1}: {str(e)}")
-                        continue
-                
-                # Try to go to next page
-                try:
-                    next_selectors = [
-                        (By.XPATH, "//a[contains(@class,'fright') and contains(text(),'Next')]"),
-                        (By.CSS_SELECTOR, ".pagination-next"),
-                        (By.XPATH, "//a[contains(text(), 'Next')]"),
-                        (By.CSS_SELECTOR, "[data-cy='next-page']"),
-                        (By.XPATH, "//a[@aria-label='Next']"),
-                        (By.CSS_SELECTOR, "a[aria-label='Next']")
-                    ]
-                    
-                    next_button = self.find_element_by_multiple_selectors(next_selectors, timeout=5)
-                    if next_button and next_button.is_enabled():
-                        if self.safe_click(next_button):
-                            page += 1
-                            time.sleep(5)
-                        else:
-                            print("Could not click next button")
-                            break
-                    else:
-                        print("No more pages available")
-                        break
-                except:
-                    print("Could not find next page button")
-                    break
-                    
-            except Exception as e:
-                print(f"Error on page {page}: {str(e)}")
-                break
-        
-        print(f"Total applications submitted: {applied_count}")
-    
+                        print(f"Error processing job details for {card.title or 'Unknown'}: {str(e)}")
+                    if self.checkpoint:
+                        self.checkpoint.advance(keyword, location, page, index + 1, self.scheduler.applied_count)
+                    self.check_browser_memory()
+
+        except Exception as e:
+            print(f"Error on page {page}: {str(e)}")
+        else:
+            # Only reached when the walk was not cut short by the budget or an error
+            if self.incremental and self.scheduler.collect:
+                # Collected listings are not visited yet; the watermark moves once ranking has settled them
+                self.scheduler.add_watermark(query, newest_posted_at)
+            elif self.incremental:
+                self.job_store.update_watermark(query, newest_posted_at)
+            if self.checkpoint:
+                self.checkpoint.complete(keyword, location, self.scheduler.applied_count)
+
+        if not self.scheduler.collect:
+            print(f"Applications submitted for this search: {applied_count}")
+
+    def posting_marker(self, card):
+        """Return (job key, posted timestamp) for comparing a card with a watermark"""
+        key = job_key(card.job_id, card.href)
+        days = parse_posted_days(card.posted)
+        return key, time.time() - days * 86400 if days is not None else None
+
+    def browser_listing_pages(self, start_page=1):
+        """Yield (page, ListingPage) for the search open in the browser, navigating by URL"""
+        # Details pages are visited in this same tab, so remember how to get back to the results
+        listing_url = self.driver.current_url
+        next_href = None
+        prefetched = {}
+        if self.engine_mode == 'async':
+            self.start_engine()
+        for page in range(start_page, self.max_pages + 1):
+            listing = self.take_prefetched_listing(prefetched.pop(page, None))
+            if listing is None:
+                if page > 1:
+                    self.open_listing_page(listing_url, page, next_href)
+
+                # One script call returns every card on the page as a compact record
+                listing = extract_job_cards(self.driver)
+            if listing.has_next:
+                self.prefetch_listing_pages(listing_url, page, listing.next_href, prefetched)
+            yield page, listing
+            if not listing.has_next:
+                print("No more pages available")
+                return
+            next_href = listing.next_href
+
+    def start_engine(self):
+        """Attach the CDP engine to this browser, falling back to the sync flow if that fails"""
+        if self.engine is not None:
+            return self.engine
+        try:
+            self.engine = AsyncEngine.from_driver(
+                self.driver,
+                tabs=self.cdp_tabs,
+                page_timeout=self.page_load_timeout,
+                idle_time=self.network_idle_time,
+                idle_timeout=self.network_idle_timeout,
+                blocked_urls=self.blocked_urls
+            )
+            print(f"CDP engine attached with {self.cdp_tabs} background tabs")
+        except Exception as e:
+            print(f"Could not start the CDP engine, continuing synchronously: {str(e)}")
+            self.engine_mode = 'sync'
+        return self.engine
+
+    def prefetch_listing_pages(self, listing_url, page, next_href, prefetched):
+        """Start loading the next results pages in background tabs"""
+        if self.engine is None and self.engine_mode == 'async':
+            # Re-attach after the browser was recycled
+            self.start_engine()
+        if self.engine is None:
+            return
+        for ahead in range(page + 1, min(page + self.prefetch_pages, self.max_pages) + 1):
+            if ahead in prefetched:
+                continue
+            url = next_href if ahead == page + 1 and next_href else listing_page_url(listing_url, ahead)
+            prefetched[ahead] = self.engine.prefetch_listing(url)
+
+    def take_prefetched_listing(self, future):
+        """Collect a prefetched ListingPage, or None if the page has to be loaded in the main tab"""
+        if future is None:
+            return None
+        start_time = time.perf_counter()
+        try:
+            listing = future.result(timeout=self.page_load_timeout + self.network_idle_timeout)
+        except Exception as e:
+            print(f"Prefetch failed, loading the page in the browser: {str(e)}")
+            return None
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.wait_times.setdefault("prefetch", Timing()).add(elapsed)
+            self.tracer.add_span("wait:prefetch", WAIT, start_time, elapsed)
+        if not listing.cards:
+            return None
+        self.tracer.count("prefetch_hits")
+        return listing
+
+    def open_listing_page(self, listing_url, page, next_href=None):
+        """Navigate straight to a results page by URL instead of clicking through pagination"""
+        url = next_href or listing_page_url(listing_url, page)
+        self.driver.get(url)
+        self.wait_for_page_ready()
+        self.record_page_traffic()
+        self.wait_for_any_element(JOB_LISTING_SELECTORS, timeout=self.page_load_timeout, label="search_results")
+
+    def apply_to_job(self, card, key, keyword="", location=""):
+        """Open a job's details page in the current tab and apply if possible"""
+        job_title = card.title or "Unknown"
+        company = card.company or "Unknown"
+
+        content_hash = card_hash(card)
+        if self.page_cache:
+            cached = self.page_cache.fields(key, content_hash)
+            if cached and cached.get('apply_type') in NOT_ACTIONABLE - {NO_APPLY}:
+                return self.skip_job(cached['apply_type'], key, card, cached=True)
+
+        print(f"Opening job details for: {job_title} at {company}")
+        self.driver.get(card.href)
+        self.wait_for_page_ready(label="job_details")
+        self.record_page_traffic()
+
+        # One script call per poll tells an Apply button from external, applied and questionnaire pages
+        details = self.classify_details_page(include_text=self.page_cache is not None)
+        if details.apply_type == NO_APPLY and self.page_blocked():
+            raise RateLimitedError(f"Blocked or throttled on the details page of {job_title}")
+        # NO_APPLY may only mean the page had not rendered yet, so it is never cached
+        if self.page_cache and details.apply_type != NO_APPLY:
+            self.page_cache.put(key, content_hash, details.text or '', details.fields)
+        if details.apply_type != APPLY:
+            return self.skip_job(details.apply_type, key, card)
+
+        print(f"Found apply button for: {job_title}")
+        if not self.scheduler.reserve_application():
+            return False
+        # A session lost after the reservation must give the slot back before the job is retried
+        reserved = True
+        try:
+            relocate = lambda: self.classify_details_page().button
+            if not self.safe_click(details.button, relocate=relocate):
+                self.scheduler.release_application()
+                reserved = False
+                print(f"Could not click apply button for: {job_title}")
+                self.job_store.mark_seen(key, card.href, job_title, company)
+                return False
+
+            # Wait for the applied state, a confirm step or a questionnaire instead of a fixed sleep
+            outcome = self.wait_for(
+                lambda driver: self.apply_outcome(driver), timeout=self.action_timeout, label="apply_outcome"
+            )
+            if outcome and outcome.apply_type == QUESTIONNAIRE:
+                self.scheduler.release_application()
+                reserved = False
+                if self.page_cache:
+                    self.page_cache.put(key, content_hash, details.text or '', dict(details.fields, apply_type=QUESTIONNAIRE))
+                return self.skip_job(QUESTIONNAIRE, key, card)
+            if outcome and outcome.apply_type != ALREADY_APPLIED and outcome.confirm is not None:
+                if not self.safe_click(outcome.confirm):
+                    print(f"Could not confirm the application for: {job_title}")
+        except Exception:
+            if reserved:
+                self.scheduler.release_application()
+            raise
+
+        self.job_store.mark_applied(key, card.href, job_title, company)
+        self.scheduler.record_application({
+            'keyword': keyword,
+            'location': location,
+            'title': job_title,
+            'company': company,
+            'url': card.href,
+            'worker': self.worker_id
+        })
+        print(f"Successfully applied to: {job_title} at {company}")
+        self.wait_for_network_idle(label="apply_settle")
+        return True
+
+    def classify_details_page(self, include_text=False):
+        """Poll the details page classifier until it finds an apply control, up to action_timeout"""
+        last = {}
+
+        def classified(driver):
+            details = last['details'] = classify_details(driver, self.site_host, include_text)
+            return details if details.apply_type != NO_APPLY else False
+
+        return self.wait_for(classified, timeout=self.action_timeout, label="classify_details") or last['details']
+
+    def apply_outcome(self, driver):
+        """Wait condition: the page shows the applied state, a questionnaire or a confirm button"""
+        details = classify_details(driver, self.site_host)
+        if details.apply_type in (ALREADY_APPLIED, QUESTIONNAIRE) or details.confirm is not None:
+            return details
+        return False
+
+    def skip_job(self, reason, key, card, cached=False):
+        """Record a job that cannot be applied to and tally the reason"""
+        self.skip_reasons[reason] += 1
+        self.tracer.count(f"skip.{reason}")
+        source = " (cached)" if cached else ""
+        print(f"Skipping {card.title or 'Unknown'} at {card.company or 'Unknown'}: {SKIP_REASONS[reason]}{source}")
+        self.job_store.mark_seen(key, card.href, card.title, card.company)
+        return False
+
     def recover_from_errors(self):
         """Try to recover from common errors"""
         try:
@@ -733,14 +1554,16 @@ class NaukriAutoApply:
                 alert = self.driver.switch_to.alert
                 alert.accept()
                 print("Alert accepted")
-            except:
+            except NoAlertPresentException:
                 pass
                 
-            # Check if we have multiple windows open
-            if len(self.driver.window_handles) > 1:
+            # Job details open in the main tab now, but close any popups the site opened
+            engine_tabs = self.engine.target_ids if self.engine else set()
+            handles = [handle for handle in self.driver.window_handles if handle not in engine_tabs]
+            if len(handles) > 1:
                 # Keep only the first window and close others
-                main_window = self.driver.window_handles[0]
-                for handle in self.driver.window_handles[1:]:
+                main_window = handles[0]
+                for handle in handles[1:]:
                     self.driver.switch_to.window(handle)
                     self.driver.close()
                 self.driver.switch_to.window(main_window)
@@ -762,12 +1585,70 @@ class NaukriAutoApply:
             print(f"Unexpected error: {str(e)}")
             self.recover_from_errors()
         finally:
-            try:
-                if self.driver:
-                    self.driver.quit()
-            except:
-                pass
+            self.close()
+
+    def close(self):
+        """Print the run summaries and release the browser, workers and stores"""
+        self.print_wait_summary()
+        supervisor = self.memory_supervisor
+        if self.browser_restarts or supervisor.peak_rss or supervisor.peak_heap:
+            print(f"\nBrowser restarts: {self.browser_restarts} "
+                  f"(peak RSS {supervisor.peak_rss / MB:.0f} MB, peak JS heap {supervisor.peak_heap / MB:.0f} MB)")
+        if self.traffic_meter:
+            if self.is_session_active():
+                self.record_page_traffic()
+            self.traffic_meter.print_summary()
+        self.retry.print_summary()
+        if self.skip_reasons:
+            print("\nSkipped jobs: " + ", ".join(
+                f"{count} {SKIP_REASONS[reason]}" for reason, count in self.skip_reasons.most_common()
+            ))
+        self.tracer.print_summary()
+        try:
+            self.tracer.export()
+        except OSError as e:
+            print(f"Could not write trace: {str(e)}")
+        try:
+            self.selector_cache.save()
+        except OSError as e:
+            print(f"Could not save selector statistics: {str(e)}")
+        try:
+            self.search_strategies.save()
+        except OSError as e:
+            print(f"Could not save search strategies: {str(e)}")
+        for worker in self.worker_pool:
+            self.release_worker(worker)
+        self.worker_pool = []
+        if self.browser_pool:
+            self.browser_pool.close()
+        if self.engine:
+            self.engine.close()
+        try:
+            if self.driver:
+                self.driver.quit()
+        except WebDriverException:
+            pass
+        if self.http_discovery:
+            self.http_discovery.close()
+        self.job_store.close()
+        if self.page_cache:
+            self.page_cache.print_summary()
+            self.page_cache.close()
 
 if __name__ == "__main__":
-    automator = NaukriAutoApply()
-    automator.run()
+    parser = argparse.ArgumentParser(description="Apply to Naukri jobs matching config.ini")
+    parser.add_argument('--config', default='config.ini', help="Path to the configuration file")
+    parser.add_argument('--daemon', action='store_true',
+                        help="Keep running: search on a schedule and apply from a rate-limited queue")
+    parser.add_argument('--profiles', help="Run every [profile:<name>] in this file, each in its own process")
+    args = parser.parse_args()
+
+    if args.profiles:
+        ProfileSupervisor.from_file(args.profiles, daemon=args.daemon).run()
+        sys.exit(0)
+
+    automator = NaukriAutoApply(args.config)
+    if args.daemon:
+        ApplyDaemon(automator).run()
+    else:
+        automator.run()
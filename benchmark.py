@@ -0,0 +1,221 @@
+"""Offline end-to-end benchmark for the apply pipeline.
+
+Starts the local fixture server, runs NaukriAutoApply against it and
+reports jobs/minute, per-stage latency percentiles and WebDriver round
+trips. No network access is needed, so it can run in CI:
+
+    python benchmark.py --json bench.json
+    python benchmark.py --baseline bench.json --tolerance 0.2   # exits 1 on regression
+"""
+import argparse
+import configparser
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from fixture_server import start_fixture_server
+
+# Methods timed per call; nested stages are included in their parent's time
+STAGES = [
+    'login',
+    'search_query',
+    'manual_search',
+    'apply_filters',
+    'process_job_listings',
+    'open_listing_page',
+    'apply_to_job'
+]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def install_command_counter(automator, commands):
+    """Count every WebDriver command (one HTTP round trip each), including on browsers started by restarts"""
+    def count_commands(driver):
+        execute = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            commands[driver_command] += 1
+            return execute(driver_command, params)
+
+        driver.execute = counting_execute
+
+    # restart_driver and recycle_browser both go through setup_driver
+    setup_driver = automator.setup_driver
+
+    def counting_setup_driver():
+        setup_driver()
+        count_commands(automator.driver)
+
+    automator.setup_driver = counting_setup_driver
+    count_commands(automator.driver)
+
+
+def install_stage_timers(automator, timings):
+    """Wrap the pipeline stages on one instance so each call is timed"""
+    for name in STAGES:
+        method = getattr(automator, name)
+
+        def timed(*args, _method=method, _name=name, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                timings.setdefault(_name, []).append(time.perf_counter() - start_time)
+
+        setattr(automator, name, timed)
+
+
+def write_config(path, base_url, workdir, args):
+    """Write a config.ini that points the automation at the fixture server"""
+    config = configparser.ConfigParser()
+    config['DEFAULT'] = {
+        'chrome_driver_path': args.chrome_driver_path,
+        'headless': 'true',
+        'base_url': base_url
+    }
+    config['NAUKRI'] = {'email': 'benchmark@example.com'}
+    config['JOB_SEARCH'] = {
+        'keywords': args.keywords,
+        'locations': args.locations,
+        'experience': '1-2 years',
+        'salary': '2-3 Lakhs'
+    }
+    config['EXECUTION'] = {
+        'workers': '1',
+        'max_applications': str(args.max_applications),
+        'max_pages': str(args.max_pages)
+    }
+    # Every store starts empty in the temp workdir so runs stay comparable and production files are untouched
+    config['STORAGE'] = {
+        'jobs_db': os.path.join(workdir, 'applied_jobs.db'),
+        'selector_stats': os.path.join(workdir, 'selector_stats.json'),
+        'search_strategies': os.path.join(workdir, 'search_strategies.json'),
+        'checkpoint_file': os.path.join(workdir, 'checkpoint.json'),
+        'driver_cache': os.path.join(workdir, 'driver_cache.json'),
+        'page_cache': os.path.join(workdir, 'page_cache.db')
+    }
+    config['SESSION'] = {'session_file': os.path.join(workdir, 'session.json')}
+    with open(path, 'w') as f:
+        config.write(f)
+
+
+def run_benchmark(args):
+    """Run the full pipeline once against the fixture site and collect metrics"""
+    from Main import NaukriAutoApply
+
+    server = start_fixture_server(latency=args.latency / 1000.0)
+    workdir = tempfile.mkdtemp(prefix='naukri-bench-')
+    config_path = os.path.join(workdir, 'config.ini')
+    write_config(config_path, server.base_url, workdir, args)
+
+    timings = {}
+    commands = Counter()
+    try:
+        start_time = time.perf_counter()
+        automator = NaukriAutoApply(config_path)
+        timings['setup_driver'] = [time.perf_counter() - start_time]
+
+        install_command_counter(automator, commands)
+        install_stage_timers(automator, timings)
+
+        run_start = time.perf_counter()
+        automator.run()
+        elapsed = time.perf_counter() - run_start
+    finally:
+        server.shutdown()
+
+    jobs = len(timings.get('apply_to_job', []))
+    return {
+        'elapsed_seconds': elapsed,
+        'jobs_processed': jobs,
+        'applications': automator.scheduler.applied_count if automator.scheduler else 0,
+        'jobs_per_minute': jobs / elapsed * 60 if elapsed else 0.0,
+        'webdriver_round_trips': sum(commands.values()),
+        'round_trips_per_job': sum(commands.values()) / jobs if jobs else 0.0,
+        'http_requests': server.request_count,
+        'commands': dict(commands.most_common()),
+        'stages': {
+            name: {
+                'count': len(values),
+                'p50': percentile(values, 0.50),
+                'p90': percentile(values, 0.90),
+                'p99': percentile(values, 0.99),
+                'total': sum(values)
+            }
+            for name, values in timings.items()
+        },
+        'waits': {label: timing.total for label, timing in automator.wait_times.items()}
+    }
+
+
+def print_report(results):
+    """Print a human-readable summary of one benchmark run"""
+    print("\nBenchmark results")
+    print(f"  elapsed:              {results['elapsed_seconds']:.2f}s")
+    print(f"  jobs processed:       {results['jobs_processed']}")
+    print(f"  jobs/minute:          {results['jobs_per_minute']:.1f}")
+    print(f"  WebDriver round trips: {results['webdriver_round_trips']} ({results['round_trips_per_job']:.1f} per job)")
+    print(f"  fixture HTTP requests: {results['http_requests']}")
+    print(f"\n{'stage':<22}{'count':>7}{'p50(s)':>10}{'p90(s)':>10}{'p99(s)':>10}{'total(s)':>10}")
+    for name, stage in sorted(results['stages'].items(), key=lambda item: -item[1]['total']):
+        print(f"{name:<22}{stage['count']:>7}{stage['p50']:>10.3f}{stage['p90']:>10.3f}{stage['p99']:>10.3f}{stage['total']:>10.2f}")
+
+
+def find_regressions(results, baseline, tolerance):
+    """Compare against a previous run; lower throughput or more round trips count as regressions"""
+    regressions = []
+    if results['jobs_per_minute'] < baseline['jobs_per_minute'] * (1 - tolerance):
+        regressions.append(f"jobs/minute dropped from {baseline['jobs_per_minute']:.1f} to {results['jobs_per_minute']:.1f}")
+    if results['round_trips_per_job'] > baseline['round_trips_per_job'] * (1 + tolerance):
+        regressions.append(f"round trips per job rose from {baseline['round_trips_per_job']:.1f} to {results['round_trips_per_job']:.1f}")
+    for name, stage in results['stages'].items():
+        previous = baseline.get('stages', {}).get(name)
+        if previous and previous['p90'] and stage['p90'] > previous['p90'] * (1 + tolerance):
+            regressions.append(f"{name} p90 rose from {previous['p90']:.3f}s to {stage['p90']:.3f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the apply pipeline against the local fixture site")
+    parser.add_argument('--keywords', default='software engineer')
+    parser.add_argument('--locations', default='Delhi NCR')
+    parser.add_argument('--max-pages', type=int, default=2)
+    parser.add_argument('--max-applications', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=20.0, help="Artificial fixture latency per request in milliseconds")
+    parser.add_argument('--chrome-driver-path', default='')
+    parser.add_argument('--json', help="Write the results to this file")
+    parser.add_argument('--baseline', help="Fail if results regress against this earlier --json output")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    print_report(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
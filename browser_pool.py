@@ -0,0 +1,140 @@
+"""Faster browser starts: a cached chromedriver lookup and a pool of standby browsers.
+
+Without `chrome_driver_path`, Selenium Manager has to locate (and possibly
+download) a driver and browser before Chrome can launch. The result is
+cached in a JSON file and reused while the binaries still exist. Standby
+browsers are launched in the background, fully configured, so a session
+restart only has to swap one in.
+"""
+import os
+import shutil
+import threading
+import time
+from persistence import load_json, atomic_write_json
+
+try:
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+except ImportError:
+    SeleniumManager = None
+
+_resolved = {}
+_resolve_lock = threading.Lock()
+
+
+def _executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _selenium_manager_paths():
+    """Ask Selenium Manager for the chromedriver and Chrome binaries"""
+    if SeleniumManager is None or not hasattr(SeleniumManager, 'binary_paths'):
+        return None
+    try:
+        paths = SeleniumManager().binary_paths(['--browser', 'chrome'])
+    except Exception as e:
+        print(f"Selenium Manager could not resolve chromedriver: {str(e)}")
+        return None
+    return {'driver_path': paths.get('driver_path', ''), 'browser_path': paths.get('browser_path', '')}
+
+
+def resolve_driver(cache_path='driver_cache.json', ttl=7 * 86400):
+    """Return {'driver_path', 'browser_path'}, from the cache file when it is fresh and the binaries exist.
+
+    Empty paths mean nothing could be resolved and Selenium should do its own lookup.
+    """
+    with _resolve_lock:
+        if cache_path in _resolved:
+            return _resolved[cache_path]
+
+        cached = load_json(cache_path, default=None) or {}
+        if (_executable(cached.get('driver_path'))
+                and time.time() - cached.get('resolved_at', 0) < ttl
+                and (not cached.get('browser_path') or os.path.isfile(cached['browser_path']))):
+            paths = {'driver_path': cached['driver_path'], 'browser_path': cached.get('browser_path', '')}
+        else:
+            start_time = time.perf_counter()
+            paths = _selenium_manager_paths() or {'driver_path': shutil.which('chromedriver') or '', 'browser_path': ''}
+            if _executable(paths['driver_path']):
+                print(f"Resolved chromedriver in {time.perf_counter() - start_time:.1f}s: {paths['driver_path']}")
+                atomic_write_json(cache_path, dict(paths, resolved_at=time.time()))
+            else:
+                paths = {'driver_path': '', 'browser_path': ''}
+
+        _resolved[cache_path] = paths
+        return paths
+
+
+def forget_driver(cache_path='driver_cache.json'):
+    """Drop a cached resolution that failed to launch so the next start resolves again"""
+    with _resolve_lock:
+        _resolved.pop(cache_path, None)
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            pass
+
+
+class BrowserPool:
+    """Keeps `size` launched browsers on standby and refills in the background as they are taken"""
+
+    def __init__(self, launch, size=1):
+        self.launch = launch
+        self.size = size
+        self.lock = threading.Lock()
+        self.standby = []
+        self.starting = 0
+        self.closed = False
+
+    def fill(self):
+        """Start background launches until the pool is back to full size"""
+        with self.lock:
+            missing = self.size - len(self.standby) - self.starting
+            if self.closed or missing <= 0:
+                return
+            self.starting += missing
+        for _ in range(missing):
+            threading.Thread(target=self._launch_one, name="standby-browser", daemon=True).start()
+
+    def _launch_one(self):
+        try:
+            driver = self.launch()
+        except Exception as e:
+            print(f"Could not start a standby browser: {str(e)}")
+            driver = None
+        with self.lock:
+            self.starting -= 1
+            if driver is not None and not self.closed:
+                self.standby.append(driver)
+                return
+        if driver is not None:
+            self._quit(driver)
+
+    def take(self):
+        """Return a live standby browser, or None if none is ready; a replacement starts right away"""
+        while True:
+            with self.lock:
+                driver = self.standby.pop(0) if self.standby else None
+            if driver is None:
+                self.fill()
+                return None
+            try:
+                driver.current_url
+            except Exception:
+                self._quit(driver)
+                continue
+            self.fill()
+            return driver
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every standby browser; launches still in flight quit themselves when they finish"""
+        with self.lock:
+            self.closed = True
+            standby, self.standby = self.standby, []
+        for driver in standby:
+            self._quit(driver)
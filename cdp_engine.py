@@ -0,0 +1,304 @@
+"""asyncio engine that drives extra Chrome tabs over the DevTools Protocol.
+
+The Selenium session stays in charge of the main tab (login, details
+pages, Apply clicks). This engine attaches to the same browser through
+its DevTools websocket and runs background tabs from one event loop on a
+helper thread, e.g. to prefetch and extract the next results pages while
+the main tab is busy with a details page. Page readiness is driven by
+CDP events (load, network requests finishing) instead of polling.
+"""
+import asyncio
+import itertools
+import json
+import threading
+import urllib.request
+import websockets
+from listing_extraction import (
+    EXTRACT_JOB_CARDS_SCRIPT,
+    JOB_LISTING_SELECTORS,
+    TITLE_LINK_SELECTORS,
+    COMPANY_SELECTORS,
+    EXPERIENCE_SELECTORS,
+    SALARY_SELECTORS,
+    POSTED_SELECTORS,
+    NEXT_PAGE_SELECTORS,
+    JobCard,
+    ListingPage
+)
+
+STEALTH_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+class CDPError(Exception):
+    """Error returned by the browser for a DevTools command"""
+
+
+class CDPConnection:
+    """One websocket to the browser, multiplexing flattened target sessions"""
+
+    def __init__(self, websocket_url):
+        self.websocket_url = websocket_url
+        self.websocket = None
+        self.ids = itertools.count(1)
+        self.pending = {}
+        self.listeners = {}
+        self.reader = None
+
+    async def connect(self):
+        self.websocket = await websockets.connect(self.websocket_url, max_size=None)
+        self.reader = asyncio.ensure_future(self._read())
+
+    async def _read(self):
+        try:
+            async for message in self.websocket:
+                data = json.loads(message)
+                if 'id' in data:
+                    future = self.pending.pop(data['id'], None)
+                    if future and not future.done():
+                        if 'error' in data:
+                            future.set_exception(CDPError(data['error'].get('message', str(data['error']))))
+                        else:
+                            future.set_result(data.get('result', {}))
+                    continue
+                for callback in list(self.listeners.get((data.get('sessionId'), data.get('method')), [])):
+                    callback(data.get('params', {}))
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("DevTools connection closed"))
+
+    async def send(self, method, params=None, session_id=None):
+        """Send a command and wait for its result"""
+        message_id = next(self.ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message_id] = future
+        await self.websocket.send(json.dumps(message))
+        return await future
+
+    def on(self, method, callback, session_id=None):
+        """Subscribe to an event for one session"""
+        self.listeners.setdefault((session_id, method), []).append(callback)
+
+    def off(self, method, callback, session_id=None):
+        listeners = self.listeners.get((session_id, method), [])
+        if callback in listeners:
+            listeners.remove(callback)
+
+    async def wait_for_event(self, method, session_id=None, timeout=15):
+        """Wait for the next occurrence of an event"""
+        future = asyncio.get_running_loop().create_future()
+
+        def resolve(params):
+            if not future.done():
+                future.set_result(params)
+
+        self.on(method, resolve, session_id)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.off(method, resolve, session_id)
+
+    async def close(self):
+        if self.websocket:
+            await self.websocket.close()
+        if self.reader:
+            self.reader.cancel()
+
+
+class CDPPage:
+    """A background tab controlled entirely through DevTools events"""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+        self.inflight = set()
+        self.network_changed = asyncio.Event()
+
+    @classmethod
+    async def open(cls, connection, blocked_urls=()):
+        target = await connection.send('Target.createTarget', {'url': 'about:blank', 'background': True})
+        attached = await connection.send('Target.attachToTarget', {'targetId': target['targetId'], 'flatten': True})
+        page = cls(connection, target['targetId'], attached['sessionId'])
+        await page._enable(blocked_urls)
+        return page
+
+    async def _enable(self, blocked_urls=()):
+        for method, callback in (
+            ('Network.requestWillBeSent', self._request_started),
+            ('Network.loadingFinished', self._request_finished),
+            ('Network.loadingFailed', self._request_finished)
+        ):
+            self.connection.on(method, callback, self.session_id)
+        await self.send('Page.enable')
+        await self.send('Network.enable')
+        await self.send('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_SCRIPT})
+        if blocked_urls:
+            await self.send('Network.setBlockedURLs', {'urls': list(blocked_urls)})
+
+    def _request_started(self, params):
+        self.inflight.add(params.get('requestId'))
+        self.network_changed.set()
+
+    def _request_finished(self, params):
+        self.inflight.discard(params.get('requestId'))
+        self.network_changed.set()
+
+    async def send(self, method, params=None):
+        return await self.connection.send(method, params, self.session_id)
+
+    async def navigate(self, url, timeout=15, wait_event='Page.domContentEventFired'):
+        """Navigate and wait for the given lifecycle event"""
+        event = asyncio.ensure_future(self.connection.wait_for_event(wait_event, self.session_id, timeout))
+        result = await self.send('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            event.cancel()
+            raise CDPError(f"Navigation to {url} failed: {result['errorText']}")
+        await event
+
+    async def wait_for_network_idle(self, idle_time=0.5, timeout=5):
+        """Wait until no request has been in flight for idle_time seconds"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            self.network_changed.clear()
+            if not self.inflight:
+                try:
+                    await asyncio.wait_for(self.network_changed.wait(), idle_time)
+                except asyncio.TimeoutError:
+                    return True
+            else:
+                try:
+                    await asyncio.wait_for(self.network_changed.wait(), max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    return False
+        return False
+
+    async def call(self, script, *args):
+        """Run a Selenium-style script (which reads `arguments`) and return its value"""
+        expression = f"(function() {{ {script} }}).apply(null, {json.dumps(list(args))})"
+        result = await self.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': True
+        })
+        if result.get('exceptionDetails'):
+            raise CDPError(result['exceptionDetails'].get('text', 'Script error'))
+        return result.get('result', {}).get('value')
+
+    async def extract_listing(self):
+        """Run the bulk card extraction script in this tab"""
+        snapshot = await self.call(
+            EXTRACT_JOB_CARDS_SCRIPT,
+            [list(selector) for selector in JOB_LISTING_SELECTORS],
+            TITLE_LINK_SELECTORS,
+            COMPANY_SELECTORS,
+            EXPERIENCE_SELECTORS,
+            SALARY_SELECTORS,
+            POSTED_SELECTORS,
+            [list(selector) for selector in NEXT_PAGE_SELECTORS]
+        ) or {}
+        matched = snapshot.get('selector')
+        return ListingPage(
+            tuple(matched) if matched else None,
+            [JobCard(*record) for record in snapshot.get('cards') or []],
+            bool(snapshot.get('hasNext')),
+            snapshot.get('nextHref') or None
+        )
+
+    async def close(self):
+        for method, callback in (
+            ('Network.requestWillBeSent', self._request_started),
+            ('Network.loadingFinished', self._request_finished),
+            ('Network.loadingFailed', self._request_finished)
+        ):
+            self.connection.off(method, callback, self.session_id)
+        try:
+            await self.connection.send('Target.closeTarget', {'targetId': self.target_id})
+        except CDPError:
+            pass
+
+
+class AsyncEngine:
+    """Runs a CDP event loop on a helper thread and exposes it to the synchronous flow.
+
+    Coroutines are scheduled with `submit`, which returns a
+    concurrent.futures.Future, so the Selenium code can start background
+    work and collect the result later.
+    """
+
+    def __init__(self, debugger_address, tabs=2, page_timeout=15, idle_time=0.5, idle_timeout=5, blocked_urls=()):
+        self.debugger_address = debugger_address
+        self.blocked_urls = blocked_urls
+        self.page_timeout = page_timeout
+        self.idle_time = idle_time
+        self.idle_timeout = idle_timeout
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="cdp-engine", daemon=True)
+        self.thread.start()
+        self.connection = None
+        self.tab_count = tabs
+        self.tabs = None
+        # DevTools target ids double as Selenium window handles
+        self.target_ids = set()
+        try:
+            self.submit(self._start()).result(timeout=page_timeout)
+        except BaseException:
+            # Stop the loop thread (and any tabs already opened) before the caller falls back to sync
+            self.close()
+            raise
+
+    @classmethod
+    def from_driver(cls, driver, **kwargs):
+        """Attach to the browser behind a Selenium Chrome session"""
+        address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        return cls(address, **kwargs)
+
+    async def _start(self):
+        with urllib.request.urlopen(f"http://{self.debugger_address}/json/version", timeout=5) as response:
+            websocket_url = json.loads(response.read())['webSocketDebuggerUrl']
+        self.connection = CDPConnection(websocket_url)
+        await self.connection.connect()
+        self.tabs = asyncio.Queue()
+        for _ in range(self.tab_count):
+            tab = await CDPPage.open(self.connection, self.blocked_urls)
+            self.target_ids.add(tab.target_id)
+            await self.tabs.put(tab)
+
+    def submit(self, coroutine):
+        """Schedule a coroutine on the engine's loop"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    async def _load_listing(self, url):
+        tab = await self.tabs.get()
+        try:
+            await tab.navigate(url, timeout=self.page_timeout)
+            await tab.wait_for_network_idle(self.idle_time, self.idle_timeout)
+            return await tab.extract_listing()
+        finally:
+            await self.tabs.put(tab)
+
+    def prefetch_listing(self, url):
+        """Start loading a results page in a background tab; returns a Future of its ListingPage.
+
+        With more than one tab, several prefetches run concurrently on the loop.
+        """
+        return self.submit(self._load_listing(url))
+
+    def close(self):
+        """Close the background tabs and stop the loop"""
+        async def shutdown():
+            if self.tabs is not None:
+                while not self.tabs.empty():
+                    await (self.tabs.get_nowait()).close()
+            if self.connection:
+                await self.connection.close()
+        try:
+            self.submit(shutdown()).result(timeout=5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
@@ -0,0 +1,82 @@
+import hashlib
+import os
+import threading
+import time
+from persistence import load_json, atomic_write_json
+
+
+def query_key(keyword, location):
+    return f"{keyword.strip().lower()}|{location.strip().lower()}"
+
+
+class Checkpoint:
+    """Work cursor of a run, written atomically after every job so an interrupted run can resume.
+
+    Records the searches already finished, the page and card index reached
+    in each unfinished search, and the applications submitted so far. A
+    checkpoint is only reused by a run with the same keyword x location grid.
+    """
+
+    def __init__(self, path, queries):
+        self.path = path
+        self.lock = threading.Lock()
+        self.fingerprint = hashlib.sha1(
+            "\n".join(query_key(keyword, location) for keyword, location in queries).encode()
+        ).hexdigest()
+        state = load_json(path, default=None)
+        self.resumed = bool(state) and state.get('fingerprint') == self.fingerprint
+        if not self.resumed:
+            state = {'fingerprint': self.fingerprint, 'completed': [], 'in_progress': {}, 'applied_count': 0}
+        self.state = state
+
+    @property
+    def applied_count(self):
+        return self.state.get('applied_count', 0)
+
+    def pending_queries(self, queries):
+        """Queries still to run, with the interrupted ones first"""
+        completed = set(self.state['completed'])
+        in_progress = self.state['in_progress']
+        remaining = [query for query in queries if query_key(*query) not in completed]
+        return sorted(remaining, key=lambda query: query_key(*query) not in in_progress)
+
+    def position(self, keyword, location):
+        """Return (page, card index) to resume a query from"""
+        cursor = self.state['in_progress'].get(query_key(keyword, location))
+        if not cursor:
+            return 1, 0
+        return cursor['page'], cursor['job_index']
+
+    def advance(self, keyword, location, page, job_index, applied_count):
+        """Record that every card before job_index on `page` has been handled"""
+        with self.lock:
+            self.state['in_progress'][query_key(keyword, location)] = {'page': page, 'job_index': job_index}
+            self.state['applied_count'] = applied_count
+            self._save()
+
+    def complete(self, keyword, location, applied_count):
+        """Record a finished query"""
+        key = query_key(keyword, location)
+        with self.lock:
+            self.state['in_progress'].pop(key, None)
+            if key not in self.state['completed']:
+                self.state['completed'].append(key)
+            self.state['applied_count'] = applied_count
+            self._save()
+
+    def unfinished(self):
+        """Check whether any query was interrupted part way"""
+        with self.lock:
+            return bool(self.state['in_progress'])
+
+    def _save(self):
+        self.state['updated'] = time.time()
+        atomic_write_json(self.path, self.state)
+
+    def clear(self):
+        """Remove the checkpoint after a run that finished its work"""
+        with self.lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,215 @@
+"""Long-running mode: scheduled searches feeding a persistent, rate-limited apply queue.
+
+The browser (and any search workers) start once and stay warm. Searches
+run every `search_interval_minutes` and only enqueue what they find; the
+queue is drained between searches under per-hour and per-day quotas, with
+exponential backoff while the site is slow or rejecting requests.
+"""
+import time
+from collections import deque
+from listing_extraction import JobCard
+from work_queue import WorkQueue
+
+APPLIED = "applied"
+SKIPPED = "skipped"
+
+
+class RateLimiter:
+    """Token bucket for spacing applications, plus sliding per-hour and per-day quotas"""
+
+    def __init__(self, per_hour=10, per_day=50, burst=2, history=()):
+        self.per_hour = per_hour
+        self.per_day = per_day
+        self.rate = per_hour / 3600.0 if per_hour > 0 else None
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.time()
+        # Application times within the last day, including earlier runs
+        self.history = deque(sorted(history))
+
+    def _refill(self, now):
+        if self.rate:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        while self.history and self.history[0] <= now - 86400:
+            self.history.popleft()
+
+    def delay(self):
+        """Seconds until the next application is allowed (0 when one may go now)"""
+        now = time.time()
+        self._refill(now)
+        waits = [0.0]
+        if self.rate and self.tokens < 1:
+            waits.append((1 - self.tokens) / self.rate)
+        if self.per_hour > 0:
+            last_hour = [applied_at for applied_at in self.history if applied_at > now - 3600]
+            if len(last_hour) >= self.per_hour:
+                waits.append(last_hour[len(last_hour) - self.per_hour] + 3600 - now)
+        if self.per_day > 0 and len(self.history) >= self.per_day:
+            waits.append(self.history[len(self.history) - self.per_day] + 86400 - now)
+        return max(waits)
+
+    def consume(self):
+        """Account for one submitted application"""
+        now = time.time()
+        self._refill(now)
+        if self.rate:
+            self.tokens -= 1
+        self.history.append(now)
+
+
+class Backoff:
+    """Exponential pause while the site is slow or rejecting requests"""
+
+    def __init__(self, initial=60, maximum=1800):
+        self.initial = initial
+        self.maximum = maximum
+        self.current = 0
+        self.until = 0
+
+    def fail(self):
+        """Double the pause (starting at `initial`) and return it"""
+        self.current = min(self.maximum, self.current * 2 if self.current else self.initial)
+        self.until = time.time() + self.current
+        return self.current
+
+    def reset(self):
+        self.current = 0
+        self.until = 0
+
+    def remaining(self):
+        return max(0.0, self.until - time.time())
+
+
+class ApplyDaemon:
+    """Keeps one NaukriAutoApply instance warm and alternates scheduled searches with queue draining"""
+
+    def __init__(self, automator):
+        config = automator.config
+        self.automator = automator
+        self.search_interval = config.getfloat('DAEMON', 'search_interval_minutes', fallback=60) * 60
+        self.slow_page_seconds = config.getfloat('DAEMON', 'slow_page_seconds', fallback=20)
+        self.max_attempts = config.getint('DAEMON', 'max_attempts', fallback=3)
+        self.queue = WorkQueue(config.get('DAEMON', 'queue_db', fallback='').strip() or automator.job_store.path)
+        self.limiter = RateLimiter(
+            per_hour=config.getint('DAEMON', 'applications_per_hour', fallback=10),
+            per_day=config.getint('DAEMON', 'applications_per_day', fallback=50),
+            burst=config.getint('DAEMON', 'burst', fallback=2),
+            history=automator.job_store.applied_since(time.time() - 86400)
+        )
+        self.backoff = Backoff(
+            initial=config.getfloat('DAEMON', 'backoff_initial_seconds', fallback=60),
+            maximum=config.getfloat('DAEMON', 'backoff_max_seconds', fallback=1800)
+        )
+        self.next_search = 0
+
+    def run(self):
+        """Run until interrupted"""
+        automator = self.automator
+        automator.keep_workers = True
+        try:
+            if not automator.login():
+                print("Login failed. Exiting...")
+                return
+            while True:
+                if time.time() >= self.next_search:
+                    self.discover()
+                    self.next_search = time.time() + self.search_interval
+                wait = self.drain()
+                self.flush_trace()
+                wait = min(wait, max(0.0, self.next_search - time.time()))
+                if wait > 0:
+                    print(f"Daemon idle for {wait:.0f}s ({self.queue.pending_count()} jobs queued)")
+                    time.sleep(wait)
+        except KeyboardInterrupt:
+            print("Stopping daemon...")
+        finally:
+            self.queue.close()
+            automator.close()
+
+    def flush_trace(self):
+        """Write this cycle's spans out so a process running for days does not keep them all in memory"""
+        try:
+            self.automator.tracer.flush()
+        except OSError as e:
+            print(f"Could not write trace: {str(e)}")
+
+    def ensure_browser(self):
+        """Restart the browser and log in again if the session died"""
+        automator = self.automator
+        if automator.is_session_active():
+            return True
+        try:
+            automator.restart_session()
+            return True
+        except Exception as e:
+            print(f"Could not restart the browser: {str(e)}")
+            return False
+
+    def discover(self):
+        """Run every search, score the listings and put new ones on the queue"""
+        if not self.ensure_browser():
+            self.backoff.fail()
+            return
+        automator = self.automator
+        print("Running scheduled search...")
+        candidates = automator.run_searches(collect=True, max_applications=float('inf'))
+        added = 0
+        details = automator.page_cache.fields_for(key for key, _, _, _ in candidates) if automator.page_cache and candidates else None
+        for score, (key, card, keyword, location) in automator.scorer.rank(candidates, details) if candidates else []:
+            if score < automator.min_score:
+                break
+            if self.queue.enqueue(key, card.href, card.title, card.company, keyword, location, score,
+                                  card.experience, card.salary, card.posted):
+                added += 1
+        # Every listing worth applying to is now on the queue, so the searches' watermarks can move
+        automator.advance_watermarks()
+        print(f"Queued {added} new jobs ({self.queue.pending_count()} pending)")
+
+    def drain(self):
+        """Apply to queued jobs while the quotas allow; returns seconds to sleep afterwards"""
+        automator = self.automator
+        while True:
+            wait = max(self.limiter.delay(), self.backoff.remaining())
+            if wait > 0:
+                return wait
+            item = self.queue.next_ready()
+            if item is None:
+                ready_in = self.queue.seconds_until_ready()
+                return self.search_interval if ready_in is None else max(1.0, ready_in)
+            if automator.job_store.is_applied(item['key']):
+                self.queue.complete(item['key'], SKIPPED)
+                continue
+            if not self.ensure_browser():
+                return self.backoff.fail()
+
+            # Rebuild the listing card as collected so card_hash matches its page cache entry
+            card = JobCard(item['key'], item['title'], item['company'], item['url'],
+                           item['experience'], item['salary'], item['posted'])
+            start_time = time.perf_counter()
+            try:
+                with automator.tracer.span("job", job_id=item['key'], title=item['title'], score=round(item['score'], 3)):
+                    applied = automator.apply_to_job(card, item['key'], item['keyword'], item['location'])
+            except Exception as e:
+                delay = self.backoff.fail()
+                print(f"Error applying to {item['title']}: {str(e)}; backing off {delay:.0f}s")
+                self.queue.retry(item['key'], delay, self.max_attempts)
+                continue
+            elapsed = time.perf_counter() - start_time
+
+            if automator.page_blocked():
+                delay = self.backoff.fail()
+                print(f"Site is rejecting requests, backing off {delay:.0f}s")
+                if not applied:
+                    self.queue.retry(item['key'], delay, self.max_attempts)
+                    continue
+            elif elapsed > self.slow_page_seconds:
+                delay = self.backoff.fail()
+                print(f"Site is slow ({elapsed:.1f}s for one job), backing off {delay:.0f}s")
+            else:
+                self.backoff.reset()
+
+            self.queue.complete(item['key'], APPLIED if applied else SKIPPED)
+            if applied:
+                self.limiter.consume()
+            automator.check_browser_memory()
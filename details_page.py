@@ -0,0 +1,110 @@
+"""Single-pass classification of a job details page.
+
+One script call reads how the page offers to apply (a normal Apply
+button, a redirect to the company site, an already-applied state or a
+screening questionnaire), returns the exact control to click and the
+fields stored in the page cache. Polling it replaces racing a list of
+broad Apply selectors and checking each match with extra round trips.
+"""
+from collections import namedtuple
+
+# How the details page offers to apply
+APPLY = "apply"
+EXTERNAL = "external"
+ALREADY_APPLIED = "applied"
+QUESTIONNAIRE = "questionnaire"
+NO_APPLY = "none"
+
+# Apply types the bot cannot act on, with the reason printed when a job is skipped
+SKIP_REASONS = {
+    EXTERNAL: "applies on the company site",
+    ALREADY_APPLIED: "already applied",
+    QUESTIONNAIRE: "needs a screening questionnaire",
+    NO_APPLY: "no apply button"
+}
+NOT_ACTIONABLE = set(SKIP_REASONS)
+
+# Elements that can carry the apply state; the innermost clickable one is acted on
+APPLY_CANDIDATES = ("button, a, [role='button'], input[type='submit'], [id*='apply'], [class*='apply'], "
+                    "[data-cy*='apply']")
+QUESTIONNAIRE_MARKERS = "[class*='chatbot'], [class*='questionnaire'], [id*='questionnaire'], [class*='screening']"
+
+# Arguments: include the page text (for the page cache), the site's host name.
+# Returns [apply type, apply text, element to click, confirm button, skills, experience, salary, page text]
+CLASSIFY_DETAILS_SCRIPT = """
+const [includeText, siteHost, candidates, questionnaireMarkers] = arguments;
+
+function visible(node) {
+    return node.getClientRects().length > 0 && getComputedStyle(node).visibility !== 'hidden';
+}
+function textOf(node) {
+    return node ? (node.innerText || node.value || node.getAttribute('aria-label') || node.textContent || '').trim() : '';
+}
+function firstText(selectors) {
+    for (const selector of selectors) {
+        const text = textOf(document.querySelector(selector));
+        if (text) return text;
+    }
+    return '';
+}
+function offSite(node) {
+    if (node.tagName !== 'A' || !/^https?:/.test(node.href || '')) return false;
+    const host = new URL(node.href).host.replace(/^www\\./, '');
+    return siteHost && host !== siteHost && !host.endsWith('.' + siteHost);
+}
+
+let applied = null, external = null, apply = null, confirm = null;
+for (const node of document.querySelectorAll(candidates)) {
+    if (!visible(node) || node.querySelector("button, a, [role='button']")) continue;
+    const text = textOf(node).toLowerCase();
+    if (!text || text.length > 40) continue;
+    if (!confirm && !node.disabled && /^(confirm|submit)\\b/.test(text)) confirm = node;
+    if (!text.includes('appl')) continue;
+    if (/^applied\\b|already applied/.test(text)) { applied = applied || node; continue; }
+    if (/company('s)? (site|website)/.test(text) || (/\\bapply\\b/.test(text) && offSite(node))) {
+        external = external || node;
+        continue;
+    }
+    if (!apply && !node.disabled && /\\bapply\\b/.test(text)) apply = node;
+}
+const questionnaire = Array.from(document.querySelectorAll(questionnaireMarkers)).some(visible);
+
+let type = 'none', target = null;
+if (applied) { type = 'applied'; target = applied; }
+else if (questionnaire) { type = 'questionnaire'; }
+else if (external) { type = 'external'; target = external; }
+else if (apply) { type = 'apply'; target = apply; }
+
+const skills = Array.from(new Set(Array.from(document.querySelectorAll(
+    "[class*='key-skill'] a, [class*='key-skill'] span, .chip, [data-cy='key-skills'] a"
+)).map(textOf).filter(Boolean)));
+const main = document.querySelector("[class*='job-desc'], .job-description, main") || document.body;
+return [
+    type,
+    textOf(target).toLowerCase(),
+    target,
+    confirm,
+    skills,
+    firstText(["[class*='exp'] span", "[data-cy='experience']", ".exp"]),
+    firstText(["[class*='salary'] span", "[data-cy='salary']", ".salary"]),
+    includeText ? textOf(main) : null
+];
+"""
+
+# One classified details page; fields are what the page cache stores
+DetailsPage = namedtuple('DetailsPage', ['apply_type', 'button', 'confirm', 'fields', 'text'])
+
+
+def classify_details(driver, site_host='', include_text=False):
+    """Classify the details page open in `driver` with a single script call"""
+    apply_type, apply_text, button, confirm, skills, experience, salary, text = driver.execute_script(
+        CLASSIFY_DETAILS_SCRIPT, include_text, site_host, APPLY_CANDIDATES, QUESTIONNAIRE_MARKERS
+    )
+    fields = {
+        'skills': skills,
+        'experience': experience,
+        'salary': salary,
+        'apply_type': apply_type,
+        'apply_text': apply_text
+    }
+    return DetailsPage(apply_type, button, confirm, fields, text)
@@ -0,0 +1,239 @@
+"""Local stand-in for naukri.com used for offline runs and benchmarks.
+
+Serves synthetic but structurally faithful pages: a login page with a
+"Continue with Google" button, a fake OAuth step, search results with
+pagination and filter dropdowns, and job details pages with Apply and
+Confirm buttons. Point `base_url` in config.ini at the printed address.
+
+    python fixture_server.py --port 8123 --latency 50
+"""
+import argparse
+import hashlib
+import html
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+
+JOBS_PER_PAGE = 20
+TOTAL_PAGES = 5
+
+COMPANIES = ["Acme Labs", "Globex", "Initech", "Umbrella Systems", "Hooli", "Stark Digital", "Wayne Tech", "Cyberdyne"]
+ROLES = ["Software Engineer", "Backend Developer", "Python Developer", "Full Stack Engineer", "Data Engineer", "QA Engineer"]
+POSTED = ["Just now", "Few hours ago", "1 Day Ago", "2 Days Ago", "5 Days Ago", "30+ Days Ago"]
+
+SEARCH_PATH_PATTERN = re.compile(r"^/(?P<keyword>[^/]+?)-jobs(?:-in-(?P<location>[^/]+?))?(?:-(?P<page>\d+))?$")
+DETAILS_PATH_PATTERN = re.compile(r"^/job-listings-[^/]*-(?P<job_id>\d{9,})$")
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<style>.dropdown ul {{ display: none; }} .dropdown.open ul {{ display: block; }} .hidden {{ display: none; }}</style>
+</head><body>{body}</body></html>"""
+
+
+def stable_number(*parts):
+    """Deterministic integer derived from the given strings"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return int(digest[:12], 16)
+
+
+def job_for(keyword, location, page, index):
+    """Synthesize one job posting; the same query always yields the same jobs"""
+    number = stable_number(keyword.lower(), location.lower(), page, index)
+    job_id = str(100000000000 + number % 900000000000)
+    role = ROLES[number % len(ROLES)]
+    min_exp = number % 6
+    min_salary = 2 + number % 10
+    return {
+        'id': job_id,
+        'title': f"{role} - {keyword.title()}",
+        'company': COMPANIES[(number // 7) % len(COMPANIES)],
+        'location': location.title() or "Remote",
+        'experience': f"{min_exp}-{min_exp + 3} Yrs",
+        'salary': f"{min_salary}-{min_salary + 4} Lacs PA",
+        'posted': POSTED[(number // 11) % len(POSTED)],
+        'slug': re.sub(r"[^a-z0-9]+", "-", f"{role} {COMPANIES[(number // 7) % len(COMPANIES)]}".lower()).strip('-')
+    }
+
+
+def apply_type_for(job_id):
+    """Most fixture jobs are easy-apply; a few redirect to the company site or are already applied"""
+    bucket = int(job_id) % 10
+    if bucket == 0:
+        return "external"
+    if bucket == 1:
+        return "applied"
+    return "easy"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    server_version = "NaukriFixture/1.0"
+
+    def log_message(self, format, *args):
+        if getattr(self.server, 'verbose', False):
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.request_count += 1
+
+        parts = urlsplit(self.path)
+        path = unquote(parts.path).rstrip('/') or '/'
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+
+        if path == '/':
+            return self.send_page("Jobs - Recruitment - Job Search", self.home_page())
+        if path == '/nlogin/login':
+            return self.send_page("Login", self.login_page())
+        if path == '/oauth/google':
+            return self.send_page("Sign in - Google Accounts", self.oauth_page())
+        if path == '/mnjuser/homepage':
+            if 'fixture_session=1' not in self.headers.get('Cookie', ''):
+                return self.send_redirect('/nlogin/login')
+            return self.send_page("Mynaukri - Home", "<h1>Welcome back</h1><a href='/'>Search jobs</a>")
+        if path == '/jobs':
+            return self.send_results(query.get('k', ''), query.get('l', ''), int(query.get('pageNo', 1)))
+
+        match = DETAILS_PATH_PATTERN.match(path)
+        if match:
+            return self.send_page("Job Details", self.details_page(match.group('job_id')))
+
+        match = SEARCH_PATH_PATTERN.match(path)
+        if match:
+            keyword = match.group('keyword').replace('-', ' ')
+            location = (match.group('location') or query.get('l', '')).replace('-', ' ')
+            page = int(match.group('page') or query.get('pageNo', 1))
+            return self.send_results(keyword, location, page)
+
+        self.send_error(404)
+
+    def send_page(self, title, body, status=200):
+        content = PAGE_TEMPLATE.format(title=html.escape(title), body=body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def send_redirect(self, location):
+        self.send_response(302)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def home_page(self):
+        return """
+<form action="/jobs" method="get" class="qsb">
+  <input id="qsb-keyword-sugg" name="k" class="suggestor-input" placeholder="Enter keyword / designation / companies">
+  <input id="qsb-location-sugg" name="l" class="suggestor-input" placeholder="Enter location">
+  <button type="submit" class="qsb-search-button">Search</button>
+</form>"""
+
+    def login_page(self):
+        return """
+<h1>Login</h1>
+<button id="google-login" class="google-btn" onclick="location.href='/oauth/google'">Continue with Google</button>"""
+
+    def oauth_page(self):
+        # No password step: clicking Next signs straight in
+        return """
+<input type="email" id="identifierId">
+<button id="identifierNext" onclick="document.cookie='fixture_session=1; path=/'; location.href='/mnjuser/homepage'">Next</button>"""
+
+    def send_results(self, keyword, location, page):
+        page = max(1, page)
+        keyword = keyword.strip() or "jobs"
+        jobs = [job_for(keyword, location, page, index) for index in range(JOBS_PER_PAGE)]
+        cards = "\n".join(self.job_card(job) for job in jobs)
+        start = (page - 1) * JOBS_PER_PAGE + 1
+
+        if page < TOTAL_PAGES:
+            base = f"/{keyword.replace(' ', '-')}-jobs" + (f"-in-{location.replace(' ', '-')}" if location else "")
+            pagination = f"<a class='fright' href='{html.escape(base)}-{page + 1}'>Next</a>"
+        else:
+            pagination = "<a class='fright disabled' aria-disabled='true'>Next</a>"
+
+        body = f"""
+<h1>{html.escape(keyword.title())} Jobs In {html.escape(location.title())}</h1>
+<span class="count-string" data-cy="count-string">{start} - {start + len(jobs) - 1} of {JOBS_PER_PAGE * TOTAL_PAGES} results</span>
+<div class="filters">
+  <div class="dropdown" onclick="this.classList.toggle('open')"><span data-cy="date-filter">Date Posted</span>
+    <ul><li>Last 24 hours</li><li>Last 3 days</li><li>Last 7 days</li></ul></div>
+  <div class="dropdown" onclick="this.classList.toggle('open')"><span data-cy="experience-filter">Experience</span>
+    <ul><li>0-1 years</li><li>1-2 years</li><li>2-5 years</li></ul></div>
+  <div class="dropdown" onclick="this.classList.toggle('open')"><span data-cy="salary-filter">Salary</span>
+    <ul><li>0-3 Lakhs</li><li>2-3 Lakhs</li><li>3-6 Lakhs</li></ul></div>
+</div>
+<div class="list">{cards}</div>
+<div class="pagination">{pagination}</div>"""
+        self.send_page(f"{keyword} jobs", body)
+
+    def job_card(self, job):
+        href = f"/job-listings-{job['slug']}-{job['id']}"
+        return f"""
+<article class="jobTuple" data-job-id="{job['id']}">
+  <a class="title" href="{href}" title="{html.escape(job['title'])}">{html.escape(job['title'])}</a>
+  <div class="subTitle"><a class="compName">{html.escape(job['company'])}</a></div>
+  <span class="expwdth">{job['experience']}</span>
+  <span class="sal-wrap"><span class="ellipsis">{job['salary']}</span></span>
+  <span class="location">{html.escape(job['location'])}</span>
+  <span class="job-post-day">{job['posted']}</span>
+</article>"""
+
+    def details_page(self, job_id):
+        apply_type = apply_type_for(job_id)
+        if apply_type == "external":
+            actions = "<button id='company-site-button' class='company-site-button'>Apply on company site</button>"
+        elif apply_type == "applied":
+            actions = "<span id='already-applied' class='already-applied'>Applied</span>"
+        else:
+            actions = """
+<button id="apply-button" class="apply-button" onclick="document.getElementById('confirm').classList.remove('hidden')">Apply</button>
+<div id="confirm" class="hidden"><button onclick="this.parentNode.innerHTML='Applied successfully'">Confirm</button></div>"""
+        return f"""
+<h1 class="jd-header-title">Job {job_id}</h1>
+<section class="job-desc">
+  <div class="key-skill"><a><span>Python</span></a><a><span>Selenium</span></a><a><span>SQL</span></a></div>
+  <p>We are hiring. Apply now.</p>
+</section>
+<div class="apply-button-container">{actions}</div>"""
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, verbose=False):
+        super().__init__(address, FixtureHandler)
+        self.latency = latency
+        self.verbose = verbose
+        self.request_count = 0
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_fixture_server(port=0, latency=0.0, verbose=False):
+    """Start the fixture server on a background thread and return it"""
+    server = FixtureServer(('127.0.0.1', port), latency=latency, verbose=verbose)
+    thread = threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Naukri-like fixture pages locally")
+    parser.add_argument('--port', type=int, default=8123)
+    parser.add_argument('--latency', type=float, default=0.0, help="Artificial delay per request in milliseconds")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    server = FixtureServer(('127.0.0.1', args.port), latency=args.latency / 1000.0, verbose=args.verbose)
+    print(f"Fixture site running at {server.base_url} (set base_url = {server.base_url} in config.ini)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,64 @@
+"""Browser-free listing discovery.
+
+Fetches search results pages with a pooled HTTP session that carries the
+cookies of the logged-in WebDriver session, and parses them locally. Only
+the job URLs found here are handed to the browser for the Apply step.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from listing_extraction import listing_page_url
+from listing_parser import parse_listing
+
+
+class HttpDiscovery:
+    """Pooled HTTP client that lists jobs without rendering pages"""
+
+    def __init__(self, cookies=(), user_agent=None, pool_size=4, timeout=15):
+        self.timeout = timeout
+        self.session = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+        self.session.headers['Accept'] = 'text/html,application/xhtml+xml'
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+        self.request_count = 0
+
+    @classmethod
+    def from_driver(cls, driver, pool_size=4, timeout=15):
+        """Create a client that reuses a WebDriver session's cookies and user agent"""
+        return cls(
+            cookies=driver.get_cookies(),
+            user_agent=driver.execute_script("return navigator.userAgent"),
+            pool_size=pool_size,
+            timeout=timeout
+        )
+
+    def fetch_listing(self, url):
+        """Fetch and parse one results page; returns (final_url, ListingPage)"""
+        response = self.session.get(url, timeout=self.timeout)
+        self.request_count += 1
+        response.raise_for_status()
+        return response.url, parse_listing(response.text, response.url)
+
+    def iter_listing_pages(self, first_url, first_listing, max_pages):
+        """Yield (page, ListingPage) for a search, following pagination by URL"""
+        listing = first_listing
+        for page in range(1, max_pages + 1):
+            if page > 1:
+                _, listing = self.fetch_listing(next_href or listing_page_url(first_url, page))
+            yield page, listing
+            if not listing.has_next:
+                print("No more pages available")
+                return
+            next_href = listing.next_href
+
+    def close(self):
+        self.session.close()
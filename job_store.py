@@ -0,0 +1,198 @@
+import re
+import sqlite3
+import threading
+import time
+
+SEEN = "seen"
+APPLIED = "applied"
+
+# Postings are listed with day granularity ("3 Days Ago"), so dates within a day count as equal
+POSTED_SLACK = 86400
+
+# Naukri detail URLs end in a numeric job id, e.g. .../job-listings-python-developer-acme-1-to-3-years-140325001234
+JOB_ID_PATTERN = re.compile(r"-(\d{9,})(?:[/?#]|$)")
+
+
+def job_key(job_id=None, url=None):
+    """Build a stable dedup key from a Naukri job id, falling back to the detail URL"""
+    if job_id:
+        return str(job_id).strip()
+    if not url:
+        return None
+    match = JOB_ID_PATTERN.search(url)
+    if match:
+        return match.group(1)
+    # Strip tracking parameters so the same posting maps to one key
+    return url.split('?')[0].split('#')[0].rstrip('/')
+
+
+def behind_watermark(newest_posted_at, posted_at=None):
+    """Check whether a posting is no newer than a query's watermark, with a day of slack.
+
+    Job ids are not compared: they start with a DDMMYY date, so they do not sort by age.
+    """
+    if newest_posted_at is None or posted_at is None:
+        return False
+    return posted_at + POSTED_SLACK < newest_posted_at
+
+
+class JobStore:
+    """On-disk record of seen and applied jobs with an in-memory index for fast dedup"""
+
+    def __init__(self, path="applied_jobs.db", revisit_seen=False):
+        self.path = path
+        self.revisit_seen = revisit_seen
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_key TEXT PRIMARY KEY,
+                url TEXT,
+                title TEXT,
+                company TEXT,
+                status TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                applied_at REAL
+            )
+        """)
+        # Newest posting seen per keyword x location, so incremental runs can stop paginating early
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS watermarks (
+                query TEXT PRIMARY KEY,
+                newest_posted_at REAL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._drop_watermark_job_ids()
+        self.connection.commit()
+
+        # Load the whole index up front so listings can be skipped without touching the browser
+        self.index = dict(self.connection.execute("SELECT job_key, status FROM jobs"))
+        self.claimed = set()
+
+    def _drop_watermark_job_ids(self):
+        # Databases from before watermarks compared posting dates only still carry a newest_job_id column;
+        # the table is rebuilt rather than using DROP COLUMN, which needs SQLite 3.35
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(watermarks)")]
+        if 'newest_job_id' not in columns:
+            return
+        self.connection.executescript("""
+            BEGIN;
+            CREATE TABLE watermarks_new (
+                query TEXT PRIMARY KEY,
+                newest_posted_at REAL,
+                updated_at REAL NOT NULL
+            );
+            INSERT INTO watermarks_new (query, newest_posted_at, updated_at)
+                SELECT query, newest_posted_at, updated_at FROM watermarks;
+            DROP TABLE watermarks;
+            ALTER TABLE watermarks_new RENAME TO watermarks;
+            COMMIT;
+        """)
+
+    def __len__(self):
+        return len(self.index)
+
+    def is_known(self, key):
+        """Check whether a job was recorded (seen or applied) in an earlier run"""
+        return key in self.index
+
+    def is_applied(self, key):
+        """Check whether a job was applied to in this or an earlier run"""
+        return self.index.get(key) == APPLIED
+
+    def should_skip(self, key):
+        """Check whether a job can be skipped before opening it"""
+        if key is None:
+            return False
+        with self.lock:
+            return self._should_skip(key)
+
+    def _should_skip(self, key):
+        if key in self.claimed:
+            return True
+        status = self.index.get(key)
+        if status == APPLIED:
+            return True
+        return status == SEEN and not self.revisit_seen
+
+    def claim(self, key):
+        """Return True if the caller should process this job in the current run.
+
+        Claiming is atomic, so the same posting found by two workers or two
+        keyword/location pairs is only processed once.
+        """
+        if key is None:
+            return True
+        with self.lock:
+            if self._should_skip(key):
+                return False
+            self.claimed.add(key)
+            return True
+
+    def mark_seen(self, key, url="", title="", company=""):
+        """Record a job whose details page was checked but not applied to"""
+        if key is None:
+            return
+        with self.lock:
+            self._upsert(key, url, title, company, SEEN)
+
+    def mark_applied(self, key, url="", title="", company=""):
+        """Record a successful application"""
+        if key is None:
+            return
+        with self.lock:
+            self._upsert(key, url, title, company, APPLIED)
+
+    def _upsert(self, key, url, title, company, status):
+        now = time.time()
+        applied_at = now if status == APPLIED else None
+        self.connection.execute("""
+            INSERT INTO jobs (job_key, url, title, company, status, first_seen, last_seen, applied_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(job_key) DO UPDATE SET
+                url = COALESCE(NULLIF(excluded.url, ''), url),
+                title = COALESCE(NULLIF(excluded.title, ''), title),
+                company = COALESCE(NULLIF(excluded.company, ''), company),
+                status = CASE WHEN status = 'applied' THEN status ELSE excluded.status END,
+                last_seen = excluded.last_seen,
+                applied_at = COALESCE(applied_at, excluded.applied_at)
+        """, (key, url, title, company, status, now, now, applied_at))
+        self.connection.commit()
+        if self.index.get(key) != APPLIED:
+            self.index[key] = status
+
+    def applied_since(self, timestamp):
+        """Return the application times recorded after `timestamp`"""
+        with self.lock:
+            return [applied_at for (applied_at,) in self.connection.execute(
+                "SELECT applied_at FROM jobs WHERE applied_at > ? ORDER BY applied_at", (timestamp,)
+            )]
+
+    def get_watermark(self, query):
+        """Return the newest posting date recorded for a query, or None"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT newest_posted_at FROM watermarks WHERE query = ?", (query,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def update_watermark(self, query, newest_posted_at=None):
+        """Move a query's watermark forward; it never moves back"""
+        if newest_posted_at is None:
+            return
+        with self.lock:
+            self.connection.execute("""
+                INSERT INTO watermarks (query, newest_posted_at, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(query) DO UPDATE SET
+                    newest_posted_at = MAX(COALESCE(newest_posted_at, excluded.newest_posted_at), excluded.newest_posted_at),
+                    updated_at = excluded.updated_at
+            """, (query, newest_posted_at, time.time()))
+            self.connection.commit()
+
+    def close(self):
+        """Flush and close the database"""
+        with self.lock:
+            self.connection.close()
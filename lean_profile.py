@@ -0,0 +1,184 @@
+"""Lean browser profile: blocked resources and per-page traffic accounting.
+
+Images, media, fonts and known tracker domains are blocked through the
+DevTools Network domain, and the Chrome performance log is read back to
+count the requests and bytes each page loaded or was spared.
+"""
+import json
+from collections import Counter, OrderedDict
+from selenium.common.exceptions import WebDriverException
+
+IMAGE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp", "*.avif"]
+MEDIA_PATTERNS = ["*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav", "*.m4a", "*.mov"]
+FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+
+TRACKER_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+    "moengage.com",
+    "webengage.com",
+    "clevertap.com",
+    "branch.io",
+    "newrelic.com",
+    "nr-data.net"
+]
+
+# Pages listed individually in the traffic summary; older ones only count towards the totals
+MAX_LISTED_PAGES = 100
+# Requests still waiting for their loadingFinished event; older ones are dropped past this
+MAX_PENDING_REQUESTS = 5000
+
+# Typical transfer sizes used to estimate savings when no request of that type was loaded
+DEFAULT_RESOURCE_SIZES = {
+    'Image': 25000,
+    'Media': 400000,
+    'Font': 35000,
+    'Script': 45000,
+    'XHR': 3000,
+    'Fetch': 3000,
+    'Document': 30000,
+    'Stylesheet': 20000,
+    'Other': 5000
+}
+
+
+def blocked_url_patterns(images=True, media=True, fonts=True, trackers=True, extra=()):
+    """Build the URL patterns passed to Network.setBlockedURLs"""
+    patterns = []
+    if images:
+        patterns.extend(IMAGE_PATTERNS)
+    if media:
+        patterns.extend(MEDIA_PATTERNS)
+    if fonts:
+        patterns.extend(FONT_PATTERNS)
+    if trackers:
+        patterns.extend(f"*://*.{domain}/*" for domain in TRACKER_DOMAINS)
+        patterns.extend(f"*://{domain}/*" for domain in TRACKER_DOMAINS)
+    patterns.extend(pattern.strip() for pattern in extra if pattern.strip())
+    return patterns
+
+
+def apply_blocking(driver, patterns):
+    """Block matching requests in the WebDriver tab"""
+    if not patterns:
+        return
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+
+
+class TrafficMeter:
+    """Tallies loaded and blocked requests per document from Chrome's performance log"""
+
+    def __init__(self):
+        self.requests = {}
+        self.pages = OrderedDict()
+        # Pages moved out of self.pages, folded into one entry so long runs stay bounded
+        self.earlier = {'pages': 0, 'requests': 0, 'bytes': 0, 'blocked': Counter()}
+        self.loaded_sizes = {}
+
+    def _page(self, document_url):
+        page = self.pages.get(document_url)
+        if page is None:
+            page = self.pages[document_url] = {'requests': 0, 'bytes': 0, 'blocked': Counter()}
+            while len(self.pages) > MAX_LISTED_PAGES:
+                self._fold_earlier(self.pages.popitem(last=False)[1])
+        return page
+
+    def _fold_earlier(self, page, pages=1):
+        self.earlier['pages'] += pages
+        self.earlier['requests'] += page['requests']
+        self.earlier['bytes'] += page['bytes']
+        self.earlier['blocked'].update(page['blocked'])
+
+    def collect(self, driver):
+        """Drain the performance log and attribute its network events to their page"""
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                document_url = params.get('documentURL')
+                if document_url and not document_url.startswith('data:'):
+                    self.requests[params['requestId']] = (document_url, params.get('type', 'Other'))
+                    if len(self.requests) > MAX_PENDING_REQUESTS:
+                        # Requests cut off by a navigation never finish; forget the oldest
+                        self.requests.pop(next(iter(self.requests)))
+            elif method == 'Network.loadingFinished':
+                document_url, resource_type = self.requests.pop(params.get('requestId'), (None, None))
+                if document_url is None:
+                    continue
+                size = params.get('encodedDataLength', 0)
+                page = self._page(document_url)
+                page['requests'] += 1
+                page['bytes'] += size
+                total, count = self.loaded_sizes.get(resource_type, (0, 0))
+                self.loaded_sizes[resource_type] = (total + size, count + 1)
+            elif method == 'Network.loadingFailed':
+                document_url, resource_type = self.requests.pop(params.get('requestId'), (None, None))
+                if document_url is not None and params.get('blockedReason'):
+                    self._page(document_url)['blocked'][resource_type] += 1
+
+    def estimated_size(self, resource_type):
+        total, count = self.loaded_sizes.get(resource_type, (0, 0))
+        if count:
+            return total / count
+        return DEFAULT_RESOURCE_SIZES.get(resource_type, DEFAULT_RESOURCE_SIZES['Other'])
+
+    def saved_bytes(self, page):
+        return sum(self.estimated_size(resource_type) * count for resource_type, count in page['blocked'].items())
+
+    def merge(self, other):
+        """Fold in the pages measured by another worker's meter"""
+        for document_url, page in other.pages.items():
+            mine = self._page(document_url)
+            mine['requests'] += page['requests']
+            mine['bytes'] += page['bytes']
+            mine['blocked'].update(page['blocked'])
+        self._fold_earlier(other.earlier, other.earlier['pages'])
+        for resource_type, (total, count) in other.loaded_sizes.items():
+            my_total, my_count = self.loaded_sizes.get(resource_type, (0, 0))
+            self.loaded_sizes[resource_type] = (my_total + total, my_count + count)
+
+    def print_summary(self):
+        """Print requests and bytes loaded versus blocked, per page and in total"""
+        if not self.pages:
+            return
+        every = list(self.pages.values()) + [self.earlier]
+        print("\nTraffic summary (lean profile):")
+        print(f"{'page':<60}{'requests':>9}{'KB':>9}{'blocked':>9}{'~KB saved':>11}")
+        for document_url, page in self.pages.items():
+            blocked = sum(page['blocked'].values())
+            print(f"{document_url[:59]:<60}{page['requests']:>9}{page['bytes'] / 1024:>9.1f}"
+                  f"{blocked:>9}{self.saved_bytes(page) / 1024:>11.1f}")
+        if self.earlier['pages']:
+            print(f"(and {self.earlier['pages']} earlier pages, counted in the totals below)")
+        pages = len(self.pages) + self.earlier['pages']
+        requests = sum(page['requests'] for page in every)
+        loaded = sum(page['bytes'] for page in every)
+        blocked = sum(sum(page['blocked'].values()) for page in every)
+        saved = sum(self.saved_bytes(page) for page in every)
+        print(f"{pages} pages: {requests} requests / {loaded / 1024:.1f} KB loaded, "
+              f"{blocked} requests / ~{saved / 1024:.1f} KB blocked "
+              f"(per page: {blocked / pages:.1f} requests, ~{saved / pages / 1024:.1f} KB saved)")
@@ -0,0 +1,235 @@
+import re
+from collections import namedtuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from selenium.webdriver.common.by import By
+
+# Multiple selectors for job listings on a search results page
+JOB_LISTING_SELECTORS = [
+    (By.XPATH, "//article[contains(@class,'jobTuple')]"),
+    (By.CSS_SELECTOR, ".jobTuple"),
+    (By.XPATH, "//div[contains(@class, 'srp-jobtuple-wrapper')]"),
+    (By.CSS_SELECTOR, ".srp-jobtuple-wrapper"),
+    (By.XPATH, "//div[contains(@class, 'result')]"),
+    (By.CSS_SELECTOR, "[data-job-id]"),
+    (By.XPATH, "//div[contains(@class, 'job-tile')]"),
+    (By.XPATH, "//div[@class='row'][.//a[contains(@class,'title')]]")
+]
+
+# Field selectors, evaluated relative to each job card (CSS)
+TITLE_LINK_SELECTORS = [
+    "a.title",
+    ".title a",
+    "[data-cy='job-title']",
+    "a[title]",
+    ".jobTupleHeader a",
+    ".row1 a",
+    "h3 a",
+    ".jobtitle a"
+]
+
+COMPANY_SELECTORS = [
+    ".compName",
+    ".company-name",
+    "[data-cy='company-name']",
+    ".subTitle a",
+    ".row2 .ellipsis",
+    ".org a",
+    ".comp-name",
+    "a.comp-name"
+]
+
+EXPERIENCE_SELECTORS = [
+    ".expwdth",
+    ".exp-wrap .ellipsis",
+    ".experience",
+    "[data-cy='experience']",
+    ".exp span"
+]
+
+SALARY_SELECTORS = [
+    ".sal-wrap .ellipsis",
+    ".salary",
+    "[data-cy='salary']",
+    ".sal span"
+]
+
+POSTED_SELECTORS = [
+    ".job-post-day",
+    ".postedDate",
+    "[data-cy='posted-date']",
+    ".jobTupleFooter .fleft span",
+    ".type span"
+]
+
+# Multiple selectors for the pagination "Next" link
+NEXT_PAGE_SELECTORS = [
+    (By.XPATH, "//a[contains(@class,'fright') and contains(text(),'Next')]"),
+    (By.CSS_SELECTOR, ".pagination-next"),
+    (By.XPATH, "//a[contains(text(), 'Next')]"),
+    (By.CSS_SELECTOR, "[data-cy='next-page']"),
+    (By.XPATH, "//a[@aria-label='Next']"),
+    (By.CSS_SELECTOR, "a[aria-label='Next']")
+]
+
+# Result count banner ("1 - 20 of 4532 Jobs"), checked instead of scanning the page source
+RESULT_COUNT_SELECTORS = [
+    ".count-string",
+    "[data-cy='count-string']",
+    ".sortAndH1Cont .fleft span",
+    "#jobs-count"
+]
+RESULT_COUNT_LOCATORS = [(By.CSS_SELECTOR, selector) for selector in RESULT_COUNT_SELECTORS]
+RESULT_COUNT_PATTERN = re.compile(r"\d[\d,]*")
+
+# Returns the text of the first non-empty count banner; argument: RESULT_COUNT_SELECTORS
+RESULT_COUNT_SCRIPT = """
+for (const selector of arguments[0]) {
+    const node = document.querySelector(selector);
+    if (node && node.textContent.trim()) return node.textContent.trim();
+}
+return null;
+"""
+
+# Compact record for one job card on a results page
+JobCard = namedtuple('JobCard', ['job_id', 'title', 'company', 'href', 'experience', 'salary', 'posted'])
+
+# Everything extracted from one results page
+ListingPage = namedtuple('ListingPage', ['selector', 'cards', 'has_next', 'next_href'])
+
+# Naukri paginates keyword/location pages with a numeric path suffix: /python-jobs-in-pune-2
+PAGE_SUFFIX_PATTERN = re.compile(r"(-jobs(?:-in-[^/]*?)?)-\d+$")
+
+# Evaluates every extraction rule in the page in a single WebDriver round trip.
+# Arguments: card selectors as [type, value] pairs, then the field selector lists.
+EXTRACT_JOB_CARDS_SCRIPT = """
+const [cardSelectors, titleSelectors, companySelectors, experienceSelectors, salarySelectors, postedSelectors, nextSelectors] = arguments;
+
+function queryAll(type, value) {
+    if (type === 'xpath') {
+        const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        const nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        return nodes;
+    }
+    if (type === 'id') {
+        const node = document.getElementById(value);
+        return node ? [node] : [];
+    }
+    return Array.from(document.querySelectorAll(value));
+}
+
+function textOf(node) {
+    return node ? (node.innerText || node.textContent || '').trim() : '';
+}
+
+function firstText(card, selectors) {
+    for (const selector of selectors) {
+        const node = card.querySelector(selector);
+        const text = textOf(node);
+        if (text) return text;
+    }
+    return '';
+}
+
+let cards = [];
+let matched = null;
+for (const [type, value] of cardSelectors) {
+    cards = queryAll(type, value);
+    if (cards.length) {
+        matched = [type, value];
+        break;
+    }
+}
+
+const records = cards.map(card => {
+    let title = '';
+    let href = '';
+    for (const selector of titleSelectors) {
+        const link = card.querySelector(selector);
+        if (!link) continue;
+        title = textOf(link) || link.getAttribute('title') || '';
+        href = link.href || link.getAttribute('href') || '';
+        if (title) break;
+    }
+    const idNode = card.hasAttribute('data-job-id') ? card : card.querySelector('[data-job-id]');
+    return [
+        idNode ? idNode.getAttribute('data-job-id') : '',
+        title,
+        firstText(card, companySelectors),
+        href,
+        firstText(card, experienceSelectors),
+        firstText(card, salarySelectors),
+        firstText(card, postedSelectors)
+    ];
+});
+
+let hasNext = false;
+let nextHref = '';
+for (const [type, value] of nextSelectors) {
+    const next = queryAll(type, value)[0];
+    if (!next) continue;
+    hasNext = !(next.disabled || next.getAttribute('aria-disabled') === 'true' || /disabled/.test(next.className));
+    nextHref = /^https?:/.test(next.href || '') ? next.href : '';
+    break;
+}
+
+return {selector: matched, cards: records, hasNext: hasNext, nextHref: nextHref};
+"""
+
+
+def extract_job_cards(driver):
+    """Extract every job card and the pagination state of the current results page with one script call.
+
+    Returns a ListingPage; its selector is the (type, value) card rule that
+    matched, or None when no rule did.
+    """
+    snapshot = driver.execute_script(
+        EXTRACT_JOB_CARDS_SCRIPT,
+        [list(selector) for selector in JOB_LISTING_SELECTORS],
+        TITLE_LINK_SELECTORS,
+        COMPANY_SELECTORS,
+        EXPERIENCE_SELECTORS,
+        SALARY_SELECTORS,
+        POSTED_SELECTORS,
+        [list(selector) for selector in NEXT_PAGE_SELECTORS]
+    ) or {}
+    cards = [JobCard(*record) for record in snapshot.get('cards') or []]
+    matched = snapshot.get('selector')
+    return ListingPage(
+        tuple(matched) if matched else None,
+        cards,
+        bool(snapshot.get('hasNext')),
+        snapshot.get('nextHref') or None
+    )
+
+
+def parse_result_count(text):
+    """Total from a count banner such as '1 - 20 of 4,532'; None if it holds no number"""
+    numbers = RESULT_COUNT_PATTERN.findall(text or '')
+    if not numbers:
+        return None
+    return int(numbers[-1].replace(',', ''))
+
+
+def result_count(driver):
+    """Read the result count banner in one script call; None when the page has none"""
+    text = driver.execute_script(RESULT_COUNT_SCRIPT, RESULT_COUNT_SELECTORS)
+    return parse_result_count(text)
+
+
+def listing_page_url(url, page):
+    """Build the URL of results page `page` from the URL of any page of the same search"""
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/')
+    query = [(name, value) for name, value in parse_qsl(parts.query) if name != 'pageNo']
+
+    head, _, segment = path.rpartition('/')
+    if '-jobs' in segment:
+        segment = PAGE_SUFFIX_PATTERN.sub(r"\1", segment)
+        if page > 1:
+            segment = f"{segment}-{page}"
+        path = f"{head}/{segment}"
+    elif page > 1:
+        query.append(('pageNo', str(page)))
+
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ''))
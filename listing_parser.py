@@ -0,0 +1,144 @@
+"""Local (browser-free) evaluation of the listing extraction rules.
+
+Parses a results page with lxml and applies the same selector lists that
+listing_extraction runs in the browser, so HTML fetched over plain HTTP
+or loaded from disk yields the same JobCard records.
+"""
+import re
+from functools import lru_cache
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from selenium.webdriver.common.by import By
+from listing_extraction import (
+    JOB_LISTING_SELECTORS,
+    TITLE_LINK_SELECTORS,
+    COMPANY_SELECTORS,
+    EXPERIENCE_SELECTORS,
+    SALARY_SELECTORS,
+    POSTED_SELECTORS,
+    NEXT_PAGE_SELECTORS,
+    JobCard,
+    ListingPage
+)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def parse_document(page_source, page_url=None):
+    """Parse HTML into an lxml tree with absolute links"""
+    document = lxml.html.fromstring(page_source)
+    if page_url:
+        document.make_links_absolute(page_url, resolve_base_href=True)
+    return document
+
+
+@lru_cache(maxsize=512)
+def compiled_xpath(expression):
+    return etree.XPath(expression)
+
+
+@lru_cache(maxsize=512)
+def compiled_css(selector):
+    # Translating CSS to XPath costs far more than evaluating it, so each selector is compiled once
+    return CSSSelector(selector, translator='html')
+
+
+def query_all(root, selector_type, selector_value):
+    """Evaluate one (By, value) locator against an lxml tree"""
+    try:
+        if selector_type == By.XPATH:
+            return [node for node in compiled_xpath(selector_value)(root) if isinstance(node, lxml.html.HtmlElement)]
+        if selector_type == By.ID:
+            return root.xpath("//*[@id=$value]", value=selector_value)
+        if selector_type == By.NAME:
+            return root.xpath("//*[@name=$value]", value=selector_value)
+        if selector_type == By.CLASS_NAME:
+            return root.find_class(selector_value)
+        if selector_type == By.TAG_NAME:
+            return root.xpath(f"//{selector_value}")
+        return compiled_css(selector_value)(root)
+    except Exception:
+        # Mirror the browser, where an unsupported selector simply matches nothing
+        return []
+
+
+def text_of(node):
+    """Visible-ish text of a node with whitespace collapsed"""
+    if node is None:
+        return ''
+    return WHITESPACE_PATTERN.sub(' ', node.text_content()).strip()
+
+
+def first_text(card, selectors):
+    for selector in selectors:
+        for node in query_all(card, By.CSS_SELECTOR, selector)[:1]:
+            text = text_of(node)
+            if text:
+                return text
+    return ''
+
+
+def parse_job_card(card):
+    """Build a JobCard from one card element"""
+    title = ''
+    href = ''
+    for selector in TITLE_LINK_SELECTORS:
+        links = query_all(card, By.CSS_SELECTOR, selector)
+        if not links:
+            continue
+        link = links[0]
+        title = text_of(link) or link.get('title', '')
+        href = link.get('href', '')
+        if title:
+            break
+
+    if card.get('data-job-id') is not None:
+        job_id = card.get('data-job-id')
+    else:
+        id_nodes = compiled_css('[data-job-id]')(card)
+        job_id = id_nodes[0].get('data-job-id') if id_nodes else ''
+
+    return JobCard(
+        job_id or '',
+        title,
+        first_text(card, COMPANY_SELECTORS),
+        href,
+        first_text(card, EXPERIENCE_SELECTORS),
+        first_text(card, SALARY_SELECTORS),
+        first_text(card, POSTED_SELECTORS)
+    )
+
+
+def parse_listing(page_source, page_url=None):
+    """Extract every job card and the pagination state from a results page's HTML"""
+    return listing_from_document(parse_document(page_source, page_url))
+
+
+def listing_from_document(document):
+    """Extract every job card and the pagination state from an already parsed results page"""
+    cards = []
+    matched = None
+    for selector_type, selector_value in JOB_LISTING_SELECTORS:
+        cards = query_all(document, selector_type, selector_value)
+        if cards:
+            matched = (selector_type, selector_value)
+            break
+
+    has_next = False
+    next_href = None
+    for selector_type, selector_value in NEXT_PAGE_SELECTORS:
+        nodes = query_all(document, selector_type, selector_value)
+        if not nodes:
+            continue
+        next_link = nodes[0]
+        has_next = not (
+            next_link.get('disabled') is not None
+            or next_link.get('aria-disabled') == 'true'
+            or 'disabled' in next_link.get('class', '')
+        )
+        href = next_link.get('href', '')
+        next_href = href if href.startswith(('http://', 'https://')) else None
+        break
+
+    return ListingPage(matched, [parse_job_card(card) for card in cards], has_next, next_href)
@@ -0,0 +1,81 @@
+"""Watches the browser's memory so long runs can recycle it before it degrades.
+
+Resident memory is summed over chromedriver's child processes (Chrome's
+browser, renderer and GPU processes) with psutil; the page's JS heap is
+read over CDP. psutil is optional: without it only the heap is checked.
+"""
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+MB = 1024 * 1024
+
+
+class MemorySupervisor:
+    """Decides when a driver has grown past its memory limits"""
+
+    def __init__(self, max_rss_mb=1500, max_heap_mb=512, check_every=5, recycle_every=0):
+        self.max_rss = max_rss_mb * MB if max_rss_mb else None
+        self.max_heap = max_heap_mb * MB if max_heap_mb else None
+        self.check_every = max(1, check_every)
+        self.recycle_every = recycle_every
+        self.jobs_since_start = 0
+        self.peak_rss = 0
+        self.peak_heap = 0
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a supervisor from the [BROWSER] section of config.ini"""
+        return cls(
+            max_rss_mb=config.getfloat('BROWSER', 'max_rss_mb', fallback=1500),
+            max_heap_mb=config.getfloat('BROWSER', 'max_js_heap_mb', fallback=512),
+            check_every=config.getint('BROWSER', 'memory_check_every', fallback=5),
+            recycle_every=config.getint('BROWSER', 'recycle_every_jobs', fallback=0)
+        )
+
+    def browser_rss(self, driver):
+        """Resident memory of every process started by chromedriver, in bytes (None without psutil)"""
+        if psutil is None:
+            return None
+        try:
+            service = psutil.Process(driver.service.process.pid)
+            return sum(child.memory_info().rss for child in service.children(recursive=True))
+        except (AttributeError, psutil.Error):
+            return None
+
+    def js_heap(self, driver):
+        """Used JS heap of the current page in bytes, via CDP Performance.getMetrics"""
+        try:
+            driver.execute_cdp_cmd('Performance.enable', {})
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {}).get('metrics', [])
+        except Exception:
+            return None
+        for metric in metrics:
+            if metric.get('name') == 'JSHeapUsedSize':
+                return metric.get('value')
+        return None
+
+    def job_done(self, driver):
+        """Count one processed job; returns a reason string when the driver should be recycled"""
+        self.jobs_since_start += 1
+        if self.recycle_every and self.jobs_since_start >= self.recycle_every:
+            return f"{self.jobs_since_start} jobs since the browser started"
+        if self.jobs_since_start % self.check_every:
+            return None
+
+        rss = self.browser_rss(driver)
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+            if self.max_rss and rss > self.max_rss:
+                return f"browser RSS {rss / MB:.0f} MB over {self.max_rss / MB:.0f} MB"
+        heap = self.js_heap(driver)
+        if heap is not None:
+            self.peak_heap = max(self.peak_heap, heap)
+            if self.max_heap and heap > self.max_heap:
+                return f"JS heap {heap / MB:.0f} MB over {self.max_heap / MB:.0f} MB"
+        return None
+
+    def reset(self):
+        """Start counting again for a fresh browser"""
+        self.jobs_since_start = 0
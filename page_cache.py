@@ -0,0 +1,134 @@
+"""Compressed on-disk cache of job details pages.
+
+Each snapshot is keyed by the job key plus a hash of the listing card it
+was reached from, so a posting whose title, company, experience or salary
+changed is fetched again. The page text is stored zlib-compressed next to
+the fields details_page.classify_details read from it; the least recently used snapshots are
+evicted once the cache grows past its size limit.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+
+def card_hash(card):
+    """Hash the listing fields that change when a posting is edited"""
+    content = "\n".join([card.title or '', card.company or '', card.experience or '', card.salary or '',
+                         (card.href or '').split('?')[0]])
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+
+
+class DetailPageCache:
+    """LRU-bounded SQLite store of compressed details-page snapshots and their extracted fields"""
+
+    def __init__(self, path="page_cache.db", max_mb=50):
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS detail_pages (
+                job_key TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fields TEXT NOT NULL,
+                snapshot BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (job_key, content_hash)
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS detail_pages_last_used ON detail_pages (last_used)")
+        self.connection.commit()
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM detail_pages").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    def fields(self, key, content_hash):
+        """Return the extracted fields of a cached snapshot, or None"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT fields FROM detail_pages WHERE job_key = ? AND content_hash = ?", (key, content_hash)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.connection.execute(
+                "UPDATE detail_pages SET last_used = ? WHERE job_key = ? AND content_hash = ?",
+                (time.time(), key, content_hash)
+            )
+            self.connection.commit()
+        return json.loads(row[0])
+
+    def fields_for(self, keys):
+        """Return {job key: fields} of the newest snapshot of each key, for batch scoring"""
+        keys = list(keys)
+        found = {}
+        with self.lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self.connection.execute(
+                    f"SELECT job_key, fields FROM detail_pages WHERE job_key IN ({','.join('?' * len(batch))}) "
+                    "ORDER BY fetched_at", batch
+                )
+                for key, fields in rows:
+                    found[key] = json.loads(fields)
+        return found
+
+    def snapshot(self, key, content_hash):
+        """Return the decompressed page text of a cached snapshot, or None"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT snapshot FROM detail_pages WHERE job_key = ? AND content_hash = ?", (key, content_hash)
+            ).fetchone()
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def put(self, key, content_hash, text, fields):
+        """Store a snapshot, replacing older versions of the same job, then evict down to the size limit"""
+        if key is None:
+            return
+        snapshot = zlib.compress(text.encode('utf-8'), 6)
+        encoded_fields = json.dumps(fields)
+        size = len(snapshot) + len(encoded_fields)
+        now = time.time()
+        with self.lock:
+            replaced = self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM detail_pages WHERE job_key = ?", (key,)
+            ).fetchone()[0]
+            self.connection.execute("DELETE FROM detail_pages WHERE job_key = ?", (key,))
+            self.connection.execute(
+                "INSERT INTO detail_pages (job_key, content_hash, fields, snapshot, size, fetched_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, content_hash, encoded_fields, snapshot, size, now, now)
+            )
+            self.total_bytes += size - replaced
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.connection.commit()
+
+    def _evict(self):
+        # Drop the least recently used snapshots until the cache is back under 90% of its limit
+        target = self.max_bytes * 0.9
+        victims = []
+        for key, content_hash, size in self.connection.execute(
+                "SELECT job_key, content_hash, size FROM detail_pages ORDER BY last_used"):
+            if self.total_bytes <= target:
+                break
+            victims.append((key, content_hash))
+            self.total_bytes -= size
+        self.connection.executemany("DELETE FROM detail_pages WHERE job_key = ? AND content_hash = ?", victims)
+
+    def print_summary(self):
+        """Print cache hits, misses and size"""
+        if self.hits or self.misses:
+            print(f"\nDetails page cache: {self.hits} hits, {self.misses} misses, "
+                  f"{self.total_bytes / (1024 * 1024):.1f} MB stored")
+
+    def close(self):
+        """Flush and close the database"""
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,689 @@
+"""Record a real browser session and replay it in-process without Chrome.
+
+Recording (`[REPLAY] record_to`) wraps the driver's command channel: every
+WebDriver command is logged to commands.jsonl, and the DOM is snapshotted
+(zlib-compressed, stored once per content hash) whenever it is read after
+a navigation or click.
+
+Replay (`[REPLAY] replay_from`) swaps in ReplayDriver, which serves those
+snapshots from lxml trees and answers the scripts the bot sends
+(card extraction, selector races, result count, details classifier) in
+Python. The extraction and control logic then runs at parse speed:
+
+    python replay.py recordings/run1 --iterations 200
+    python replay.py recordings/run1 --pipeline --config config.ini
+"""
+import argparse
+import configparser
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+import lxml.html
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    NoAlertPresentException,
+    StaleElementReferenceException
+)
+from listing_extraction import EXTRACT_JOB_CARDS_SCRIPT, RESULT_COUNT_SCRIPT, extract_job_cards, result_count
+from listing_parser import parse_document, query_all, text_of, listing_from_document
+from selector_cache import RACE_SELECTORS_SCRIPT
+from details_page import CLASSIFY_DETAILS_SCRIPT, APPLY, EXTERNAL, ALREADY_APPLIED, QUESTIONNAIRE, NO_APPLY
+from retry import PAGE_TEXT_SCRIPT
+
+# Scripts that read the DOM, by label; the recorder snapshots the page before the first one after a change
+READ_SCRIPTS = {
+    EXTRACT_JOB_CARDS_SCRIPT: 'extract_job_cards',
+    RACE_SELECTORS_SCRIPT: 'race_selectors',
+    RESULT_COUNT_SCRIPT: 'result_count',
+    CLASSIFY_DETAILS_SCRIPT: 'classify_details',
+    PAGE_TEXT_SCRIPT: 'page_text'
+}
+READ_COMMANDS = {Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.GET_PAGE_SOURCE}
+# Commands after which the DOM may differ from the last snapshot
+CHANGE_COMMANDS = {Command.GET, Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT, Command.GO_BACK, Command.REFRESH}
+
+EMPTY_PAGE = "<html><head><title></title></head><body></body></html>"
+
+
+def script_label(script):
+    """Short name for a script in the command log"""
+    label = READ_SCRIPTS.get(script)
+    if label:
+        return label
+    return "inline:" + hashlib.sha1(script.encode('utf-8')).hexdigest()[:8]
+
+
+def normalize_url(url):
+    """Drop the fragment and sort query parameters so equivalent URLs match"""
+    parts = urlsplit(url or '')
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/') or '/',
+                       urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True))), ''))
+
+
+class RecordingWriter:
+    """Appends snapshots and commands to a recording directory; shared by every driver recording into it"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.lock = threading.Lock()
+        os.makedirs(os.path.join(directory, 'pages'), exist_ok=True)
+        self.index_path = os.path.join(directory, 'index.json')
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {'created': time.time(), 'pages': []}
+        self.log = open(os.path.join(directory, 'commands.jsonl'), 'a', encoding='utf-8')
+
+    def add_page(self, url, source):
+        """Store a DOM snapshot (once per content hash) and return its position in the index"""
+        digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+        file_name = f"pages/{digest}.html.z"
+        path = os.path.join(self.directory, file_name)
+        with self.lock:
+            if not os.path.exists(path):
+                with open(path, 'wb') as f:
+                    f.write(zlib.compress(source.encode('utf-8'), 6))
+            pages = self.index['pages']
+            if pages and pages[-1]['url'] == url and pages[-1]['file'] == file_name:
+                return len(pages) - 1
+            pages.append({'url': url, 'file': file_name, 'reads': []})
+            self._save_index()
+            return len(pages) - 1
+
+    def note_read(self, page, label):
+        """Remember which extraction scripts ran against a snapshot"""
+        with self.lock:
+            reads = self.index['pages'][page]['reads']
+            if label not in reads:
+                reads.append(label)
+                self._save_index()
+
+    def _save_index(self):
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=1)
+        os.replace(temp_path, self.index_path)
+
+    def log_command(self, entry):
+        with self.lock:
+            self.log.write(json.dumps(entry) + "\n")
+            self.log.flush()
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def record_driver(driver, directory):
+    """Start recording every command issued through `driver` and the pages they read"""
+    with _writers_lock:
+        writer = _writers.get(directory)
+        if writer is None:
+            writer = _writers[directory] = RecordingWriter(directory)
+
+    execute = driver.execute
+    state = {'dirty': True, 'page': None}
+
+    def recording_execute(driver_command, params=None):
+        label = None
+        if driver_command == Command.W3C_EXECUTE_SCRIPT:
+            label = script_label((params or {}).get('script', ''))
+        reads = driver_command in READ_COMMANDS or label in READ_SCRIPTS.values()
+        if reads and state['dirty']:
+            url = execute(Command.GET_CURRENT_URL)['value']
+            state['page'] = writer.add_page(url, execute(Command.GET_PAGE_SOURCE)['value'])
+            state['dirty'] = False
+        if reads and state['page'] is not None:
+            writer.note_read(state['page'], label or driver_command)
+
+        start_time = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            writer.log_command({
+                'command': driver_command,
+                'script': label,
+                'url': (params or {}).get('url'),
+                'page': state['page'],
+                'duration': round(time.perf_counter() - start_time, 6)
+            })
+            if driver_command in CHANGE_COMMANDS or (label and label.startswith('inline:')
+                                                     and '.click()' in params.get('script', '')):
+                state['dirty'] = True
+
+    driver.execute = recording_execute
+    return writer
+
+
+class Recording:
+    """Snapshots of a recorded session, parsed lazily and kept in memory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+            self.pages = json.load(f)['pages']
+        self.by_url = {}
+        for position, page in enumerate(self.pages):
+            self.by_url.setdefault(normalize_url(page['url']), []).append(position)
+        self.documents = {}
+
+    def positions(self, url):
+        """Indexes of the snapshots recorded at `url`, in recording order"""
+        return self.by_url.get(normalize_url(url), [])
+
+    def document(self, position):
+        """Parsed lxml tree of one snapshot"""
+        document = self.documents.get(position)
+        if document is None:
+            page = self.pages[position]
+            with open(os.path.join(self.directory, page['file']), 'rb') as f:
+                source = zlib.decompress(f.read()).decode('utf-8')
+            document = self.documents[position] = parse_document(source, page['url'])
+        return document
+
+    def urls_with(self, read):
+        """URLs of snapshots that `read` (a READ_SCRIPTS label) ran against, first occurrence only"""
+        seen = []
+        for page in self.pages:
+            if read in page['reads'] and page['url'] not in seen:
+                seen.append(page['url'])
+        return seen
+
+
+class ReplayElement(WebElement):
+    """Element of a replayed page; goes stale once the driver moves to another snapshot.
+
+    Subclasses WebElement so expected_conditions treat it as an element
+    rather than a locator.
+    """
+
+    def __init__(self, driver, node):
+        super().__init__(driver, f"replay-{id(node)}")
+        self.driver = driver
+        self.node = node
+        self.generation = driver.generation
+
+    def _check(self):
+        if self.generation != self.driver.generation:
+            raise StaleElementReferenceException("Element belongs to an earlier page")
+
+    @property
+    def tag_name(self):
+        self._check()
+        return self.node.tag
+
+    @property
+    def text(self):
+        self._check()
+        return text_of(self.node)
+
+    def get_attribute(self, name):
+        self._check()
+        if name in ('textContent', 'innerText'):
+            return text_of(self.node)
+        return self.node.get(name)
+
+    get_dom_attribute = get_attribute
+
+    def is_displayed(self):
+        self._check()
+        return visible(self.node)
+
+    def is_enabled(self):
+        self._check()
+        return self.node.get('disabled') is None
+
+    def is_selected(self):
+        self._check()
+        return self.node.get('selected') is not None or self.node.get('checked') is not None
+
+    def click(self):
+        self.driver.execute(Command.CLICK_ELEMENT, {'element': self})
+
+    def send_keys(self, *value):
+        self.driver.execute(Command.SEND_KEYS_TO_ELEMENT, {'element': self, 'text': ''.join(map(str, value))})
+
+    def clear(self):
+        self.driver.execute(Command.CLEAR_ELEMENT, {'element': self})
+
+    def find_elements(self, by=By.ID, value=None):
+        self._check()
+        return [ReplayElement(self.driver, node) for node in query_all(self.node, by, value)]
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {by}={value}")
+        return elements[0]
+
+    def __eq__(self, other):
+        return isinstance(other, ReplayElement) and self.node is other.node
+
+    def __hash__(self):
+        return hash(id(self.node))
+
+
+def visible(node):
+    """Best-effort visibility from inline attributes, the only styling available offline"""
+    while node is not None:
+        style = (node.get('style') or '').replace(' ', '').lower()
+        if node.get('hidden') is not None or 'display:none' in style or 'visibility:hidden' in style:
+            return False
+        node = node.getparent()
+    return True
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException("Replayed pages have no alerts")
+
+    def window(self, handle):
+        self.driver.execute(Command.SWITCH_TO_WINDOW, {'handle': handle})
+
+    def default_content(self):
+        pass
+
+
+class ReplayDriver:
+    """In-process stand-in for webdriver.Chrome that serves a Recording.
+
+    Implements the driver surface NaukriAutoApply uses; every call goes
+    through execute() so tracing and command counters see it as they would
+    a real driver. URLs missing from the recording load an empty page.
+    """
+
+    def __init__(self, recording):
+        self.recording = recording
+        self.position = None
+        self.document = parse_document(EMPTY_PAGE)
+        self.url = "about:blank"
+        self.generation = 0
+        self.commands = Counter()
+        self.missing_urls = Counter()
+        self.unhandled_scripts = Counter()
+        self.cookies = []
+        self.capabilities = {'browserName': 'replay'}
+        self.switch_to = _SwitchTo(self)
+
+    # Selenium WebDriver surface
+
+    def execute(self, driver_command, params=None):
+        self.commands[driver_command] += 1
+        handler = getattr(self, f"_command_{driver_command}", None)
+        value = handler(params or {}) if handler else None
+        return {'value': value}
+
+    def get(self, url):
+        self.execute(Command.GET, {'url': url})
+
+    @property
+    def current_url(self):
+        return self.execute(Command.GET_CURRENT_URL)['value']
+
+    @property
+    def title(self):
+        return self.execute(Command.GET_TITLE)['value']
+
+    @property
+    def page_source(self):
+        return self.execute(Command.GET_PAGE_SOURCE)['value']
+
+    @property
+    def window_handles(self):
+        return self.execute(Command.W3C_GET_WINDOW_HANDLES)['value']
+
+    @property
+    def current_window_handle(self):
+        return self.execute(Command.W3C_GET_CURRENT_WINDOW_HANDLE)['value']
+
+    def find_elements(self, by=By.ID, value=None):
+        return self.execute(Command.FIND_ELEMENTS, {'using': by, 'value': value})['value']
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No element matches {by}={value}")
+        return elements[0]
+
+    def execute_script(self, script, *args):
+        return self.execute(Command.W3C_EXECUTE_SCRIPT, {'script': script, 'args': list(args)})['value']
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.commands[f"cdp:{cmd}"] += 1
+        return {}
+
+    def get_log(self, log_type):
+        return []
+
+    def get_cookies(self):
+        return self.execute(Command.GET_ALL_COOKIES)['value']
+
+    def add_cookie(self, cookie):
+        self.execute(Command.ADD_COOKIE, {'cookie': cookie})
+
+    def delete_all_cookies(self):
+        self.execute(Command.DELETE_ALL_COOKIES)
+
+    def set_page_load_timeout(self, time_to_wait):
+        pass
+
+    def back(self):
+        self.execute(Command.GO_BACK)
+
+    def refresh(self):
+        self.execute(Command.REFRESH)
+
+    def close(self):
+        self.execute(Command.CLOSE)
+
+    def quit(self):
+        self.execute(Command.QUIT)
+
+    # Command handlers
+
+    def load(self, url, position=None):
+        """Show the snapshot at `position`, or the first one recorded for `url`"""
+        if position is None:
+            positions = self.recording.positions(url)
+            position = positions[0] if positions else None
+        if position is None:
+            self.missing_urls[url] += 1
+            self.document = parse_document(EMPTY_PAGE)
+        else:
+            self.document = self.recording.document(position)
+        self.position = position
+        self.url = url
+        self.generation += 1
+
+    def _command_get(self, params):
+        self.load(params['url'])
+
+    def _command_getCurrentUrl(self, params):
+        return self.url
+
+    def _command_getTitle(self, params):
+        titles = self.document.xpath('//title')
+        return text_of(titles[0]) if titles else ''
+
+    def _command_getPageSource(self, params):
+        return lxml.html.tostring(self.document, encoding='unicode')
+
+    def _command_w3cGetWindowHandles(self, params):
+        return ['replay']
+
+    def _command_w3cGetCurrentWindowHandle(self, params):
+        return 'replay'
+
+    def _command_findElements(self, params):
+        return [ReplayElement(self, node) for node in query_all(self.document, params['using'], params['value'])]
+
+    def _command_getCookies(self, params):
+        return list(self.cookies)
+
+    def _command_addCookie(self, params):
+        self.cookies.append(params['cookie'])
+
+    def _command_deleteAllCookies(self, params):
+        self.cookies = []
+
+    def _command_goBack(self, params):
+        if self.position:
+            self.load(self.recording.pages[self.position - 1]['url'], self.position - 1)
+
+    def _command_clickElement(self, params):
+        element = params['element']
+        element._check()
+        node = element.node
+        while node is not None and node.tag != 'a':
+            node = node.getparent()
+        href = node.get('href', '') if node is not None else ''
+        if href.startswith(('http://', 'https://')):
+            self.load(href)
+            return
+        # Same URL, changed DOM: the next snapshot recorded at this URL, if any
+        later = [position for position in self.recording.positions(self.url)
+                 if self.position is not None and position > self.position]
+        if later:
+            self.load(self.url, later[0])
+
+    def _command_sendKeysToElement(self, params):
+        params['element']._check()
+        params['element'].node.set('value', params['text'])
+
+    def _command_clearElement(self, params):
+        params['element']._check()
+        params['element'].node.set('value', '')
+
+    def _command_w3cExecuteScript(self, params):
+        script, args = params['script'], params['args']
+        label = READ_SCRIPTS.get(script)
+        if label:
+            return getattr(self, f"_script_{label}")(*args)
+        if script.startswith("return document.readyState"):
+            return 'complete'
+        if "getEntriesByType('resource')" in script:
+            return 0
+        if "arguments[0].click()" in script:
+            args[0].click()
+            return None
+        if "scrollIntoView" in script or "navigator" in script:
+            return None
+        if "arguments[0].value = arguments[1]" in script:
+            args[0].node.set('value', args[1])
+            return None
+        self.unhandled_scripts[script_label(script)] += 1
+        return None
+
+    # Python versions of the extraction scripts
+
+    def _script_extract_job_cards(self, *selectors):
+        listing = listing_from_document(self.document)
+        return {
+            'selector': list(listing.selector) if listing.selector else None,
+            'cards': [list(card) for card in listing.cards],
+            'hasNext': listing.has_next,
+            'nextHref': listing.next_href or ''
+        }
+
+    def _script_race_selectors(self, candidates):
+        present = None
+        for index, (selector_type, selector_value) in enumerate(candidates):
+            by = By.XPATH if selector_type == 'xpath' else By.CSS_SELECTOR
+            for node in query_all(self.document, by, selector_value):
+                if visible(node) and node.get('disabled') is None:
+                    return [index, ReplayElement(self, node), True]
+                if present is None:
+                    present = [index, ReplayElement(self, node), False]
+        return present
+
+    def _script_result_count(self, selectors):
+        for selector in selectors:
+            for node in query_all(self.document, By.CSS_SELECTOR, selector)[:1]:
+                text = text_of(node)
+                if text:
+                    return text
+        return None
+
+    def _script_page_text(self):
+        bodies = self.document.xpath('//body')
+        body = text_of(bodies[0])[:2000] if bodies else ''
+        return f"{self._command_getTitle({})} {body}".lower()
+
+    def _script_classify_details(self, include_text, site_host, candidates, questionnaire_markers):
+        document = self.document
+        skills = []
+        for selector in ("[class*='key-skill'] a", "[class*='key-skill'] span", ".chip", "[data-cy='key-skills'] a"):
+            for node in query_all(document, By.CSS_SELECTOR, selector):
+                text = text_of(node)
+                if text and text not in skills:
+                    skills.append(text)
+
+        applied = external = apply = confirm = None
+        for node in query_all(document, By.CSS_SELECTOR, candidates):
+            # Act on the innermost control, as querySelector (descendants only) does in the script
+            nested = [inner for inner in query_all(node, By.CSS_SELECTOR, "button, a, [role='button']") if inner is not node]
+            if not visible(node) or nested:
+                continue
+            text = (text_of(node) or node.get('value') or node.get('aria-label') or '').lower()
+            if not text or len(text) > 40:
+                continue
+            enabled = node.get('disabled') is None
+            if confirm is None and enabled and re.match(r"(confirm|submit)\b", text):
+                confirm = node
+            if 'appl' not in text:
+                continue
+            if re.match(r"applied\b", text) or 'already applied' in text:
+                applied = applied if applied is not None else node
+            elif re.search(r"company('s)? (site|website)", text) or (re.search(r"\bapply\b", text)
+                                                                       and off_site(node, site_host)):
+                external = external if external is not None else node
+            elif apply is None and enabled and re.search(r"\bapply\b", text):
+                apply = node
+        questionnaire = any(visible(node) for node in query_all(document, By.CSS_SELECTOR, questionnaire_markers))
+
+        apply_type, target = NO_APPLY, None
+        if applied is not None:
+            apply_type, target = ALREADY_APPLIED, applied
+        elif questionnaire:
+            apply_type = QUESTIONNAIRE
+        elif external is not None:
+            apply_type, target = EXTERNAL, external
+        elif apply is not None:
+            apply_type, target = APPLY, apply
+
+        def first_text(selectors):
+            for selector in selectors:
+                for node in query_all(document, By.CSS_SELECTOR, selector)[:1]:
+                    if text_of(node):
+                        return text_of(node)
+            return ''
+
+        main = (query_all(document, By.CSS_SELECTOR, "[class*='job-desc'], .job-description, main")
+                or document.xpath('//body') or [document])[0]
+        return [
+            apply_type,
+            text_of(target).lower() if target is not None else '',
+            ReplayElement(self, target) if target is not None else None,
+            ReplayElement(self, confirm) if confirm is not None else None,
+            skills,
+            first_text(["[class*='exp'] span", "[data-cy='experience']", ".exp"]),
+            first_text(["[class*='salary'] span", "[data-cy='salary']", ".salary"]),
+            text_of(main) if include_text else None
+        ]
+
+
+def off_site(node, site_host):
+    """Whether a link leaves the site, as the classifier script decides it"""
+    href = node.get('href') or ''
+    if node.tag != 'a' or not href.startswith(('http://', 'https://')):
+        return False
+    host = urlsplit(href).netloc.replace('www.', '', 1)
+    return bool(site_host) and host != site_host and not host.endswith('.' + site_host)
+
+
+def benchmark_extraction(recording, iterations):
+    """Run listing extraction and the result count over every recorded results page"""
+    driver = ReplayDriver(recording)
+    urls = recording.urls_with('extract_job_cards')
+    if not urls:
+        print("The recording holds no results pages")
+        return
+    cards = 0
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        for url in urls:
+            driver.get(url)
+            cards += len(extract_job_cards(driver).cards)
+            result_count(driver)
+    elapsed = time.perf_counter() - start_time
+    pages = iterations * len(urls)
+    print(f"Extracted {pages} results pages ({cards} cards) in {elapsed:.2f}s: "
+          f"{pages / elapsed:.0f} pages/s, {cards / elapsed:.0f} cards/s")
+
+
+def replay_config(config_file, recording_dir, workdir):
+    """Copy a config.ini with replay on, no waiting, and every store in `workdir`"""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    for section in ('EXECUTION', 'WAITS', 'STORAGE', 'BROWSER', 'REPLAY', 'TRACING'):
+        if not config.has_section(section):
+            config.add_section(section)
+    config['REPLAY']['replay_from'] = recording_dir
+    config['REPLAY']['record_to'] = ''
+    config['EXECUTION'].update({'workers': '1', 'engine': 'sync', 'discovery': 'browser',
+                                'resume': 'false', 'incremental': 'false'})
+    for option in ('page_load_timeout', 'element_timeout', 'action_timeout', 'network_idle_timeout'):
+        config['WAITS'][option] = '0'
+    config['STORAGE'].update({
+        'jobs_db': os.path.join(workdir, 'jobs.db'),
+        'selector_stats': os.path.join(workdir, 'selector_stats.json'),
+        'search_strategies': os.path.join(workdir, 'search_strategies.json'),
+        'checkpoint_file': os.path.join(workdir, 'checkpoint.json'),
+        'page_cache': ''
+    })
+    config['BROWSER'].update({'profile': 'full', 'standby_browsers': '0'})
+    path = os.path.join(workdir, 'config.ini')
+    with open(path, 'w', encoding='utf-8') as f:
+        config.write(f)
+    return path
+
+
+def benchmark_pipeline(recording_dir, config_file, iterations):
+    """Run process_job_listings from every recorded search results page against the replay driver"""
+    from Main import NaukriAutoApply
+
+    recording = Recording(recording_dir)
+    searches = recording.urls_with('result_count') or recording.urls_with('extract_job_cards')[:1]
+    if not searches:
+        print("The recording holds no search results pages")
+        return
+    for iteration in range(iterations):
+        with tempfile.TemporaryDirectory() as workdir:
+            automator = NaukriAutoApply(replay_config(config_file, recording_dir, workdir))
+            automator.max_applications = float('inf')
+            start_time = time.perf_counter()
+            for url in searches:
+                automator.driver.get(url)
+                automator.process_job_listings()
+            elapsed = time.perf_counter() - start_time
+            driver = automator.driver
+            print(f"Pass {iteration + 1}: {len(searches)} searches in {elapsed:.3f}s, "
+                  f"{sum(driver.commands.values())} commands, {driver.generation} page loads")
+            if driver.missing_urls:
+                print(f"  {sum(driver.missing_urls.values())} loads of URLs missing from the recording")
+            if driver.unhandled_scripts:
+                print(f"  Scripts without a replay implementation: {dict(driver.unhandled_scripts)}")
+            automator.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded session without a browser")
+    parser.add_argument('recording', help="Directory written with [REPLAY] record_to")
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--pipeline', action='store_true',
+                        help="Run process_job_listings over the recorded searches instead of extraction only")
+    parser.add_argument('--config', default='config.ini')
+    args = parser.parse_args()
+    if args.pipeline:
+        benchmark_pipeline(args.recording, args.config, args.iterations)
+    else:
+        benchmark_extraction(Recording(args.recording), args.iterations)
+
+
+if __name__ == '__main__':
+    main()
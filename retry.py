@@ -0,0 +1,142 @@
+"""Central retry policy for WebDriver work.
+
+Failures are classified by exception type and each class gets its own
+response: stale elements are re-queried, elements that cannot take input
+are scrolled into view, timeouts and throttling back off exponentially
+(bounded), and a dead session restarts the driver. Anything else is not
+retried. Every retry and give-up is counted for the end-of-run report.
+"""
+import random
+import threading
+import time
+from collections import Counter
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+    TimeoutException,
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    WebDriverException
+)
+
+STALE = "stale"
+NOT_INTERACTABLE = "not_interactable"
+TIMEOUT = "timeout"
+SESSION = "session"
+RATE_LIMITED = "rate_limited"
+OTHER = "other"
+
+# WebDriverException messages that mean the browser behind the session is gone
+DEAD_SESSION_MESSAGES = ["invalid session id", "session deleted", "chrome not reachable", "disconnected", "no such window"]
+
+# Signs that the site is throttling or blocking the session
+BLOCKED_PAGE_MARKERS = ["access denied", "too many requests", "unusual traffic", "captcha", "temporarily blocked"]
+
+# Lower-cased title and start of the body text, checked against BLOCKED_PAGE_MARKERS
+PAGE_TEXT_SCRIPT = "return (document.title + ' ' + (document.body ? document.body.innerText.slice(0, 2000) : '')).toLowerCase()"
+
+
+class RateLimitedError(Exception):
+    """The site answered with a throttling or block page"""
+
+
+def classify(error):
+    """Map an exception to one of the retry classes"""
+    if isinstance(error, StaleElementReferenceException):
+        return STALE
+    if isinstance(error, (ElementNotInteractableException, ElementClickInterceptedException)):
+        return NOT_INTERACTABLE
+    if isinstance(error, TimeoutException):
+        return TIMEOUT
+    if isinstance(error, RateLimitedError):
+        return RATE_LIMITED
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return SESSION
+    if isinstance(error, WebDriverException):
+        message = (error.msg or '').lower()
+        if any(text in message for text in DEAD_SESSION_MESSAGES):
+            return SESSION
+    return OTHER
+
+
+class RetryPolicy:
+    """Runs operations with per-class retry responses and keeps retry statistics"""
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=30, rate_limit_delay=60, tracer=None):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_limit_delay = rate_limit_delay
+        self.tracer = tracer
+        self.lock = threading.Lock()
+        self.retries = Counter()
+        self.failures = Counter()
+
+    @classmethod
+    def from_config(cls, config, tracer=None):
+        """Build a policy from the [RETRY] section of config.ini"""
+        return cls(
+            max_attempts=config.getint('RETRY', 'max_attempts', fallback=3),
+            base_delay=config.getfloat('RETRY', 'base_delay', fallback=0.5),
+            max_delay=config.getfloat('RETRY', 'max_delay', fallback=30),
+            rate_limit_delay=config.getfloat('RETRY', 'rate_limit_delay', fallback=60),
+            tracer=tracer
+        )
+
+    def delay(self, kind, attempt):
+        """Bounded exponential backoff with jitter"""
+        base = self.rate_limit_delay if kind == RATE_LIMITED else self.base_delay
+        limit = max(self.max_delay, self.rate_limit_delay) if kind == RATE_LIMITED else self.max_delay
+        return min(limit, base * 2 ** (attempt - 1)) * random.uniform(0.8, 1.0)
+
+    def run(self, label, operation, requery=None, scroll=None, restart=None):
+        """Call operation() until it succeeds, retrying only failures with a known response.
+
+        requery is called before retrying a stale element, scroll before
+        retrying an element that could not be interacted with, and restart
+        before retrying after the session died. Without the matching hook
+        that class is not retried.
+        """
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except Exception as error:
+                kind = classify(error)
+                attempt += 1
+                response = {
+                    STALE: requery,
+                    NOT_INTERACTABLE: scroll,
+                    SESSION: restart,
+                    TIMEOUT: time.sleep,
+                    RATE_LIMITED: time.sleep
+                }.get(kind)
+                if response is None or attempt >= self.max_attempts:
+                    self._count(self.failures, label, kind)
+                    raise
+                self._count(self.retries, label, kind)
+                if response is time.sleep:
+                    delay = self.delay(kind, attempt)
+                    print(f"{label}: {kind}, retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                else:
+                    response()
+
+    def _count(self, counter, label, kind):
+        with self.lock:
+            counter[(label, kind)] += 1
+        if self.tracer:
+            name = "retry" if counter is self.retries else "gave_up"
+            self.tracer.count(f"{name}.{label}.{kind}")
+
+    def print_summary(self):
+        """Print retries and give-ups per operation and error class"""
+        with self.lock:
+            keys = sorted(set(self.retries) | set(self.failures))
+            if not keys:
+                return
+            print("\nRetry summary:")
+            print(f"{'operation':<20}{'error':<18}{'retries':>9}{'gave up':>9}")
+            for label, kind in keys:
+                print(f"{label:<20}{kind:<18}{self.retries[(label, kind)]:>9}{self.failures[(label, kind)]:>9}")
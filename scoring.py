@@ -0,0 +1,155 @@
+"""Relevance scoring for extracted job cards.
+
+All listings collected across every keyword x location x page are scored
+in one pass: TF-IDF similarity of the title against the configured
+keywords, experience and salary range fit, and recency. The application
+budget is then spent on the best-ranked jobs instead of the first ones
+found.
+"""
+import math
+import re
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-|to|–)\s*(\d+(?:\.\d+)?)")
+NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+AGE_PATTERN = re.compile(r"(\d+)\+?\s*(hour|day|week|month)", re.IGNORECASE)
+# Labels meaning posted today; whole words only, so 'unknown' does not read as 'now'
+FRESH_PATTERN = re.compile(r"\b(just|now|today|few hours)\b")
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+def parse_range(text):
+    """Parse '3-6 Yrs' or '5-9 Lacs PA' into (low, high); None if no numbers are given"""
+    text = text or ''
+    match = RANGE_PATTERN.search(text)
+    if match:
+        low, high = float(match.group(1)), float(match.group(2))
+        return min(low, high), max(low, high)
+    match = NUMBER_PATTERN.search(text)
+    if match:
+        value = float(match.group())
+        return value, value
+    return None
+
+
+def parse_posted_days(text):
+    """Age in days of a 'posted' label such as 'Just Now', '3 Days Ago' or '30+ Days Ago'"""
+    text = (text or '').lower()
+    if not text:
+        return None
+    if FRESH_PATTERN.search(text):
+        return 0.0
+    match = AGE_PATTERN.search(text)
+    if not match:
+        return None
+    amount = int(match.group(1))
+    unit = match.group(2).lower()
+    return amount * {'hour': 1 / 24, 'day': 1, 'week': 7, 'month': 30}[unit]
+
+
+def experience_fit(card_range, wanted):
+    """1.0 when the card's experience range overlaps the wanted one, decaying with the gap"""
+    if card_range is None or wanted is None:
+        return 0.5
+    gap = max(card_range[0] - wanted[1], wanted[0] - card_range[1], 0.0)
+    return 1.0 / (1.0 + gap)
+
+
+def salary_fit(card_range, wanted):
+    """1.0 when the card pays at least the wanted minimum, proportionally less below it"""
+    if card_range is None or wanted is None or wanted[0] <= 0:
+        return 0.5
+    return min(1.0, card_range[1] / wanted[0])
+
+
+class JobScorer:
+    """Scores batches of JobCards against the search criteria"""
+
+    def __init__(self, keywords, experience='', salary='', weights=None, recency_days=30):
+        self.queries = [Counter(tokenize(keyword)) for keyword in keywords if tokenize(keyword)]
+        self.experience = parse_range(experience)
+        self.salary = parse_range(salary)
+        self.weights = weights or {'relevance': 0.5, 'experience': 0.2, 'salary': 0.15, 'recency': 0.15}
+        self.recency_days = recency_days
+
+    @classmethod
+    def from_config(cls, config, keywords, experience, salary):
+        """Build a scorer from the [SCORING] section of config.ini"""
+        return cls(
+            keywords,
+            experience,
+            salary,
+            weights={
+                'relevance': config.getfloat('SCORING', 'relevance_weight', fallback=0.5),
+                'experience': config.getfloat('SCORING', 'experience_weight', fallback=0.2),
+                'salary': config.getfloat('SCORING', 'salary_weight', fallback=0.15),
+                'recency': config.getfloat('SCORING', 'recency_weight', fallback=0.15)
+            },
+            recency_days=config.getfloat('SCORING', 'recency_days', fallback=30)
+        )
+
+    def relevance_scores(self, cards, details=None):
+        """Cosine similarity of TF-IDF title (plus cached skills) vectors to the best-matching keyword"""
+        details = details or [None] * len(cards)
+        documents = [Counter(tokenize(" ".join([card.title or ''] + (fields or {}).get('skills', []))))
+                     for card, fields in zip(cards, details)]
+        document_frequency = Counter()
+        for document in documents:
+            document_frequency.update(document.keys())
+        count = len(documents)
+        idf = {token: math.log((1 + count) / (1 + frequency)) + 1 for token, frequency in document_frequency.items()}
+
+        def vector(counts):
+            weights = {token: frequency * idf.get(token, math.log(1 + count) + 1) for token, frequency in counts.items()}
+            norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+            return {token: weight / norm for token, weight in weights.items()}
+
+        query_vectors = [vector(query) for query in self.queries]
+        scores = []
+        for document in documents:
+            document_vector = vector(document)
+            scores.append(max(
+                (sum(weight * document_vector.get(token, 0.0) for token, weight in query_vector.items())
+                 for query_vector in query_vectors),
+                default=0.0
+            ))
+        return scores
+
+    def recency(self, card):
+        days = parse_posted_days(card.posted)
+        if days is None:
+            return 0.5
+        return max(0.0, 1.0 - days / self.recency_days) if self.recency_days else 1.0
+
+    def score(self, cards, details=None):
+        """Score a batch of JobCards; returns one float per card.
+
+        details optionally holds the cached details-page fields of each card
+        (or None), used where the listing card is missing a value.
+        """
+        details = details or [None] * len(cards)
+        relevance = self.relevance_scores(cards, details)
+        weights = self.weights
+        return [
+            weights['relevance'] * relevance[index]
+            + weights['experience'] * experience_fit(
+                parse_range(card.experience or (fields or {}).get('experience', '')), self.experience)
+            + weights['salary'] * salary_fit(
+                parse_range(card.salary or (fields or {}).get('salary', '')), self.salary)
+            + weights['recency'] * self.recency(card)
+            for index, (card, fields) in enumerate(zip(cards, details))
+        ]
+
+    def rank(self, candidates, details=None):
+        """Sort (key, card, keyword, location) candidates best first; returns (score, candidate) pairs.
+
+        details maps job keys to cached details-page fields.
+        """
+        details = details or {}
+        scores = self.score([candidate[1] for candidate in candidates],
+                            [details.get(candidate[0]) for candidate in candidates])
+        return sorted(zip(scores, candidates), key=lambda item: -item[0])
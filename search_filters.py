@@ -0,0 +1,70 @@
+"""Search filters encoded as URL parameters.
+
+The experience, salary and job-age settings from [JOB_SEARCH] are turned
+into query parameters once at startup, so a search lands on already
+filtered results. Filters that cannot be encoded, or that the site drops
+from the URL, are left for the dropdowns in apply_filters.
+"""
+from urllib.parse import urlencode, urlsplit, parse_qsl
+from scoring import parse_range
+
+DATE = "date"
+EXPERIENCE = "experience"
+SALARY = "salary"
+
+# Values the site's "Date Posted" filter accepts, in days, with the option labels the dropdown shows for each
+JOB_AGE_DAYS = [1, 3, 7, 15, 30]
+JOB_AGE_LABELS = {
+    1: ["Last 1 day", "24 hours", "Today"],
+    3: ["Last 3 days"],
+    7: ["Last 7 days"],
+    15: ["Last 15 days"],
+    30: ["Last 30 days"]
+}
+
+# Salary filter buckets in lakhs per annum
+SALARY_BUCKETS = [(0, 3), (3, 6), (6, 10), (10, 15), (15, 25), (25, 50), (50, 75), (75, 100)]
+
+FILTER_PARAMS = {DATE: 'jobAge', EXPERIENCE: 'experience', SALARY: 'ctcFilter'}
+
+
+def job_age_bucket(job_age_days):
+    """Round a job age up to the nearest value the site's date filter accepts"""
+    supported = [days for days in JOB_AGE_DAYS if days >= job_age_days]
+    return supported[0] if supported else JOB_AGE_DAYS[-1]
+
+
+class SearchFilters:
+    """URL parameters for the configured filters, plus the filters only the UI can apply"""
+
+    def __init__(self, experience='', salary='', job_age_days=1):
+        self.params = []
+        self.ui_filters = []
+
+        self.job_age = job_age_bucket(job_age_days) if job_age_days else None
+        if self.job_age:
+            self.params.append((FILTER_PARAMS[DATE], str(self.job_age)))
+
+        experience_range = parse_range(experience)
+        if experience_range:
+            self.params.append((FILTER_PARAMS[EXPERIENCE], str(int(experience_range[0]))))
+        elif experience.strip():
+            self.ui_filters.append(EXPERIENCE)
+
+        salary_range = parse_range(salary)
+        if salary_range:
+            low, high = salary_range
+            for bucket_low, bucket_high in SALARY_BUCKETS:
+                if max(bucket_low, low) < min(bucket_high, high) or bucket_low <= low < bucket_high:
+                    self.params.append((FILTER_PARAMS[SALARY], f"{bucket_low}to{bucket_high}"))
+        elif salary.strip():
+            self.ui_filters.append(SALARY)
+
+        self.query_string = urlencode(self.params)
+
+    def ui_filters_for(self, url):
+        """Filters still to apply through the UI on the results page at `url`"""
+        present = {name for name, _ in parse_qsl(urlsplit(url).query)}
+        missing = [name for name, param in FILTER_PARAMS.items()
+                   if param not in present and any(param == encoded for encoded, _ in self.params)]
+        return self.ui_filters + missing
@@ -0,0 +1,64 @@
+import threading
+import time
+from persistence import load_json, atomic_write_json
+
+MANUAL = "manual"
+
+# Direct search URL templates, tried in this order unless the cache knows a winner.
+# {filters} is the encoded query string from search_filters.SearchFilters.
+SEARCH_URL_TEMPLATES = [
+    ('path', "{base_url}/{keyword}-jobs-in-{location}?{filters}"),
+    ('query', "{base_url}/jobs?k={keyword}&l={location}&{filters}"),
+    ('keyword_path', "{base_url}/{keyword}-jobs?l={location}&{filters}")
+]
+
+
+def query_shape(keyword, location):
+    """Group queries that the site routes the same way (single word vs phrase, with or without location)"""
+    words = 'phrase' if len(keyword.split()) > 1 else 'word'
+    place = 'located' if location.strip() else 'anywhere'
+    return f"{words}/{place}"
+
+
+class SearchStrategyCache:
+    """Remembers which URL template (or the manual form) produced results for each query shape"""
+
+    def __init__(self, path="search_strategies.json", ttl=72 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = load_json(path, default={}) or {}
+        self.dirty = False
+
+    def lookup(self, shape):
+        """Return (strategy, fresh); fresh entries are trusted, stale ones only tried first"""
+        with self.lock:
+            entry = self.entries.get(shape)
+        if not entry:
+            return None, False
+        return entry['strategy'], time.time() - entry.get('verified_at', 0) < self.ttl
+
+    def order(self, shape, strategies):
+        """Return the strategies with the cached winner first"""
+        strategy, _ = self.lookup(shape)
+        return sorted(strategies, key=lambda name: name != strategy)
+
+    def record(self, shape, strategy):
+        """Remember a strategy that produced results"""
+        with self.lock:
+            self.entries[shape] = {'strategy': strategy, 'verified_at': time.time()}
+            self.dirty = True
+
+    def forget(self, shape, strategy):
+        """Drop the cached winner after it stopped working"""
+        with self.lock:
+            if self.entries.get(shape, {}).get('strategy') == strategy:
+                del self.entries[shape]
+                self.dirty = True
+
+    def save(self):
+        """Persist the cache for the next run"""
+        with self.lock:
+            if self.dirty:
+                atomic_write_json(self.path, self.entries)
+                self.dirty = False
@@ -0,0 +1,117 @@
+import threading
+import time
+from selenium.webdriver.common.by import By
+from persistence import load_json, atomic_write_json
+
+# Evaluates every candidate selector in one round trip.
+# Returns [index, element, clickable] for the first candidate (in the given
+# order) that is clickable, else the first one that is merely present, else null.
+RACE_SELECTORS_SCRIPT = """
+const candidates = arguments[0];
+let present = null;
+for (let i = 0; i < candidates.length; i++) {
+    const [type, value] = candidates[i];
+    let nodes = [];
+    try {
+        if (type === 'xpath') {
+            const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < snapshot.snapshotLength; j++) nodes.push(snapshot.snapshotItem(j));
+        } else {
+            nodes = Array.from(document.querySelectorAll(value));
+        }
+    } catch (e) {
+        continue;
+    }
+    for (const node of nodes) {
+        const visible = node.getClientRects().length > 0 && getComputedStyle(node).visibility !== 'hidden';
+        if (visible && !node.disabled) return [i, node, true];
+        if (present === null) present = [i, node, false];
+    }
+}
+return present;
+"""
+
+
+def compile_selector(selector_type, selector_value):
+    """Translate a (By, value) locator into the XPath or CSS form the race script understands"""
+    if selector_type == By.XPATH:
+        return ['xpath', selector_value]
+    if selector_type == By.ID:
+        return ['css', f'[id="{selector_value}"]']
+    if selector_type == By.NAME:
+        return ['css', f'[name="{selector_value}"]']
+    if selector_type == By.CLASS_NAME:
+        return ['css', f'.{selector_value}']
+    if selector_type == By.TAG_NAME:
+        return ['css', selector_value]
+    if selector_type in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        text = selector_value.replace("'", "\\'")
+        if selector_type == By.LINK_TEXT:
+            return ['xpath', f"//a[normalize-space(.)='{text}']"]
+        return ['xpath', f"//a[contains(., '{text}')]"]
+    return ['css', selector_value]
+
+
+class SelectorCache:
+    """Remembers which selector matched each logical target and tries the winners first"""
+
+    def __init__(self, path="selector_stats.json"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.stats = load_json(path, default={}) or {}
+        self.compiled = {}
+
+    def compile(self, selectors):
+        """Compile locators once and reuse the result for later lookups"""
+        key = tuple(selectors)
+        compiled = self.compiled.get(key)
+        if compiled is None:
+            compiled = [compile_selector(selector_type, selector_value) for selector_type, selector_value in selectors]
+            self.compiled[key] = compiled
+        return compiled
+
+    def order(self, target, selectors):
+        """Return the selectors with the last winner first, then by hit count"""
+        if not target:
+            return list(selectors)
+        with self.lock:
+            target_stats = self.stats.get(target, {})
+            last_hit = target_stats.get('last_hit')
+            hits = target_stats.get('hits', {})
+
+        def rank(indexed):
+            position, selector = indexed
+            name = selector_name(selector)
+            return (name != last_hit, -hits.get(name, 0), position)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def record_hit(self, target, selector):
+        """Count a successful match for a target"""
+        if not target:
+            return
+        name = selector_name(selector)
+        with self.lock:
+            target_stats = self.stats.setdefault(target, {'hits': {}, 'misses': 0})
+            target_stats['hits'][name] = target_stats['hits'].get(name, 0) + 1
+            target_stats['last_hit'] = name
+            target_stats['updated'] = time.time()
+
+    def record_miss(self, target):
+        """Count a lookup where no candidate matched"""
+        if not target:
+            return
+        with self.lock:
+            target_stats = self.stats.setdefault(target, {'hits': {}, 'misses': 0})
+            target_stats['misses'] = target_stats.get('misses', 0) + 1
+
+    def save(self):
+        """Persist hit statistics for the next run"""
+        with self.lock:
+            atomic_write_json(self.path, self.stats)
+
+
+def selector_name(selector):
+    """Stable string key for a (By, value) locator"""
+    selector_type, selector_value = selector
+    return f"{selector_type}:{selector_value}"
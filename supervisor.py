@@ -0,0 +1,323 @@
+"""Runs several candidate profiles at once, one process and one Chrome profile each.
+
+profiles.ini holds a [SUPERVISOR] section and one [profile:<name>] section
+per candidate. A profile section overrides the base config.ini: `email`,
+`keywords`, `locations`, `experience`, `salary` and `job_age_days` are
+shorthands, and any other option is written as SECTION.option
+(e.g. `EXECUTION.max_applications = 10`). Every profile gets its own
+directory with its own Chrome user-data-dir, session, job store and log.
+
+Profiles are started while the process, browser and CPU load limits
+allow, and each result is merged into one results file as it arrives.
+"""
+import configparser
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+from collections import namedtuple
+from persistence import atomic_write_json
+
+PROFILE_PREFIX = "profile:"
+
+# Profile keys that need no section prefix
+SHORTHANDS = {
+    'email': 'NAUKRI',
+    'keywords': 'JOB_SEARCH',
+    'locations': 'JOB_SEARCH',
+    'experience': 'JOB_SEARCH',
+    'salary': 'JOB_SEARCH',
+    'job_age_days': 'JOB_SEARCH'
+}
+
+# Per-profile files, relative to the profile's directory
+ISOLATED_PATHS = [
+    ('SESSION', 'user_data_dir', 'chrome'),
+    ('SESSION', 'session_file', 'session.json'),
+    ('STORAGE', 'jobs_db', 'applied_jobs.db'),
+    ('STORAGE', 'selector_stats', 'selector_stats.json'),
+    ('STORAGE', 'search_strategies', 'search_strategies.json'),
+    ('STORAGE', 'checkpoint_file', 'checkpoint.json')
+]
+# Files Main enables by default; they stay off only when the base config sets them to empty
+DEFAULT_ON_PATHS = [
+    ('STORAGE', 'page_cache', 'page_cache.db')
+]
+# Optional files that are only moved into the profile directory when the base config enables them
+OPTIONAL_PATHS = [
+    ('DAEMON', 'queue_db', 'queue.db'),
+    ('TRACING', 'trace_file', 'trace.jsonl'),
+    ('REPLAY', 'record_to', 'recording')
+]
+
+Profile = namedtuple('Profile', ['name', 'overrides'])
+
+
+def load_profiles(config):
+    """Return the [profile:<name>] sections as Profiles with (section, option) -> value overrides"""
+    profiles = []
+    for section in config.sections():
+        if not section.startswith(PROFILE_PREFIX):
+            continue
+        overrides = {}
+        for key, value in config.items(section, raw=True):
+            if key in SHORTHANDS:
+                overrides[(SHORTHANDS[key], key)] = value
+            elif '.' in key:
+                target, option = key.split('.', 1)
+                overrides[(target.upper(), option)] = value
+            else:
+                print(f"Ignoring '{key}' in [{section}]: use SECTION.option for settings without a shorthand")
+        profiles.append(Profile(section[len(PROFILE_PREFIX):].strip(), overrides))
+    return profiles
+
+
+def write_profile_config(base_config_file, profile, profile_dir):
+    """Write the profile's config.ini: base settings, isolated paths, then the profile's overrides"""
+    config = configparser.ConfigParser()
+    config.read(base_config_file)
+    os.makedirs(profile_dir, exist_ok=True)
+
+    # Shared caches stay shared; relative paths would otherwise resolve inside each profile's cwd
+    if config.has_option('STORAGE', 'driver_cache'):
+        config['STORAGE']['driver_cache'] = os.path.abspath(config['STORAGE']['driver_cache'])
+
+    for section, option, file_name in ISOLATED_PATHS + DEFAULT_ON_PATHS + OPTIONAL_PATHS:
+        if (section, option, file_name) in OPTIONAL_PATHS and not config.get(section, option, fallback='').strip():
+            continue
+        if ((section, option, file_name) in DEFAULT_ON_PATHS and config.has_option(section, option)
+                and not config.get(section, option).strip()):
+            continue
+        if not config.has_section(section):
+            config.add_section(section)
+        config[section][option] = os.path.join(profile_dir, file_name)
+
+    for (section, option), value in profile.overrides.items():
+        if section != 'DEFAULT' and not config.has_section(section):
+            config.add_section(section)
+        config[section][option] = value
+
+    path = os.path.join(profile_dir, 'config.ini')
+    with open(path, 'w', encoding='utf-8') as f:
+        config.write(f)
+    return path
+
+
+def browsers_needed(config_file):
+    """Chrome instances a profile run keeps open: search workers plus any standby browsers"""
+    config = configparser.ConfigParser()
+    config.read(config_file)
+    browsers = max(1, config.getint('EXECUTION', 'workers', fallback=1))
+    # Standby browsers are disabled while the profile has a persistent user-data-dir
+    if not config.get('SESSION', 'user_data_dir', fallback='').strip():
+        browsers += max(0, config.getint('BROWSER', 'standby_browsers', fallback=0))
+    return browsers
+
+
+def run_profile(name, config_file, log_file, niceness, daemon, results):
+    """Child process: run one profile and report its outcome on the results queue"""
+    # Let the supervisor's terminate() unwind through close() so Chrome is not orphaned
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+    if niceness:
+        try:
+            os.nice(niceness)
+        except (AttributeError, OSError):
+            pass
+    log = open(log_file, 'a', encoding='utf-8', buffering=1)
+    sys.stdout = sys.stderr = log
+
+    result = {'profile': name, 'status': 'failed', 'applied_count': 0, 'applied': [], 'started': time.time()}
+    try:
+        from Main import NaukriAutoApply
+        from daemon import ApplyDaemon
+
+        automator = NaukriAutoApply(config_file)
+        if daemon:
+            ApplyDaemon(automator).run()
+        else:
+            automator.run()
+        scheduler = automator.scheduler
+        result.update(
+            status='ok' if scheduler else 'login_failed',
+            applied_count=scheduler.applied_count if scheduler else 0,
+            applied=scheduler.results if scheduler else [],
+            browser_restarts=automator.browser_restarts,
+            counters=dict(automator.tracer.counters)
+        )
+    except BaseException as e:
+        result['error'] = f"{type(e).__name__}: {str(e)}"
+        print(f"Profile run failed: {result['error']}")
+    finally:
+        result['elapsed'] = time.time() - result['started']
+        results.put(result)
+        log.flush()
+
+
+class ProfileSupervisor:
+    """Starts profile processes within the process, browser and CPU limits and merges their results"""
+
+    def __init__(self, profiles, base_config='config.ini', profiles_dir='profiles', max_processes=4,
+                 max_browsers=8, max_load_per_cpu=0.8, niceness=5, start_interval=5, max_runtime=0,
+                 results_file='profile_results.json', daemon=False):
+        self.profiles = profiles
+        self.base_config = base_config
+        self.profiles_dir = profiles_dir
+        self.max_processes = max(1, max_processes)
+        self.max_browsers = max(1, max_browsers)
+        self.max_load_per_cpu = max_load_per_cpu
+        self.niceness = niceness
+        self.start_interval = start_interval
+        self.max_runtime = max_runtime
+        self.results_file = results_file
+        self.daemon = daemon
+        self.context = multiprocessing.get_context('spawn')
+        self.results_queue = self.context.Queue()
+        self.running = {}
+        self.results = {}
+        self.last_start = 0.0
+
+    @classmethod
+    def from_file(cls, path, daemon=False):
+        """Build a supervisor from profiles.ini"""
+        config = configparser.ConfigParser()
+        config.read(path)
+        profiles = load_profiles(config)
+        return cls(
+            profiles,
+            base_config=config.get('SUPERVISOR', 'base_config', fallback='config.ini'),
+            profiles_dir=config.get('SUPERVISOR', 'profiles_dir', fallback='profiles'),
+            max_processes=config.getint('SUPERVISOR', 'max_processes', fallback=4),
+            max_browsers=config.getint('SUPERVISOR', 'max_browsers', fallback=8),
+            max_load_per_cpu=config.getfloat('SUPERVISOR', 'max_load_per_cpu', fallback=0.8),
+            niceness=config.getint('SUPERVISOR', 'niceness', fallback=5),
+            start_interval=config.getfloat('SUPERVISOR', 'start_interval_seconds', fallback=5),
+            max_runtime=config.getfloat('SUPERVISOR', 'max_runtime_minutes', fallback=0) * 60,
+            results_file=config.get('SUPERVISOR', 'results_file', fallback='profile_results.json'),
+            daemon=daemon
+        )
+
+    def browsers_in_use(self):
+        return sum(entry['browsers'] for entry in self.running.values())
+
+    def cpu_available(self):
+        """Check the 1-minute load average against the per-CPU limit"""
+        if not self.max_load_per_cpu:
+            return True
+        try:
+            load = os.getloadavg()[0]
+        except (AttributeError, OSError):
+            return True
+        return load / (os.cpu_count() or 1) < self.max_load_per_cpu
+
+    def can_start(self, browsers):
+        """Check every limit; an idle supervisor always starts one profile so oversized ones still run"""
+        if not self.running:
+            return True
+        return (len(self.running) < self.max_processes
+                and self.browsers_in_use() + browsers <= self.max_browsers
+                and time.time() - self.last_start >= self.start_interval
+                and self.cpu_available())
+
+    def start(self, profile, config_file, browsers):
+        profile_dir = os.path.dirname(config_file)
+        process = self.context.Process(
+            target=run_profile,
+            args=(profile.name, config_file, os.path.join(profile_dir, 'run.log'), self.niceness, self.daemon,
+                  self.results_queue),
+            name=f"profile-{profile.name}"
+        )
+        process.start()
+        self.running[profile.name] = {'process': process, 'browsers': browsers, 'started': time.time()}
+        self.last_start = time.time()
+        print(f"Started profile {profile.name} (pid {process.pid}, {browsers} browser(s); "
+              f"{len(self.running)} running, {self.browsers_in_use()} browsers)")
+
+    def collect(self, timeout):
+        """Take finished profile results off the queue"""
+        try:
+            while True:
+                result = self.results_queue.get(timeout=timeout)
+                self.record(result)
+                timeout = 0
+        except queue.Empty:
+            pass
+
+    def record(self, result):
+        self.results[result['profile']] = result
+        print(f"Profile {result['profile']}: {result['status']}, {result['applied_count']} applications "
+              f"in {result.get('elapsed', 0):.0f}s")
+        self.save()
+
+    def reap(self):
+        """Forget exited processes and stop any that ran past max_runtime"""
+        for name, entry in list(self.running.items()):
+            process = entry['process']
+            if process.is_alive():
+                if self.max_runtime and time.time() - entry['started'] > self.max_runtime:
+                    print(f"Profile {name} exceeded {self.max_runtime / 60:.0f} minutes, stopping it")
+                    process.terminate()
+                    process.join(30)
+                    self.collect(timeout=1)
+                    if name in self.results:
+                        self.results[name]['status'] = 'timeout'
+                        self.save()
+                continue
+            process.join()
+            self.collect(timeout=0)
+            if name not in self.results:
+                self.record({'profile': name, 'status': 'crashed', 'applied_count': 0, 'applied': [],
+                             'error': f"exit code {process.exitcode}", 'elapsed': time.time() - entry['started']})
+            del self.running[name]
+
+    def save(self):
+        """Write the merged results of every finished profile"""
+        results = list(self.results.values())
+        atomic_write_json(self.results_file, {
+            'updated': time.time(),
+            'totals': {
+                'profiles': len(results),
+                'ok': sum(result['status'] == 'ok' for result in results),
+                'applications': sum(result['applied_count'] for result in results)
+            },
+            'profiles': self.results
+        })
+
+    def run(self):
+        """Run every profile to completion within the limits"""
+        if not self.profiles:
+            print("No [profile:<name>] sections found")
+            return
+        pending = []
+        for profile in self.profiles:
+            config_file = write_profile_config(self.base_config, profile,
+                                               os.path.abspath(os.path.join(self.profiles_dir, profile.name)))
+            pending.append((profile, config_file, browsers_needed(config_file)))
+        print(f"Running {len(pending)} profiles: up to {self.max_processes} processes and {self.max_browsers} browsers")
+
+        try:
+            while pending or self.running:
+                while pending and self.can_start(pending[0][2]):
+                    self.start(*pending.pop(0))
+                self.collect(timeout=1)
+                self.reap()
+        except KeyboardInterrupt:
+            print("Stopping profiles...")
+            for entry in self.running.values():
+                entry['process'].terminate()
+            for entry in self.running.values():
+                entry['process'].join(30)
+            self.collect(timeout=1)
+            self.save()
+        self.print_summary()
+
+    def print_summary(self):
+        """Print one line per profile and the totals"""
+        if not self.results:
+            return
+        print(f"\n{'profile':<24}{'status':<14}{'applied':>9}{'time(s)':>10}")
+        for name, result in sorted(self.results.items()):
+            print(f"{name:<24}{result['status']:<14}{result['applied_count']:>9}{result.get('elapsed', 0):>10.0f}")
+        total = sum(result['applied_count'] for result in self.results.values())
+        print(f"Total applications across {len(self.results)} profiles: {total} (results in {self.results_file})")
@@ -0,0 +1,19 @@
+import pytest
+
+from scoring import parse_posted_days
+
+
+@pytest.mark.parametrize("label, days", [
+    ("Just Now", 0.0),
+    ("Today", 0.0),
+    ("Few Hours Ago", 0.0),
+    ("3 Days Ago", 3),
+    ("30+ Days Ago", 30),
+])
+def test_parse_posted_days(label, days):
+    assert parse_posted_days(label) == days
+
+
+@pytest.mark.parametrize("label", ["Unknown", "known", "", None])
+def test_parse_posted_days_rejects_non_dates(label):
+    assert parse_posted_days(label) is None
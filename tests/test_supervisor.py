@@ -0,0 +1,31 @@
+import configparser
+
+from supervisor import Profile, write_profile_config
+
+
+def read_config(path):
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+def test_page_cache_isolated_without_storage_section(tmp_path):
+    base = tmp_path / "config.ini"
+    base.write_text("[NAUKRI]\nemail = base@example.com\n\n[JOB_SEARCH]\nkeywords = python\n")
+
+    paths = []
+    for name in ("alice", "bob"):
+        profile_dir = tmp_path / "profiles" / name
+        config = read_config(write_profile_config(str(base), Profile(name, {}), str(profile_dir)))
+        paths.append(config.get('STORAGE', 'page_cache'))
+        assert paths[-1] == str(profile_dir / "page_cache.db")
+
+    assert paths[0] != paths[1]
+
+
+def test_disabled_page_cache_stays_disabled(tmp_path):
+    base = tmp_path / "config.ini"
+    base.write_text("[STORAGE]\npage_cache =\n")
+
+    config = read_config(write_profile_config(str(base), Profile("alice", {}), str(tmp_path / "alice")))
+    assert config.get('STORAGE', 'page_cache') == ''
@@ -0,0 +1,247 @@
+"""Lightweight structured tracing for the automation.
+
+Spans are recorded with their duration, category and thread and can be
+exported as JSON lines or as a Chrome trace-event file (open it in
+chrome://tracing or https://ui.perfetto.dev). A summary table is printed
+at the end of a run. Long-running processes call flush() periodically so
+spans are written out and only their running totals stay in memory.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+STAGE = "stage"
+WAIT = "wait"
+WEBDRIVER = "webdriver"
+
+
+class Timing:
+    """Running count, total and maximum of a series of durations"""
+
+    def __init__(self, count=0, total=0.0, maximum=0.0):
+        self.count = count
+        self.total = total
+        self.max = maximum
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def merge(self, other):
+        """Fold in another series, e.g. a worker's"""
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def copy(self):
+        return Timing(self.count, self.total, self.max)
+
+
+def summary_key(event):
+    """Group key of a span in the summary; WebDriver commands are summed into one row"""
+    return (event['name'], event['cat']) if event['cat'] != WEBDRIVER else ('(all commands)', WEBDRIVER)
+
+
+class Tracer:
+    """Collects timing spans and counters from every worker of a run"""
+
+    def __init__(self, trace_file=None, trace_format="jsonl", enabled=True):
+        self.enabled = enabled
+        self.trace_file = trace_file
+        self.trace_format = trace_format
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.events = []
+        # Totals of spans already flushed, for the summary
+        self.totals = {}
+        self.threads = set()
+        self.chunks = 0
+        self.counters = Counter()
+        self.started = time.perf_counter()
+        self.epoch = time.time()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a tracer from the [TRACING] section of config.ini"""
+        return cls(
+            trace_file=config.get('TRACING', 'trace_file', fallback='').strip() or None,
+            trace_format=config.get('TRACING', 'format', fallback='jsonl').strip().lower(),
+            enabled=config.getboolean('TRACING', 'enabled', fallback=True)
+        )
+
+    def _stack(self):
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name, category=STAGE, **args):
+        """Time the enclosed block as one span"""
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            if error:
+                args['error'] = error
+            self.add_span(name, category, start, time.perf_counter() - start, parent=parent, **args)
+
+    def add_span(self, name, category, start, duration, parent=None, **args):
+        """Record a span measured elsewhere (start is a perf_counter value)"""
+        if not self.enabled:
+            return
+        if parent is None:
+            stack = self._stack()
+            parent = stack[-1] if stack else None
+        event = {
+            'name': name,
+            'cat': category,
+            'start': start - self.started,
+            'dur': duration,
+            'thread': threading.current_thread().name,
+            'parent': parent
+        }
+        if args:
+            event['args'] = args
+        with self.lock:
+            self.events.append(event)
+
+    def count(self, name, amount=1):
+        """Increment a named counter (e.g. selector hits and misses)"""
+        if self.enabled:
+            with self.lock:
+                self.counters[name] += amount
+
+    def instrument_driver(self, driver):
+        """Record every WebDriver command issued through this driver as a span"""
+        if not self.enabled or getattr(driver, '_traced', False):
+            return
+        execute = driver.execute
+        tracer = self
+
+        def traced_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                tracer.add_span(driver_command, WEBDRIVER, start, time.perf_counter() - start)
+
+        driver.execute = traced_execute
+        driver._traced = True
+
+    def _fold(self, events, totals, threads):
+        for event in events:
+            totals.setdefault(summary_key(event), Timing()).add(event['dur'])
+            threads.add(event['thread'])
+
+    def flush(self, final=False):
+        """Write the spans recorded since the last flush to trace_file and keep only their totals"""
+        if not self.enabled:
+            return
+        with self.lock:
+            events, self.events = self.events, []
+            self._fold(events, self.totals, self.threads)
+            counters = dict(self.counters)
+        if self.trace_file and (events or (final and not self.chunks)):
+            self._write(events, counters)
+
+    def _write(self, events, counters):
+        directory = os.path.dirname(os.path.abspath(self.trace_file))
+        os.makedirs(directory, exist_ok=True)
+        if self.trace_format == 'chrome':
+            # A trace-event file is one JSON document, so later flushes go to trace.2.json, trace.3.json, ...
+            root, extension = os.path.splitext(self.trace_file)
+            path = self.trace_file if not self.chunks else f"{root}.{self.chunks + 1}{extension}"
+            threads = {}
+            trace_events = []
+            for event in events:
+                tid = threads.setdefault(event['thread'], len(threads) + 1)
+                trace_events.append({
+                    'name': event['name'],
+                    'cat': event['cat'],
+                    'ph': 'X',
+                    'ts': round(event['start'] * 1e6),
+                    'dur': round(event['dur'] * 1e6),
+                    'pid': os.getpid(),
+                    'tid': tid,
+                    'args': event.get('args', {})
+                })
+            for thread_name, tid in threads.items():
+                trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                                     'args': {'name': thread_name}})
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': trace_events, 'otherData': {'counters': counters}}, f)
+        else:
+            with open(self.trace_file, 'a' if self.chunks else 'w', encoding='utf-8') as f:
+                for event in events:
+                    event = dict(event, ts=self.epoch + event['start'])
+                    f.write(json.dumps(event) + '\n')
+        self.chunks += 1
+
+    def export(self):
+        """Write the remaining spans and the counters to trace_file"""
+        if not self.enabled or not self.trace_file:
+            return
+        self.flush(final=True)
+        if self.trace_format != 'chrome':
+            with open(self.trace_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'name': 'counters', 'cat': 'summary', 'args': dict(self.counters)}) + '\n')
+        print(f"Trace written to {self.trace_file}")
+
+    def print_summary(self):
+        """Print per-stage timings, WebDriver command totals and wait vs useful time"""
+        if not self.enabled:
+            return
+        with self.lock:
+            totals = {key: timing.copy() for key, timing in self.totals.items()}
+            threads = set(self.threads)
+            self._fold(self.events, totals, threads)
+            counters = dict(self.counters)
+        wall_time = time.perf_counter() - self.started
+
+        print("\nTrace summary:")
+        print(f"{'span':<28}{'category':<11}{'count':>7}{'total(s)':>10}{'avg(s)':>9}{'max(s)':>9}")
+        for (name, category), timing in sorted(totals.items(), key=lambda item: -item[1].total):
+            print(f"{name[:27]:<28}{category:<11}{timing.count:>7}{timing.total:>10.2f}"
+                  f"{timing.total / timing.count:>9.3f}{timing.max:>9.3f}")
+
+        # Time spent inside condition waits versus everything else, summed over worker threads
+        wait_time = sum(timing.total for (_, category), timing in totals.items() if category == WAIT)
+        thread_count = len(threads) or 1
+        busy_time = wall_time * thread_count
+        print(f"\nWall time {wall_time:.1f}s across {thread_count} thread(s): "
+              f"waiting {wait_time:.1f}s, useful {max(0.0, busy_time - wait_time):.1f}s")
+        if counters:
+            print("Counters: " + ", ".join(f"{name}={value}" for name, value in sorted(counters.items())))
+
+
+def traced(name=None, category=STAGE):
+    """Decorator recording each call of a NaukriAutoApply method as a span"""
+    def decorator(method):
+        span_name = name or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = getattr(self, 'tracer', None)
+            if tracer is None:
+                return method(self, *args, **kwargs)
+            with tracer.span(span_name, category):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
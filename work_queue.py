@@ -0,0 +1,113 @@
+import sqlite3
+import threading
+import time
+
+PENDING = "pending"
+FAILED = "failed"
+
+
+class WorkQueue:
+    """Persistent queue of discovered jobs waiting for an application attempt"""
+
+    def __init__(self, path="applied_jobs.db"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS work_queue (
+                job_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                title TEXT,
+                company TEXT,
+                keyword TEXT,
+                location TEXT,
+                experience TEXT,
+                salary TEXT,
+                posted TEXT,
+                score REAL NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                enqueued_at REAL NOT NULL,
+                available_at REAL NOT NULL,
+                finished_at REAL
+            )
+        """)
+        # Queues created before the listing card's other fields were kept
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(work_queue)")}
+        for column in ('experience', 'salary', 'posted'):
+            if column not in columns:
+                self.connection.execute(f"ALTER TABLE work_queue ADD COLUMN {column} TEXT")
+        self.connection.commit()
+
+    def enqueue(self, key, url, title="", company="", keyword="", location="", score=0.0,
+                experience="", salary="", posted=""):
+        """Add a job unless it is already queued or was handled before; returns True if added"""
+        now = time.time()
+        with self.lock:
+            cursor = self.connection.execute("""
+                INSERT OR IGNORE INTO work_queue
+                    (job_key, url, title, company, keyword, location, experience, salary, posted, score, status,
+                     enqueued_at, available_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, url, title, company, keyword, location, experience, salary, posted, score, PENDING, now, now))
+            self.connection.commit()
+            return cursor.rowcount > 0
+
+    def next_ready(self):
+        """Return the best-scored pending job that is due, as a dict, or None"""
+        with self.lock:
+            row = self.connection.execute("""
+                SELECT job_key, url, title, company, keyword, location, experience, salary, posted, score, attempts
+                FROM work_queue
+                WHERE status = ? AND available_at <= ?
+                ORDER BY score DESC, enqueued_at
+                LIMIT 1
+            """, (PENDING, time.time())).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('key', 'url', 'title', 'company', 'keyword', 'location', 'experience', 'salary', 'posted',
+                         'score', 'attempts'), row))
+
+    def seconds_until_ready(self):
+        """Seconds until the next pending job is due, or None if the queue is empty"""
+        with self.lock:
+            (available_at,) = self.connection.execute(
+                "SELECT MIN(available_at) FROM work_queue WHERE status = ?", (PENDING,)
+            ).fetchone()
+        if available_at is None:
+            return None
+        return max(0.0, available_at - time.time())
+
+    def pending_count(self):
+        with self.lock:
+            (count,) = self.connection.execute(
+                "SELECT COUNT(*) FROM work_queue WHERE status = ?", (PENDING,)
+            ).fetchone()
+        return count
+
+    def complete(self, key, status):
+        """Finish a job with a final status (e.g. 'applied' or 'skipped')"""
+        with self.lock:
+            self.connection.execute(
+                "UPDATE work_queue SET status = ?, finished_at = ? WHERE job_key = ?",
+                (status, time.time(), key)
+            )
+            self.connection.commit()
+
+    def retry(self, key, delay, max_attempts=3):
+        """Put a failed job back after `delay` seconds, or give up after max_attempts"""
+        now = time.time()
+        with self.lock:
+            self.connection.execute("""
+                UPDATE work_queue SET
+                    attempts = attempts + 1,
+                    available_at = ?,
+                    status = CASE WHEN attempts + 1 >= ? THEN ? ELSE status END,
+                    finished_at = CASE WHEN attempts + 1 >= ? THEN ? ELSE finished_at END
+                WHERE job_key = ?
+            """, (now + delay, max_attempts, FAILED, max_attempts, now, key))
+            self.connection.commit()
+
+    def close(self):
+        with self.lock:
+            self.connection.close()